@@ -0,0 +1,91 @@
+"""
+🗞️ Resumen de registros para el admin - DevPool Blockchain CLM
+En modo "digest" los nuevos registros se acumulan y se envían como un
+único email por ventana de tiempo o cada N registros. El primer registro
+del día puede notificarse al momento.
+"""
+
+import threading
+import time
+from datetime import date
+
+
+IMMEDIATE = 'immediate'
+DIGEST = 'digest'
+
+
+class AdminDigest:
+    """Agrupa las notificaciones de nuevos registros"""
+
+    def __init__(self, send_single, send_digest, mode=IMMEDIATE, window_seconds=300,
+                 max_events=20, immediate_first_of_day=True):
+        # send_single(user_data) y send_digest(events) encolan el email correspondiente
+        self.send_single = send_single
+        self.send_digest = send_digest
+        self.mode = mode if mode in (IMMEDIATE, DIGEST) else IMMEDIATE
+        self.window_seconds = window_seconds
+        self.max_events = max(1, int(max_events))
+        self.immediate_first_of_day = immediate_first_of_day
+
+        self._buffer = []
+        self._timer = None
+        self._last_day = None
+        self._lock = threading.Lock()
+        self._counters = {'events': 0, 'immediate': 0, 'digests': 0, 'coalesced': 0}
+
+    def add(self, user_data):
+        """Registra un nuevo desarrollador y decide si notificar ya o acumular"""
+        flush_now = False
+        send_now = False
+        with self._lock:
+            self._counters['events'] += 1
+            today = date.today()
+            first_of_day = self._last_day != today
+            self._last_day = today
+
+            if self.mode == IMMEDIATE or (first_of_day and self.immediate_first_of_day):
+                self._counters['immediate'] += 1
+                send_now = True
+            else:
+                self._buffer.append(user_data)
+                if len(self._buffer) >= self.max_events:
+                    flush_now = True
+                elif self._timer is None:
+                    self._timer = threading.Timer(self.window_seconds, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if send_now:
+            self.send_single(user_data)
+        elif flush_now:
+            self.flush()
+
+    def flush(self):
+        """Envía lo acumulado como un único email de resumen"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            events, self._buffer = self._buffer, []
+            if not events:
+                return 0
+            self._counters['digests'] += 1
+            # Emails que nos ahorramos frente a una notificación por registro
+            self._counters['coalesced'] += len(events) - 1
+
+        print(f"🗞️ [DIGEST] Enviando resumen con {len(events)} registros")
+        try:
+            self.send_digest(events)
+        except Exception as e:
+            print(f"❌ [DIGEST] Error encolando el resumen: {type(e).__name__}: {e}")
+        return len(events)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'window_seconds': self.window_seconds,
+                'max_events': self.max_events,
+                'buffered': len(self._buffer),
+                **self._counters,
+            }
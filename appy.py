@@ -1,4 +1,5 @@
-from flask import Flask, request, jsonify, render_template, send_file, redirect, url_for, session
+from flask import (Flask, Response, request, jsonify, render_template, redirect, url_for, session,
+                   stream_with_context)
 from datetime import datetime, timedelta
 import re
 import json
@@ -6,15 +7,40 @@ import os
 import uuid
 import secrets
 import time
+import atexit
+import tempfile
+import threading
 from collections import defaultdict
 from functools import wraps
 from werkzeug.security import generate_password_hash, check_password_hash
 from dotenv import load_dotenv
 from supabase import create_client, Client
 import smtplib
-import ssl
+from email import policy
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email_outbox import EmailOutbox, OutboxFullError
+from email_spool import EmailSpool
+from smtp_pool import SMTPConnectionPool
+from smtp_health import SMTPHealthMonitor
+from email_templates import CachedEmailTemplate, html_to_text
+from admin_digest import AdminDigest, DIGEST
+from broadcast import BroadcastMailer, BroadcastStore, TokenBucket
+from email_transport import create_transport
+from circuit_breaker import CircuitBreaker, CircuitOpenError, OPEN
+from database_guard import DatabaseConnection, DatabaseUnavailableError
+from developer_counter import CachedCounter
+from developer_pages import DEFAULT_PAGE_SIZE, InvalidCursorError, format_created_at, parse_filters, row_matches
+from developer_export import (COMPRESSIONS, DEFAULT_EXPORT_PAGE_SIZE, FORMATS as EXPORT_FORMATS, export_filename,
+                              export_mimetype, export_stream, iter_export_pages, parse_columns, zstd_available)
+from repository import REGISTRATION_UPDATE_FIELDS, DuplicateEmailError, create_repositories
+from email_identity import EmailIndex, normalize_email
+from skill_tags import normalize_skills
+from idempotency import IN_PROGRESS, MISMATCH, REPLAY, IdempotencyStore, request_fingerprint
+from supabase_http import SupabaseHTTPTransport, TunedPostgrestClient
+from query_cache import QueryCache
+from developer_import import FORMATS as IMPORT_FORMATS, MERGE, SKIP, DeveloperImporter, iter_records
+from registration_batcher import DUPLICATE, INSERTED, QUEUED, RegistrationBatcher, RegistrationJournal
 
 # Cargar variables de entorno
 load_dotenv()
@@ -86,16 +112,22 @@ try:
     app.config['MAIL_USERNAME'] = os.environ.get('MAIL_USERNAME')
     app.config['MAIL_PASSWORD'] = os.environ.get('MAIL_PASSWORD')
     app.config['MAIL_DEFAULT_SENDER'] = os.environ.get('MAIL_DEFAULT_SENDER', 'contacto@clmblockchain.org')
+    # Transporte: smtp (por defecto), file (mbox/maildir local) o memory (pruebas de carga)
+    app.config['EMAIL_TRANSPORT'] = os.environ.get('EMAIL_TRANSPORT', 'smtp').lower()
+    # Un servidor SMTP local de pruebas no necesita credenciales
+    app.config['MAIL_REQUIRE_AUTH'] = os.environ.get('MAIL_REQUIRE_AUTH', 'True').lower() == 'true'
     
     # Logging detallado de configuración
     print("📧 [EMAIL CONFIG] Configuración SMTP:")
+    print(f"📧 [EMAIL CONFIG] Transporte: {app.config['EMAIL_TRANSPORT']}")
     print(f"📧 [EMAIL CONFIG] Servidor: {app.config['MAIL_SERVER']}:{app.config['MAIL_PORT']}")
     print(f"📧 [EMAIL CONFIG] Usuario: {app.config['MAIL_USERNAME']}")
     print(f"📧 [EMAIL CONFIG] Password configurado: {'SÍ' if app.config['MAIL_PASSWORD'] else 'NO'}")
     print(f"📧 [EMAIL CONFIG] TLS: {app.config['MAIL_USE_TLS']}, SSL: {app.config['MAIL_USE_SSL']}")
     
-    # Configurar email solo si tiene credenciales
-    if app.config.get('MAIL_USERNAME') and app.config.get('MAIL_PASSWORD'):
+    # Configurar email solo si tiene credenciales (o si no hacen falta)
+    if (app.config.get('MAIL_USERNAME') and app.config.get('MAIL_PASSWORD')) \
+            or app.config['EMAIL_TRANSPORT'] != 'smtp' or not app.config['MAIL_REQUIRE_AUTH']:
         mail = True
         print("✅ Sistema de email configurado correctamente")
     else:
@@ -106,6 +138,61 @@ except Exception as e:
     mail = None
     print(f"❌ Error inicializando sistema de email: {e}")
 
+# 📮 Pool de sesiones SMTP compartido (SMTP2GO limita las conexiones simultáneas)
+smtp_pool = SMTPConnectionPool(
+    host=app.config['MAIL_SERVER'],
+    port=app.config['MAIL_PORT'],
+    username=app.config['MAIL_USERNAME'],
+    password=app.config['MAIL_PASSWORD'],
+    use_tls=app.config['MAIL_USE_TLS'],
+    use_ssl=app.config['MAIL_USE_SSL'],
+    max_connections=int(os.environ.get('SMTP_POOL_MAX_CONNECTIONS', 3)),
+    max_messages_per_connection=int(os.environ.get('SMTP_POOL_MAX_MESSAGES', 100)),
+    idle_timeout=int(os.environ.get('SMTP_POOL_IDLE_TIMEOUT', 60)),
+    timeout=60,
+)
+
+# 🚚 Transporte de email intercambiable (smtp / file / memory)
+email_transport = create_transport(
+    app.config['EMAIL_TRANSPORT'],
+    pool=smtp_pool,
+    require_auth=app.config['MAIL_REQUIRE_AUTH'],
+    path=os.environ.get('EMAIL_FILE_PATH'),
+    file_format=os.environ.get('EMAIL_FILE_FORMAT', 'mbox'),
+)
+
+def email_configured():
+    """Indica si el transporte de email activo puede enviar"""
+    return email_transport.ready()
+
+# 🩺 Salud SMTP cacheada + circuit breaker: si el proveedor cae se falla rápido
+smtp_breaker = CircuitBreaker(
+    'smtp',
+    failure_threshold=int(os.environ.get('SMTP_BREAKER_FAILURES', 3)),
+    recovery_timeout=int(os.environ.get('SMTP_BREAKER_RECOVERY', 30)),
+)
+smtp_health = SMTPHealthMonitor(
+    probe=email_transport.check,
+    breaker=smtp_breaker,
+    ttl=int(os.environ.get('SMTP_HEALTH_TTL', 60)),
+)
+
+# 📦 Spool duradero: cada email se guarda en disco antes de intentar enviarlo
+email_spool = EmailSpool(
+    path=os.environ.get('EMAIL_SPOOL_PATH') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'email_spool.db'),
+    max_attempts=int(os.environ.get('EMAIL_RETRY_MAX_ATTEMPTS', 6)),
+    base_delay=int(os.environ.get('EMAIL_RETRY_BASE_DELAY', 30)),
+    max_delay=int(os.environ.get('EMAIL_RETRY_MAX_DELAY', 3600)),
+)
+
+# 📬 Outbox: los emails se envían en segundo plano, /submit no espera al SMTP
+email_outbox = EmailOutbox(
+    workers=int(os.environ.get('EMAIL_OUTBOX_WORKERS', 2)),
+    max_queue=int(os.environ.get('EMAIL_OUTBOX_MAX_QUEUE', 500)),
+    context_factory=app.app_context,
+    spool=email_spool,
+)
+
 # ────────────────────────────────────────────────
 # Configuración de Supabase
 class SupabaseConnector:
@@ -118,52 +205,236 @@ class SupabaseConnector:
         
         self.client = create_client(self.url, self.key)
         
+        # Un transporte HTTP por worker, con keep-alive, límites y timeouts propios
+        self.http = SupabaseHTTPTransport(
+            max_connections=int(os.environ.get('SUPABASE_HTTP_MAX_CONNECTIONS', 10)),
+            max_keepalive_connections=int(os.environ.get('SUPABASE_HTTP_MAX_KEEPALIVE', 5)),
+            keepalive_expiry=float(os.environ.get('SUPABASE_HTTP_KEEPALIVE_EXPIRY', 60)),
+            http2=os.environ.get('SUPABASE_HTTP2', 'False').lower() == 'true',
+            connect_timeout=float(os.environ.get('SUPABASE_TIMEOUT_CONNECT', 5)),
+            read_timeout=float(os.environ.get('SUPABASE_TIMEOUT_READ', 10)),
+            write_timeout=float(os.environ.get('SUPABASE_TIMEOUT_WRITE', 15)),
+            pool_timeout=float(os.environ.get('SUPABASE_TIMEOUT_POOL', 5)),
+        )
+        self.rest = TunedPostgrestClient(
+            self.client.rest_url,
+            headers=dict(self.client.options.headers),
+            schema=self.client.options.schema,
+            timeout=float(os.environ.get('SUPABASE_TIMEOUT_WRITE', 15)),
+            transport=self.http,
+        )
+        
     def get_table(self, table_name):
-        return self.client.table(table_name)
+        return self.rest.from_(table_name)
+    
+    table = get_table
+    
+    def rpc(self, function_name, params=None):
+        """Funciones SQL (schema.sql) por el mismo cliente HTTP"""
+        return self.rest.rpc(function_name, params or {})
+    
+    def stats(self):
+        return self.http.stats()
 
-try:
-    supabase_connector = SupabaseConnector()
-    developers_table = supabase_connector.get_table('developers')
-    admin_table = supabase_connector.get_table('admin')
-    print("✅ Conexión a Supabase establecida")
-except Exception as e:
-    print(f"❌ Error conectando a Supabase: {e}")
-    developers_table = None
-    admin_table = None
+# 🗄️ Backend de datos: supabase (producción) o sqlite (base local para pruebas de carga)
+DATABASE_BACKEND = os.environ.get('DATABASE_BACKEND', 'supabase').lower()
+supabase_connector = None
+
+def connect_database():
+    """Crea los repositorios del backend elegido (la primera vez que se usan y tras un fallo)"""
+    global supabase_connector
+    try:
+        if DATABASE_BACKEND == 'sqlite':
+            sqlite_path = os.environ.get('SQLITE_DATABASE_PATH', 'devpool_local.db')
+            repositories = create_repositories('sqlite', sqlite_path=sqlite_path)
+            print(f"✅ Base de datos local SQLite: {sqlite_path}")
+        else:
+            supabase_connector = SupabaseConnector()
+            repositories = create_repositories('supabase', supabase_client=supabase_connector)
+            print("✅ Conexión a Supabase establecida")
+    except Exception as e:
+        print(f"❌ Error conectando a la base de datos ({DATABASE_BACKEND}): {e}")
+        raise
+    return repositories
+
+# ⚡ Circuit breaker de la base de datos: si Supabase cae o va lento se falla rápido
+# y la portada y el panel sirven el último contador y la última página (desactualizados)
+database_breaker = CircuitBreaker(
+    'database',
+    failure_threshold=int(os.environ.get('DATABASE_BREAKER_FAILURES', 5)),
+    recovery_timeout=int(os.environ.get('DATABASE_BREAKER_RECOVERY', 15)),
+)
+database = DatabaseConnection(
+    connect_database,
+    breaker=database_breaker,
+    ignore=(DuplicateEmailError, ValueError),
+    slow_call_seconds=float(os.environ.get('DATABASE_SLOW_CALL_SECONDS', 5)) or None,
+    # Lotes de la importación, del diario de registros y borrados masivos: tardan por volumen
+    slow_call_exempt=('insert_many', 'upsert_many', 'delete_many'),
+    name=DATABASE_BACKEND,
+)
+developer_repo = database.developers
+admin_repo = database.admins
+
+# ────────────────────────────────────────────────
+# 🔢 CONTADOR DE DESARROLLADORES (portada)
+# exact: COUNT(*) real · planned/estimated: estimación de Postgres, más barata en tablas grandes
+DEVELOPER_COUNT_MODE = os.environ.get('DEVELOPER_COUNT_MODE', 'exact').lower()
+
+def fetch_developer_count():
+    """Cuenta registrados sin descargar filas (HEAD + Content-Range en Supabase)"""
+    return developer_repo.count(DEVELOPER_COUNT_MODE)
+
+developer_counter = CachedCounter(
+    fetch_developer_count,
+    ttl=int(os.environ.get('DEVELOPER_COUNT_TTL', 30)),
+    stale_ttl=int(os.environ.get('DEVELOPER_COUNT_STALE_TTL', 600)),
+    name='developers',
+)
+
+# ────────────────────────────────────────────────
+# 🗃️ CACHÉ DE CONSULTAS DE DESARROLLADORES
+# Páginas del panel, indexadas por forma de consulta e invalidadas
+# con precisión en cada alta/baja. El TTL acota lo que ven otros workers.
+developer_cache = QueryCache(
+    max_entries=int(os.environ.get('DEVELOPER_CACHE_MAX_ENTRIES', 512)),
+    max_bytes=int(float(os.environ.get('DEVELOPER_CACHE_MAX_MB', 8)) * 1024 * 1024),
+    ttl=int(os.environ.get('DEVELOPER_CACHE_TTL', 60)),
+    name='developers',
+)
+
+# 📸 Última página correcta de cada consulta del panel: si la base de datos cae
+# se sirve esta copia marcada como desactualizada en lugar de un panel vacío
+dashboard_snapshots = QueryCache(
+    max_entries=int(os.environ.get('DASHBOARD_SNAPSHOT_MAX_ENTRIES', 64)),
+    max_bytes=int(float(os.environ.get('DASHBOARD_SNAPSHOT_MAX_MB', 4)) * 1024 * 1024),
+    ttl=int(os.environ.get('DASHBOARD_SNAPSHOT_TTL', 86400)),
+    name='dashboard-snapshots',
+)
+
+def mark_developers_written():
+    """Read-your-writes: esta sesión ignorará resultados cacheados anteriores"""
+    session['developers_written_at'] = time.time()
+
+def developers_read_barrier():
+    return session.get('developers_written_at')
+
+def cached_developer_page(filters, cursor, page_size):
+    """Página del panel (read-through sobre developer_repo.page)"""
+    key = ('page', tuple(sorted(filters.items())), cursor, page_size)
+    
+    def load():
+        rows, next_cursor = developer_repo.page(filters, cursor, page_size)
+        for dev in rows:
+            dev['created_at_local'] = format_created_at(dev.get('created_at'))
+        page = {'rows': rows, 'next_cursor': next_cursor}
+        dashboard_snapshots.set(key, {'page': page, 'saved_at': datetime.now().isoformat()})
+        return page
+    
+    return developer_cache.get_or_load(
+        key, load,
+        tags=lambda page: [f"dev:{dev['id']}" for dev in page['rows']],
+        min_time=developers_read_barrier(),
+    )
+
+# 📤 Filas por consulta al exportar (la memoria de la exportación depende de esto, no de la tabla)
+EXPORT_PAGE_SIZE = int(os.environ.get('EXPORT_PAGE_SIZE', DEFAULT_EXPORT_PAGE_SIZE))
+
+def invalidate_developer_insert(developer):
+    """Un alta solo cambia las primeras páginas cuyos filtros la incluyen (keyset)"""
+    developer_cache.invalidate_where(
+        lambda key: key[0] == 'page' and key[2] is None and row_matches(dict(key[1]), developer)
+    )
+
+# ────────────────────────────────────────────────
+# 📇 DETECCIÓN DE REGISTROS DUPLICADOS
+# Índice único en developers.email_normalized + conjunto en memoria de este worker:
+# un alta nueva va directa al INSERT y un duplicado conocido no consulta la BD.
+# reject: responde 409 · update: actualiza el registro existente en el sitio
+DUPLICATE_REGISTRATION_MODE = os.environ.get('DUPLICATE_REGISTRATION_MODE', 'reject').lower()
+
+email_index = EmailIndex(
+    loader=lambda: developer_repo.iter_email_keys(),
+    refresh_interval=int(os.environ.get('EMAIL_INDEX_REFRESH', 600)),
+    name='developers',
+)
+if developer_repo and os.environ.get('EMAIL_INDEX_ENABLED', 'True').lower() == 'true':
+    email_index.warm()
+
+def update_duplicate_registration(developer):
+    """Registro repetido en modo update: una sola consulta UPDATE por email normalizado"""
+    fields = {field: developer[field] for field in REGISTRATION_UPDATE_FIELDS}
+    updated = developer_repo.update_by_email(developer['email_normalized'], fields)
+    if updated:
+        invalidate_developer_delete(updated['id'])
+        mark_developers_written()
+    return updated
+
+def invalidate_developer_delete(dev_id):
+    """Una baja solo cambia las páginas que contenían a ese desarrollador"""
+    developer_cache.invalidate_tag(f"dev:{dev_id}")
+
+def developers_deleted(deleted):
+    """Actualiza contador y cachés tras borrar filas (lo que devolvió el DELETE)"""
+    if not deleted:
+        return
+    developer_counter.decrement(len(deleted))
+    for dev in deleted:
+        invalidate_developer_delete(dev['id'])
+        email_index.discard(dev.get('email_normalized'))
+    mark_developers_written()
+
+# Borrado masivo desde el panel
+BULK_DELETE_CHUNK_SIZE = int(os.environ.get('BULK_DELETE_CHUNK_SIZE', 100))
+BULK_DELETE_MAX_IDS = int(os.environ.get('BULK_DELETE_MAX_IDS', 1000))
 
 # ────────────────────────────────────────────────
 # FUNCIONES DE EMAIL MEJORADAS CON DEBUGGING AVANZADO
 def test_smtp_connection():
-    """Prueba la conexión SMTP antes de enviar emails"""
+    """Estado SMTP cacheado: solo sondea el servidor si el estado ha caducado"""
+    if not email_configured():
+        print("❌ [SMTP TEST] Credenciales no configuradas")
+        return False
+    
+    smtp_health.start()
+    if smtp_health.is_stale() and smtp_breaker.state != OPEN:
+        print(f"🧪 [SMTP TEST] Estado caducado, sondeando {app.config['MAIL_SERVER']}:{app.config['MAIL_PORT']}")
+        smtp_health.refresh()
+    
+    return smtp_health.is_healthy()
+
+def deliver_email(sender, recipient, raw_message):
+    """Envía un mensaje ya construido por el transporte activo respetando el circuit breaker"""
+    smtp_health.start()
+    if not smtp_breaker.allow():
+        raise CircuitOpenError("SMTP no disponible (circuito abierto)")
+    
     try:
-        print("🧪 [SMTP TEST] Probando conexión SMTP...")
-        
-        if not app.config.get('MAIL_USERNAME') or not app.config.get('MAIL_PASSWORD'):
-            print("❌ [SMTP TEST] Credenciales no configuradas")
-            return False
-        
-        context = ssl.create_default_context()
-        
-        if app.config.get('MAIL_USE_SSL'):
-            # SSL
-            print(f"🔧 [SMTP TEST] Conectando con SSL al puerto {app.config['MAIL_PORT']}")
-            with smtplib.SMTP_SSL(app.config['MAIL_SERVER'], app.config['MAIL_PORT'], 
-                                 context=context, timeout=30) as server:
-                server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-        else:
-            # TLS
-            print(f"🔧 [SMTP TEST] Conectando con TLS al puerto {app.config['MAIL_PORT']}")
-            with smtplib.SMTP(app.config['MAIL_SERVER'], app.config['MAIL_PORT'], timeout=30) as server:
-                if app.config.get('MAIL_USE_TLS'):
-                    server.starttls(context=context)
-                server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-        
-        print("✅ [SMTP TEST] Conexión SMTP exitosa")
-        return True
-        
+        email_transport.send(sender, [recipient], raw_message)
+    except smtplib.SMTPRecipientsRefused:
+        # El proveedor respondió: el problema es el destinatario, no el servicio
+        smtp_health.report_success()
+        raise
     except Exception as e:
-        print(f"❌ [SMTP TEST] Error de conexión: {type(e).__name__}: {str(e)}")
-        return False
+        smtp_health.report_failure(f"{type(e).__name__}: {e}")
+        raise
+    smtp_health.report_success()
+
+# 🧩 Plantillas precompiladas: HTML estático, texto plano y estructura MIME se
+# construyen una vez por proceso; cada envío solo sustituye los campos del usuario
+welcome_template = CachedEmailTemplate(
+    'welcome',
+    render=lambda **context: render_template('emails/welcome_email.html', **context),
+    fields=('user_name', 'user_skills'),
+    subject='Bienvenido al DevPool Blockchain CLM',
+)
+
+admin_notification_template = CachedEmailTemplate(
+    'admin_notification',
+    render=lambda **context: render_template('emails/admin_notification.html', **context),
+    fields=('name', 'email', 'skills', 'experience_years', 'portfolio_url', 'location', 'ip', 'created_at'),
+    subject='Nuevo registro DevPool: {name}',
+)
 
 def send_welcome_email(user_name: str, user_email: str, user_skills: str):
     """Envía email de bienvenida con debugging mejorado"""
@@ -172,55 +443,24 @@ def send_welcome_email(user_name: str, user_email: str, user_skills: str):
         print(f"📧 [WELCOME] Iniciando envío de email de bienvenida a: {user_email}")
         
         # Verificar configuración
-        if not app.config.get('MAIL_USERNAME') or not app.config.get('MAIL_PASSWORD'):
+        if not email_configured():
             print("❌ [WELCOME] Credenciales SMTP no configuradas")
             return False
         
-        # Test de conexión primero
-        if not test_smtp_connection():
-            print("❌ [WELCOME] Test de conexión SMTP falló")
-            return False
-        
-        # Renderizar template
+        # Construir mensaje desde la plantilla cacheada
+        sender = app.config['MAIL_DEFAULT_SENDER']
         try:
-            email_html = render_template('emails/welcome_email.html', 
-                                        user_name=user_name, 
-                                        user_skills=user_skills)
-            print("✅ [WELCOME] Template renderizado correctamente")
+            message = welcome_template.build(sender, user_email,
+                                             user_name=user_name,
+                                             user_skills=user_skills)
         except Exception as template_error:
             print(f"❌ [WELCOME] Error renderizando template: {template_error}")
             return False
         
-        # Crear mensaje
-        message = MIMEMultipart("alternative")
-        message["Subject"] = "Bienvenido al DevPool Blockchain CLM"
-        message["From"] = app.config['MAIL_DEFAULT_SENDER']
-        message["To"] = user_email
-        
-        # Agregar contenido HTML con encoding UTF-8
-        html_part = MIMEText(email_html, "html", "utf-8")
-        message.attach(html_part)
-        
         print(f"📧 [WELCOME] Mensaje creado - Enviando desde {app.config['MAIL_USERNAME']} a {user_email}")
         
-        # Enviar email
-        context = ssl.create_default_context()
-        
-        if app.config.get('MAIL_USE_SSL'):
-            # SSL (puerto 465)
-            print(f"🔧 [WELCOME] Enviando con SSL en puerto {app.config['MAIL_PORT']}")
-            with smtplib.SMTP_SSL(app.config['MAIL_SERVER'], app.config['MAIL_PORT'], 
-                                 context=context, timeout=60) as server:
-                server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-                server.send_message(message)
-        else:
-            # TLS (puerto 587)
-            print(f"🔧 [WELCOME] Enviando con TLS en puerto {app.config['MAIL_PORT']}")
-            with smtplib.SMTP(app.config['MAIL_SERVER'], app.config['MAIL_PORT'], timeout=60) as server:
-                if app.config.get('MAIL_USE_TLS'):
-                    server.starttls(context=context)
-                server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-                server.send_message(message)
+        # Enviar email reutilizando una sesión del pool
+        deliver_email(sender, user_email, message)
             
         print(f"✅ [WELCOME] Email de bienvenida enviado exitosamente a {user_email}")
         return True
@@ -242,59 +482,28 @@ def send_admin_notification(user_data: dict):
             print("❌ [ADMIN] ADMIN_EMAIL no configurado")
             return False
             
-        if not app.config.get('MAIL_USERNAME') or not app.config.get('MAIL_PASSWORD'):
+        if not email_configured():
             print("❌ [ADMIN] Credenciales SMTP no configuradas")
             return False
         
-        # Preparar HTML del email admin
-        admin_html = f'''
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <h2 style="color: #6366f1;">Nuevo Desarrollador Registrado</h2>
-            
-            <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0;">
-                <h3>Información del registro:</h3>
-                <p><strong>Nombre:</strong> {user_data.get("name")}</p>
-                <p><strong>Email:</strong> {user_data.get("email")}</p>
-                <p><strong>Habilidades:</strong> {user_data.get("skills")}</p>
-                <p><strong>Experiencia:</strong> {user_data.get("experience_years")} años</p>
-                <p><strong>Portfolio:</strong> {user_data.get("portfolio_url", "No proporcionado")}</p>
-                <p><strong>Ubicación:</strong> {user_data.get("location", "No proporcionada")}</p>
-                <p><strong>IP:</strong> {user_data.get("ip")}</p>
-                <p><strong>Fecha:</strong> {user_data.get("created_at")}</p>
-            </div>
-            
-            <div style="background: #6366f1; color: white; padding: 15px; border-radius: 10px; text-align: center;">
-                <p style="margin: 0;">DevPool Blockchain CLM - Panel de Administración</p>
-            </div>
-        </div>
-        '''
-            
-        # Crear mensaje
-        message = MIMEMultipart("alternative")
-        message["Subject"] = f"Nuevo registro DevPool: {user_data.get('name')}"
-        message["From"] = app.config['MAIL_DEFAULT_SENDER']
-        message["To"] = admin_email
-        
-        # Agregar contenido HTML
-        html_part = MIMEText(admin_html, "html", "utf-8")
-        message.attach(html_part)
+        # Construir mensaje desde la plantilla cacheada
+        sender = app.config['MAIL_DEFAULT_SENDER']
+        message = admin_notification_template.build(
+            sender, admin_email,
+            name=user_data.get('name'),
+            email=user_data.get('email'),
+            skills=user_data.get('skills'),
+            experience_years=user_data.get('experience_years'),
+            portfolio_url=user_data.get('portfolio_url') or 'No proporcionado',
+            location=user_data.get('location') or 'No proporcionada',
+            ip=user_data.get('ip'),
+            created_at=user_data.get('created_at'),
+        )
         
         print(f"📧 [ADMIN] Enviando notificación desde {app.config['MAIL_USERNAME']} a {admin_email}")
         
-        # Enviar email
-        context = ssl.create_default_context()
-        
-        if app.config.get('MAIL_USE_SSL'):
-            with smtplib.SMTP_SSL(app.config['MAIL_SERVER'], app.config['MAIL_PORT'], 
-                                 context=context, timeout=60) as server:
-                server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-                server.send_message(message)
-        else:
-            with smtplib.SMTP(app.config['MAIL_SERVER'], app.config['MAIL_PORT'], timeout=60) as server:
-                if app.config.get('MAIL_USE_TLS'):
-                    server.starttls(context=context)
-                server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-                server.send_message(message)
+        # Enviar email reutilizando una sesión del pool
+        deliver_email(sender, admin_email, message)
             
         print(f"✅ [ADMIN] Notificación admin enviada exitosamente")
         return True
@@ -303,6 +512,230 @@ def send_admin_notification(user_data: dict):
         print(f"❌ [ADMIN] Error enviando notificación: {type(e).__name__}: {str(e)}")
         return False
 
+def send_admin_digest(developers: list):
+    """Envía al admin un único email con varios registros acumulados"""
+    
+    try:
+        admin_email = os.environ.get('ADMIN_EMAIL')
+        print(f"📧 [DIGEST] Iniciando resumen admin con {len(developers)} registros")
+        
+        if not admin_email:
+            print("❌ [DIGEST] ADMIN_EMAIL no configurado")
+            return False
+            
+        if not email_configured():
+            print("❌ [DIGEST] Credenciales SMTP no configuradas")
+            return False
+        
+        # El resumen se envía como mucho una vez por ventana: basta con Jinja + MIME
+        digest_html = render_template('emails/admin_digest.html', developers=developers)
+        
+        sender = app.config['MAIL_DEFAULT_SENDER']
+        message = MIMEMultipart("alternative")
+        message["Subject"] = f"Resumen DevPool: {len(developers)} nuevos registros"
+        message["From"] = sender
+        message["To"] = admin_email
+        message.attach(MIMEText(html_to_text(digest_html), "plain", "utf-8"))
+        message.attach(MIMEText(digest_html, "html", "utf-8"))
+        
+        deliver_email(sender, admin_email, message.as_bytes(policy=policy.SMTP))
+        
+        print(f"✅ [DIGEST] Resumen admin enviado con {len(developers)} registros")
+        return True
+        
+    except Exception as e:
+        print(f"❌ [DIGEST] Error enviando resumen: {type(e).__name__}: {str(e)}")
+        return False
+
+email_outbox.register('welcome', send_welcome_email)
+email_outbox.register('admin_notification', send_admin_notification)
+email_outbox.register('admin_digest', send_admin_digest)
+# Reintentos del spool desde el arranque: tras un reinicio los pendientes (y los que se
+# reenvían con email_spool_admin.py) salen sin esperar al siguiente registro
+email_outbox.start()
+
+# 🗞️ Notificaciones admin: una por registro (immediate) o agrupadas (digest)
+admin_digest = AdminDigest(
+    send_single=lambda user_data: email_outbox.enqueue('admin_notification', user_data=user_data),
+    send_digest=lambda developers: email_outbox.enqueue('admin_digest', developers=developers),
+    mode=os.environ.get('ADMIN_NOTIFY_MODE', 'immediate').lower(),
+    window_seconds=int(os.environ.get('ADMIN_DIGEST_WINDOW_SECONDS', 300)),
+    max_events=int(os.environ.get('ADMIN_DIGEST_MAX_EVENTS', 20)),
+    immediate_first_of_day=os.environ.get('ADMIN_DIGEST_IMMEDIATE_FIRST', 'True').lower() == 'true',
+)
+if admin_digest.mode == DIGEST:
+    print(f"🗞️ Notificaciones admin en modo resumen (cada {admin_digest.window_seconds}s o {admin_digest.max_events} registros)")
+    # Al apagar el worker lo acumulado pasa al spool y se envía tras el reinicio
+    atexit.register(admin_digest.flush)
+
+# ────────────────────────────────────────────────
+# 📣 ENVÍOS MASIVOS A LA DEVPOOL
+broadcast_templates = {}
+
+def fetch_broadcast_recipients(after_id, limit):
+    """Página de destinatarios ordenada por id (keyset: no relee lo ya enviado)"""
+    return developer_repo.page_by_id(after_id, limit, 'id, name, email')
+
+def broadcast_template_for(broadcast):
+    """Plantilla cacheada por envío masivo: el cuerpo es común, solo cambia el nombre"""
+    template = broadcast_templates.get(broadcast['id'])
+    if template is None:
+        subject, body = broadcast['subject'], broadcast['body']
+        template = CachedEmailTemplate(
+            f"broadcast-{broadcast['id'][:8]}",
+            render=lambda **context: render_template('emails/broadcast.html',
+                                                     subject=subject, body=body, **context),
+            fields=('user_name',),
+            # El asunto lo escribe el admin: las llaves no son marcadores
+            subject=subject.replace('{', '{{').replace('}', '}}'),
+        )
+        with app.app_context():
+            template.compile()
+        broadcast_templates[broadcast['id']] = template
+    return template
+
+def send_broadcast_email(broadcast, recipient):
+    """Envía un email personalizado del envío masivo (lanza excepción si falla)"""
+    sender = app.config['MAIL_DEFAULT_SENDER']
+    message = broadcast_template_for(broadcast).build(sender, recipient['email'],
+                                                      user_name=recipient.get('name'))
+    deliver_email(sender, recipient['email'], message)
+
+broadcast_mailer = BroadcastMailer(
+    store=BroadcastStore(email_spool.path),
+    fetch_page=fetch_broadcast_recipients,
+    send=send_broadcast_email,
+    # Ritmo ajustado a la cuota del proveedor SMTP
+    rate_limiter=TokenBucket(
+        rate=float(os.environ.get('BROADCAST_RATE_PER_SECOND', 5)),
+        capacity=int(os.environ.get('BROADCAST_BURST', 10)),
+    ),
+    workers=smtp_pool.max_connections,
+    page_size=int(os.environ.get('BROADCAST_PAGE_SIZE', 200)),
+    retry_exceptions=(CircuitOpenError,),
+)
+
+# ────────────────────────────────────────────────
+# 🔁 IDEMPOTENCIA: reintentos y doble envío devuelven la respuesta guardada
+IDEMPOTENCY_FORM_FIELD = 'idempotency_key'
+
+idempotency_store = IdempotencyStore(
+    path=os.environ.get('IDEMPOTENCY_STORE_PATH') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'idempotency.db'),
+    ttl=int(os.environ.get('IDEMPOTENCY_TTL', 86400)),
+    max_entries=int(os.environ.get('IDEMPOTENCY_MAX_ENTRIES', 100000)),
+    wait_timeout=int(os.environ.get('IDEMPOTENCY_WAIT_TIMEOUT', 30)),
+)
+
+def idempotent(f):
+    """Acepta la cabecera Idempotency-Key o el campo oculto idempotency_key"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        key = (request.headers.get('Idempotency-Key') or request.form.get(IDEMPOTENCY_FORM_FIELD) or '').strip()
+        if not key:
+            return f(*args, **kwargs)
+        if len(key) > 255 or not key.isprintable():
+            return jsonify({'error': 'Idempotency-Key no válida'}), 400
+        
+        scoped_key = f"{request.path}:{key}"
+        fingerprint = request_fingerprint(
+            [(name, value) for name, value in request.form.items(multi=True) if name != IDEMPOTENCY_FORM_FIELD]
+        )
+        try:
+            state, stored = idempotency_store.begin(scoped_key, fingerprint)
+        except Exception as e:
+            # Sin almacén la petición se procesa igual (sin protección)
+            print(f"⚠️ [IDEMPOTENCY] Almacén no disponible: {e}")
+            return f(*args, **kwargs)
+        
+        if state == REPLAY:
+            status, body, mimetype = stored
+            print(f"🔁 [IDEMPOTENCY] Respuesta repetida para {key}")
+            response = app.response_class(body, status=status, mimetype=mimetype)
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+        if state == MISMATCH:
+            return jsonify({'error': 'Idempotency-Key ya usada con otros datos'}), 422
+        if state == IN_PROGRESS:
+            return jsonify({'error': 'Petición en curso, reintenta en unos segundos'}), 409, {'Retry-After': '1'}
+        
+        try:
+            response = app.make_response(f(*args, **kwargs))
+        except Exception:
+            idempotency_store.release(scoped_key)
+            raise
+        if response.status_code >= 500:
+            # Error transitorio: el reintento debe volver a intentarlo
+            idempotency_store.release(scoped_key)
+        else:
+            idempotency_store.complete(scoped_key, response.status_code, response.get_data(as_text=True),
+                                       response.mimetype)
+        return response
+    return decorated_function
+
+# ────────────────────────────────────────────────
+# 🚦 DIARIO LOCAL DE REGISTROS (write-ahead + escritura en lotes)
+# Cada registro validado va primero a un diario en disco y se replica a la BD en
+# lotes de REGISTRATION_BATCH_SIZE o cada REGISTRATION_FLUSH_MS, con reintentos;
+# la petición espera como máximo REGISTRATION_MAX_ACK_DELAY_MS (0 = solo el diario)
+# y, si su lote no llegó, responde 202 (en cola). Con la BD caída no se pierden altas.
+# Activo por defecto; REGISTRATION_WRITE_BEHIND=false vuelve a la inserción directa.
+def developer_registered(developer):
+    """Efectos de un alta ya guardada: contador, cachés, índice de emails y emails. Devuelve el job de bienvenida"""
+    developer_counter.increment()
+    invalidate_developer_insert(developer)
+    email_index.add(developer['email_normalized'])
+
+    # ENCOLAR EMAILS: se envían en segundo plano desde el outbox
+    welcome_job = None
+    try:
+        welcome_job = email_outbox.enqueue(
+            'welcome',
+            user_name=developer['name'],
+            user_email=developer['email'],
+            user_skills=developer['skills']
+        )
+        print(f"📬 [SUBMIT] Email de bienvenida encolado: {welcome_job}")
+    except OutboxFullError:
+        print("⚠️ [SUBMIT] Outbox lleno, email de bienvenida descartado")
+    
+    try:
+        admin_digest.add(developer)
+        print(f"📬 [SUBMIT] Notificación admin registrada (modo {admin_digest.mode})")
+    except OutboxFullError:
+        print("⚠️ [SUBMIT] Outbox lleno, notificación admin descartada")
+    return welcome_job
+
+def duplicate_registered(developer):
+    """Email repetido detectado al replicar un registro que ya se confirmó como recibido"""
+    email_index.add(developer['email_normalized'])
+    if DUPLICATE_REGISTRATION_MODE == 'update':
+        updated = developer_repo.update_by_email(developer['email_normalized'],
+                                                 {field: developer[field] for field in REGISTRATION_UPDATE_FIELDS})
+        if updated:
+            invalidate_developer_delete(updated['id'])
+
+registration_batcher = None
+if os.environ.get('REGISTRATION_WRITE_BEHIND', 'True').lower() == 'true':
+    registration_batcher = RegistrationBatcher(
+        RegistrationJournal(
+            os.environ.get('REGISTRATION_JOURNAL_PATH') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'registration_journal.db'),
+            stale_after=int(os.environ.get('REGISTRATION_JOURNAL_STALE_AFTER', 60)),
+            synchronous=os.environ.get('REGISTRATION_JOURNAL_SYNC', 'NORMAL'),
+        ),
+        upsert_many=lambda rows: developer_repo.upsert_many(rows),
+        existing_ids=lambda ids: developer_repo.existing_ids(ids),
+        on_inserted=developer_registered,
+        on_duplicate=duplicate_registered,
+        batch_size=int(os.environ.get('REGISTRATION_BATCH_SIZE', 50)),
+        flush_interval=int(os.environ.get('REGISTRATION_FLUSH_MS', 200)) / 1000,
+        max_ack_delay=int(os.environ.get('REGISTRATION_MAX_ACK_DELAY_MS', 2000)) / 1000,
+        max_pending=int(os.environ.get('REGISTRATION_MAX_PENDING', 1000)),
+        retry_delay=int(os.environ.get('REGISTRATION_RETRY_DELAY', 5)),
+        max_retry_delay=int(os.environ.get('REGISTRATION_MAX_RETRY_DELAY', 300)),
+    )
+    # Al apagar el worker se escribe lo que quede en el búfer (el diario lo conserva igualmente)
+    atexit.register(registration_batcher.flush)
+
 # ────────────────────────────────────────────────
 # DECORADOR PARA ÁREAS PROTEGIDAS
 def admin_required(f):
@@ -320,16 +753,23 @@ def admin_required(f):
     return decorated_function
 
 # ────────────────────────────────────────────────
+def developer_total():
+    """(número de registrados o None, desactualizado): con la BD caída se sirve el último valor"""
+    try:
+        total = developer_counter.get()
+    except Exception as e:
+        print(f"⚠️ [COUNTER] Total no disponible: {e}")
+        return None, True
+    return total, developer_counter.is_stale() or not database.available
+
 @app.route('/')
 def index():
-    try:
-        response = developers_table.select('id').execute()
-        num_usuarios = len(response.data) if response and hasattr(response, 'data') else 0
-    except Exception:
-        num_usuarios = 0
-    return render_template('index.html', num_usuarios=num_usuarios)
+    num_usuarios, num_usuarios_stale = developer_total()
+    return render_template('index.html', num_usuarios=num_usuarios, num_usuarios_stale=num_usuarios_stale,
+                           idempotency_key=str(uuid.uuid4()))
 
 @app.route('/submit', methods=['POST'])
+@idempotent
 def submit():
     try:
         print("🔍 [SUBMIT] === NUEVO REGISTRO INICIADO ===")
@@ -372,7 +812,9 @@ def submit():
             'id': str(uuid.uuid4()),
             'name': data['name'].strip(),
             'email': data['email'].strip().lower(),
+            'email_normalized': normalize_email(data['email']),
             'skills': data['skills'].strip(),
+            'skill_tags': normalize_skills(data['skills']),
             'experience_years': experience_years,
             'portfolio_url': data.get('portfolio_url', '').strip() or None,
             'location': data.get('location', '').strip() or None,
@@ -380,60 +822,73 @@ def submit():
             'created_at': datetime.now().isoformat()
         }
         
-        print(f"🔍 [SUBMIT] Insertando en Supabase: {developer_data['name']} ({developer_data['email']})")
+        print(f"🔍 [SUBMIT] Insertando en {DATABASE_BACKEND}: {developer_data['name']} ({developer_data['email']})")
         
-        # Insertar en Supabase
-        response = developers_table.insert(developer_data).execute()
+        # Duplicado conocido por este worker: se resuelve sin SELECT previo
+        duplicate = email_index.contains(developer_data['email_normalized'])
+        inserted = None
+        welcome_job = None
+        if not duplicate and registration_batcher is not None:
+            outcome, welcome_job = registration_batcher.submit(developer_data)
+            if outcome == QUEUED:
+                # Guardado en el diario: se escribirá en la BD en cuanto sea posible
+                return jsonify({
+                    'success': True,
+                    'queued': True,
+                    'message': '🎉 ¡Registro recibido! Lo estamos procesando'
+                }), 202
+            if outcome == INSERTED:
+                inserted = developer_data
+            elif outcome == DUPLICATE:
+                email_index.add(developer_data['email_normalized'])
+                duplicate = True
+        if not duplicate and not inserted:
+            try:
+                inserted = developer_repo.insert(developer_data)
+                if inserted:
+                    welcome_job = developer_registered(developer_data)
+            except DuplicateEmailError:
+                # Lo registró otro worker: el índice único de la BD lo detecta
+                email_index.add(developer_data['email_normalized'])
+                duplicate = True
         
-        if response.data:
+        if duplicate:
+            print(f"⚠️ [SUBMIT] Registro duplicado: {developer_data['email_normalized']}")
+            if DUPLICATE_REGISTRATION_MODE != 'update':
+                return jsonify({'error': 'Este email ya está registrado en el DevPool', 'duplicate': True}), 409
+            if update_duplicate_registration(developer_data):
+                return jsonify({
+                    'success': True,
+                    'updated': True,
+                    'message': '✅ Ya estabas registrado: hemos actualizado tu perfil'
+                }), 200
+            # El índice estaba desfasado (baja desde otro worker): alta normal
+            email_index.discard(developer_data['email_normalized'])
+            inserted = developer_repo.insert(developer_data)
+            if inserted:
+                welcome_job = developer_registered(developer_data)
+        
+        if inserted:
             print(f"✅ [SUBMIT] Usuario {data['name']} registrado exitosamente en BD")
             
-            # INTENTAR ENVÍO DE EMAILS CON DEBUGGING DETALLADO
-            print("📧 [SUBMIT] === INICIANDO ENVÍO DE EMAILS ===")
-            
-            # Email de bienvenida
-            email_sent = False
-            admin_notified = False
-            
-            try:
-                print(f"📧 [SUBMIT] Enviando email de bienvenida...")
-                email_sent = send_welcome_email(
-                    user_name=data['name'],
-                    user_email=data['email'], 
-                    user_skills=data['skills']
-                )
-                print(f"📧 [SUBMIT] Resultado email bienvenida: {email_sent}")
-            except Exception as email_error:
-                print(f"❌ [SUBMIT] Error crítico en email bienvenida: {email_error}")
-            
-            # Notificación admin
-            try:
-                print(f"📧 [SUBMIT] Enviando notificación admin...")
-                admin_notified = send_admin_notification(developer_data)
-                print(f"📧 [SUBMIT] Resultado notificación admin: {admin_notified}")
-            except Exception as admin_error:
-                print(f"❌ [SUBMIT] Error crítico en notificación admin: {admin_error}")
-            
-            print("📧 [SUBMIT] === ENVÍO DE EMAILS COMPLETADO ===")
-            
             # RESPUESTA AL USUARIO SIEMPRE EXITOSA
             response_message = '🎉 ¡Registro exitoso! Bienvenido al DevPool Blockchain CLM'
-            if not email_sent:
+            if welcome_job:
                 response_message += ' (Email de confirmación en proceso)'
             
             return jsonify({
                 'success': True, 
                 'message': response_message,
-                'email_status': {
-                    'welcome_sent': email_sent,
-                    'admin_notified': admin_notified,
-                    'mode': 'production'
-                }
+                'email_status': welcome_job
             }), 200
         else:
-            print("❌ [SUBMIT] Error insertando en Supabase")
+            print("❌ [SUBMIT] Error insertando en la base de datos")
             return jsonify({'error': 'Error al registrar el usuario'}), 500
             
+    except DatabaseUnavailableError as e:
+        print(f"⚠️ [SUBMIT] {e}")
+        return (jsonify({'error': 'Servicio temporalmente no disponible, inténtalo de nuevo en unos segundos'}),
+                503, {'Retry-After': str(database.retry_after())})
     except Exception as e:
         print(f"❌ [SUBMIT] Error crítico en submit: {str(e)}")
         return jsonify({'error': 'Error interno del servidor'}), 500
@@ -456,10 +911,10 @@ def admin_login():
             return render_template('admin_login.html', error='Usuario y contraseña requeridos')
         
         try:
-            response = admin_table.select('hashed_password').eq('username', username).execute()
+            admin = admin_repo.get_by_username(username, 'hashed_password')
             
-            if response.data:
-                stored_hash = response.data[0]['hashed_password']
+            if admin:
+                stored_hash = admin['hashed_password']
                 
                 if check_password_hash(stored_hash, password):
                     if client_ip in failed_attempts:
@@ -494,6 +949,9 @@ def admin_login():
                 
                 return render_template('admin_login.html', error='Credenciales inválidas')
                 
+        except DatabaseUnavailableError as e:
+            print(f"⚠️ Login sin base de datos: {e}")
+            return render_template('admin_login.html', error='Base de datos no disponible, reintenta en unos segundos'), 503
         except Exception as e:
             log_security_event("LOGIN_ERROR", f"Error: {str(e)}", client_ip)
             print(f"Error en login: {e}")
@@ -504,14 +962,32 @@ def admin_login():
 @app.route('/admin/dashboard')
 @admin_required
 def admin_dashboard():
+    filters = parse_filters(request.args)
+    cursor = request.args.get('cursor')
+    page_size = request.args.get('page_size', DEFAULT_PAGE_SIZE, type=int)
+
     try:
-        response = developers_table.select('*').order('created_at', desc=True).execute()
-        developers = response.data if response.data else []
-        
-        return render_template('admin_dashboard.html', developers=developers)
+        page = cached_developer_page(filters, cursor, page_size)
+        developers, next_cursor = page['rows'], page['next_cursor']
+        total, total_stale = developer_total()
+
+        return render_template('admin_dashboard.html', developers=developers, filters=filters,
+                               cursor=cursor, next_cursor=next_cursor, page_size=page_size, total=total,
+                               total_stale=total_stale)
+    except InvalidCursorError:
+        return redirect(url_for('admin_dashboard', **filters))
     except Exception as e:
         print(f"Error en dashboard: {e}")
-        return render_template('admin_dashboard.html', developers=[], error="Error cargando datos")
+        total, _ = developer_total()
+        found, snapshot = dashboard_snapshots.get(('page', tuple(sorted(filters.items())), cursor, page_size))
+        if found:
+            # Modo degradado: última copia correcta de esta página, solo lectura
+            return render_template('admin_dashboard.html', developers=snapshot['page']['rows'], filters=filters,
+                                   cursor=cursor, next_cursor=snapshot['page']['next_cursor'],
+                                   page_size=page_size, total=total, total_stale=True,
+                                   stale_since=snapshot['saved_at'])
+        return render_template('admin_dashboard.html', developers=[], filters=filters, total=total,
+                               total_stale=True, error="Error cargando datos")
 
 @app.route('/admin/logout')
 def admin_logout():
@@ -526,21 +1002,15 @@ def delete_developer(dev_id):
     try:
         print(f"🗑️ Intentando eliminar desarrollador con ID: {dev_id}")
         
-        info_response = developers_table.select('name, email').eq('id', dev_id).execute()
+        # Un solo viaje: el DELETE devuelve la fila borrada
+        deleted = developer_repo.delete(dev_id)
         
-        if info_response.data:
-            dev_info = info_response.data[0]
-            
-            response = developers_table.delete().eq('id', dev_id).execute()
-            
-            if response.data:
-                print(f"✅ Desarrollador {dev_id} eliminado exitosamente")
-                log_security_event("DEVELOPER_DELETED", 
-                                 f"Admin eliminó: {dev_info['name']} ({dev_info['email']})")
-                return redirect(url_for('admin_dashboard'))
-            else:
-                print(f"❌ Error en eliminación de ID: {dev_id}")
-                return jsonify({'error': 'Error eliminando desarrollador'}), 500
+        if deleted:
+            print(f"✅ Desarrollador {dev_id} eliminado exitosamente")
+            developers_deleted([deleted])
+            log_security_event("DEVELOPER_DELETED", 
+                             f"Admin eliminó: {deleted['name']} ({deleted['email']})")
+            return redirect(url_for('admin_dashboard'))
         else:
             print(f"❌ No se encontró desarrollador con ID: {dev_id}")
             return jsonify({'error': 'Desarrollador no encontrado'}), 404
@@ -550,29 +1020,270 @@ def delete_developer(dev_id):
         log_security_event("DELETE_ERROR", f"Error en eliminación: {str(e)}")
         return jsonify({'error': 'Error interno del servidor'}), 500
 
+@app.route('/admin/delete-bulk', methods=['POST'])
+@admin_required
+def delete_developers_bulk():
+    """Borra varios desarrolladores a la vez (p. ej. registros de spam)"""
+    if request.is_json:
+        ids = (request.get_json(silent=True) or {}).get('ids') or []
+    else:
+        ids = request.form.getlist('ids')
+    
+    valid_ids, invalid_ids = [], []
+    for dev_id in dict.fromkeys(str(dev_id).strip() for dev_id in ids):
+        try:
+            valid_ids.append(str(uuid.UUID(dev_id)))
+        except ValueError:
+            invalid_ids.append(dev_id)
+    
+    if not valid_ids:
+        return jsonify({'error': 'No se indicaron IDs válidos', 'invalid': invalid_ids}), 400
+    if len(valid_ids) > BULK_DELETE_MAX_IDS:
+        return jsonify({'error': f'Máximo {BULK_DELETE_MAX_IDS} registros por petición'}), 400
+    
+    admin = session.get('admin_username', 'Unknown')
+    deleted_ids = []
+    try:
+        # Lotes con un filtro in_ cada uno: URLs acotadas y una entrada de auditoría por lote
+        for start in range(0, len(valid_ids), BULK_DELETE_CHUNK_SIZE):
+            chunk = valid_ids[start:start + BULK_DELETE_CHUNK_SIZE]
+            deleted = developer_repo.delete_many(chunk)
+            developers_deleted(deleted)
+            deleted_ids.extend(dev['id'] for dev in deleted)
+            log_security_event("DEVELOPERS_BULK_DELETED",
+                             f"Admin {admin} eliminó {len(deleted)}/{len(chunk)} registros: "
+                             + ", ".join(f"{dev['name']} ({dev['email']})" for dev in deleted))
+    except Exception as e:
+        print(f"❌ Error en borrado masivo: {e}")
+        log_security_event("DELETE_ERROR", f"Error en borrado masivo tras {len(deleted_ids)} registros: {str(e)}")
+        return jsonify({'error': 'Error interno del servidor', 'deleted': len(deleted_ids),
+                        'deleted_ids': deleted_ids}), 500
+    
+    print(f"✅ Borrado masivo: {len(deleted_ids)} desarrolladores eliminados")
+    if not request.is_json:
+        return redirect(url_for('admin_dashboard'))
+    
+    found = set(deleted_ids)
+    return jsonify({
+        'success': True,
+        'deleted': len(deleted_ids),
+        'deleted_ids': deleted_ids,
+        'not_found': [dev_id for dev_id in valid_ids if dev_id not in found],
+        'invalid': invalid_ids,
+    })
+
 @app.route('/admin/export')
 @admin_required
 def export_developers():
+    """
+    Descarga en streaming por páginas de EXPORT_PAGE_SIZE filas, sin fichero en disco.
+    ?format=json|ndjson|csv &compression=none|gzip|zstd &columns=name,email,...
+    """
+    fmt = (request.args.get('format') or 'json').lower()
+    compression = (request.args.get('compression') or 'none').lower()
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f"Formato no soportado: {fmt} (usa {', '.join(EXPORT_FORMATS)})"}), 400
+    if compression not in COMPRESSIONS:
+        return jsonify({'error': f"Compresión no soportada: {compression} (usa {', '.join(COMPRESSIONS)})"}), 400
+    if compression == 'zstd' and not zstd_available():
+        return jsonify({'error': 'Compresión zstd no disponible (instala el paquete zstandard)'}), 400
     try:
-        response = developers_table.select('*').order('created_at', desc=True).execute()
-        developers = response.data if response.data else []
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"developers_export_{timestamp}.json"
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(developers, f, ensure_ascii=False, indent=2, default=str)
-        
-        log_security_event("DATA_EXPORT", 
-                         f"Admin exportó {len(developers)} registros")
-        
-        return send_file(filename, as_attachment=True, download_name=filename)
-        
+        columns = parse_columns(request.args.get('columns'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    pages = iter_export_pages(developer_repo, EXPORT_PAGE_SIZE, columns)
+    try:
+        # La primera página se pide antes de responder: si la BD falla aún se puede devolver un error
+        first_page = next(pages, None)
+    except DatabaseUnavailableError:
+        return "Base de datos no disponible", 503, {'Retry-After': str(database.retry_after())}
     except Exception as e:
         print(f"Error en export: {e}")
         log_security_event("EXPORT_ERROR", f"Error en exportación: {str(e)}")
         return "Error en exportación", 500
 
+    def remaining_pages():
+        if first_page is not None:
+            yield first_page
+        try:
+            yield from pages
+        except Exception as e:
+            # Cabeceras ya enviadas: se corta la respuesta (el JSON queda incompleto)
+            print(f"Error en export: {e}")
+            log_security_event("EXPORT_ERROR", f"Exportación interrumpida: {str(e)}")
+            raise
+
+    def finished(total):
+        log_security_event("DATA_EXPORT", f"Admin exportó {total} registros ({fmt}, {compression}, "
+                                          f"{len(columns)} columnas)")
+
+    filename = export_filename(datetime.now().strftime('%Y%m%d_%H%M%S'), fmt, compression)
+    # Sin Content-Length: el servidor la envía con transfer-encoding chunked
+    return Response(stream_with_context(export_stream(remaining_pages(), fmt, columns, compression,
+                                                      on_finish=finished)),
+                    mimetype=export_mimetype(fmt, compression),
+                    headers={'Content-Disposition': f'attachment; filename={filename}',
+                             'Cache-Control': 'no-store'})
+
+@app.route('/admin/broadcast', methods=['POST'])
+@admin_required
+def start_broadcast():
+    """Lanza un envío masivo a todos los desarrolladores registrados"""
+    subject = request.form.get('subject', '').strip()
+    body = request.form.get('body', '').replace('\r\n', '\n').strip()
+    
+    if not subject or not body:
+        return jsonify({'error': 'Asunto y mensaje son requeridos'}), 400
+    
+    if not email_configured():
+        return jsonify({'error': 'Sistema de email no configurado'}), 503
+    
+    try:
+        total = developer_repo.count('exact')
+        
+        broadcast_id = broadcast_mailer.start(subject, body, total,
+                                              created_by=session.get('admin_username'))
+        log_security_event("BROADCAST_STARTED", f"Envío masivo '{subject}' a {total} desarrolladores")
+        
+        return jsonify({
+            'success': True,
+            'broadcast_id': broadcast_id,
+            'total': total,
+            'status_url': url_for('broadcast_status', broadcast_id=broadcast_id)
+        }), 202
+    except Exception as e:
+        print(f"❌ Error iniciando envío masivo: {e}")
+        return jsonify({'error': 'Error interno del servidor'}), 500
+
+@app.route('/admin/broadcast/<string:broadcast_id>')
+@admin_required
+def broadcast_status(broadcast_id):
+    """Progreso, ritmo, errores y ETA de un envío masivo"""
+    progress = broadcast_mailer.progress(broadcast_id)
+    if progress is None:
+        return jsonify({'error': 'Envío no encontrado'}), 404
+    return jsonify(progress)
+
+@app.route('/admin/broadcast/<string:broadcast_id>/resume', methods=['POST'])
+@admin_required
+def resume_broadcast(broadcast_id):
+    """Reanuda un envío interrumpido sin repetir destinatarios"""
+    try:
+        resumed = broadcast_mailer.resume(broadcast_id)
+    except KeyError:
+        return jsonify({'error': 'Envío no encontrado'}), 404
+    if resumed:
+        log_security_event("BROADCAST_RESUMED", f"Envío masivo {broadcast_id} reanudado")
+    return jsonify({'success': resumed, 'progress': broadcast_mailer.progress(broadcast_id)})
+
+@app.route('/admin/broadcast/<string:broadcast_id>/cancel', methods=['POST'])
+@admin_required
+def cancel_broadcast(broadcast_id):
+    """Cancela un envío masivo en curso"""
+    if broadcast_mailer.store.get(broadcast_id) is None:
+        return jsonify({'error': 'Envío no encontrado'}), 404
+    broadcast_mailer.cancel(broadcast_id)
+    log_security_event("BROADCAST_CANCELLED", f"Envío masivo {broadcast_id} cancelado")
+    return jsonify({'success': True, 'progress': broadcast_mailer.progress(broadcast_id)})
+
+@app.route('/admin/broadcasts')
+@admin_required
+def list_broadcasts():
+    """Últimos envíos masivos con su progreso"""
+    return jsonify([broadcast_mailer.progress(b['id']) for b in broadcast_mailer.store.list()])
+
+# ────────────────────────────────────────────────
+# 📥 IMPORTACIÓN MASIVA DE DESARROLLADORES
+# El informe se guarda en disco para que cualquier worker pueda consultarlo
+IMPORT_DIR = os.environ.get('IMPORT_UPLOAD_DIR') or os.path.join(tempfile.gettempdir(), 'devpool_imports')
+IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 500))
+IMPORT_MAX_MB = int(os.environ.get('IMPORT_MAX_MB', 200))
+
+def import_report_path(import_id):
+    return os.path.join(IMPORT_DIR, f"{import_id}.json")
+
+def save_import_report(import_id, report):
+    """Escritura atómica del informe (se llama tras cada lote)"""
+    tmp_path = import_report_path(import_id) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, import_report_path(import_id))
+
+def run_import(import_id, importer, upload_path, filename, file_format, admin, ip):
+    """Importación en segundo plano: lee el fichero subido en streaming"""
+    try:
+        with open(upload_path, 'rb') as f:
+            report = importer.run(iter_records(f, file_format, filename=filename))
+    except Exception as e:
+        print(f"❌ [IMPORT] Importación {import_id} interrumpida: {e}")
+        report = importer.fail(e)
+    finally:
+        os.remove(upload_path)
+    
+    # Una importación cambia demasiadas páginas: se vacían las cachés
+    developer_cache.clear()
+    developer_counter.invalidate()
+    if email_index.ready:
+        email_index.warm()
+    save_import_report(import_id, report)
+    log_security_event("DEVELOPERS_IMPORTED",
+                       f"Admin {admin} importó {filename}: {report['inserted']} nuevos, {report['merged']} fusionados, "
+                       f"{report['skipped_duplicates']} duplicados, {report['errors']} errores ({report['status']})", ip)
+
+@app.route('/admin/import', methods=['POST'])
+@admin_required
+def import_developers():
+    """Importa desarrolladores desde JSON/NDJSON/CSV (en segundo plano)"""
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        return jsonify({'error': 'Fichero requerido'}), 400
+    if request.content_length and request.content_length > IMPORT_MAX_MB * 1024 * 1024:
+        return jsonify({'error': f'El fichero supera {IMPORT_MAX_MB} MB'}), 413
+    
+    mode = request.form.get('mode', SKIP)
+    if mode not in (SKIP, MERGE):
+        return jsonify({'error': 'Modo de duplicados no válido (skip o merge)'}), 400
+    file_format = request.form.get('format', 'auto')
+    if file_format not in ('auto', *IMPORT_FORMATS):
+        return jsonify({'error': 'Formato no válido (auto, json, ndjson o csv)'}), 400
+    chunk_size = max(1, min(request.form.get('chunk_size', IMPORT_CHUNK_SIZE, type=int), 5000))
+    dry_run = request.form.get('dry_run', '').lower() in ('1', 'true', 'on')
+    
+    os.makedirs(IMPORT_DIR, exist_ok=True)
+    import_id = str(uuid.uuid4())
+    upload_path = os.path.join(IMPORT_DIR, f"{import_id}.upload")
+    # Se copia a disco por bloques: el fichero nunca se carga entero en memoria
+    upload.save(upload_path)
+    
+    importer = DeveloperImporter(developer_repo, mode=mode, chunk_size=chunk_size, dry_run=dry_run,
+                                 progress=lambda report: save_import_report(import_id, report))
+    importer.report.update({'id': import_id, 'filename': upload.filename})
+    save_import_report(import_id, importer.report)
+    
+    admin = session.get('admin_username', 'Unknown')
+    ip = get_remote_address()
+    threading.Thread(target=run_import, name=f"import-{import_id[:8]}", daemon=True,
+                     args=(import_id, importer, upload_path, upload.filename, file_format, admin, ip)).start()
+    log_security_event("DEVELOPERS_IMPORT_STARTED", f"Admin {admin} importa {upload.filename} (modo {mode})", ip)
+    
+    return jsonify({
+        'success': True,
+        'import_id': import_id,
+        'status_url': url_for('import_status', import_id=import_id)
+    }), 202
+
+@app.route('/admin/import/<string:import_id>')
+@admin_required
+def import_status(import_id):
+    """Progreso e informe de errores por fila de una importación"""
+    try:
+        import_id = str(uuid.UUID(import_id))
+        with open(import_report_path(import_id), encoding='utf-8') as f:
+            return jsonify(json.load(f))
+    except (ValueError, FileNotFoundError):
+        return jsonify({'error': 'Importación no encontrada'}), 404
+
 # RUTAS DE DEBUGGING PARA EMAILS
 @app.route('/test-email-config')
 def test_email_config():
@@ -587,6 +1298,7 @@ def test_email_config():
                 'password_configured': bool(app.config.get('MAIL_PASSWORD')),
                 'use_tls': app.config.get('MAIL_USE_TLS'),
                 'use_ssl': app.config.get('MAIL_USE_SSL'),
+                'transport': app.config.get('EMAIL_TRANSPORT'),
                 'admin_email': os.environ.get('ADMIN_EMAIL')
             }
         })
@@ -598,13 +1310,14 @@ def test_email_config():
 
 @app.route('/test-smtp-connection')
 def test_smtp_connection_endpoint():
-    """Endpoint para probar conexión SMTP"""
+    """Endpoint con el estado SMTP cacheado y las transiciones del breaker"""
     try:
         result = test_smtp_connection()
         return jsonify({
             'status': 'success' if result else 'error',
             'message': 'Conexión SMTP exitosa' if result else 'Error de conexión SMTP',
-            'server': f"{app.config.get('MAIL_SERVER')}:{app.config.get('MAIL_PORT')}"
+            'server': f"{app.config.get('MAIL_SERVER')}:{app.config.get('MAIL_PORT')}",
+            'health': smtp_health.snapshot()
         })
     except Exception as e:
         return jsonify({
@@ -613,6 +1326,79 @@ def test_smtp_connection_endpoint():
             'type': type(e).__name__
         })
 
+@app.route('/email-status/<string:job_id>')
+def email_status(job_id):
+    """Consultar el estado de un email encolado"""
+    job = email_outbox.get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Trabajo de email no encontrado'}), 404
+    return jsonify(job)
+
+@app.route('/email-outbox/stats')
+def email_outbox_stats():
+    """Profundidad de cola, latencias y resultados del outbox"""
+    stats = email_outbox.stats()
+    stats['transport'] = email_transport.stats()
+    stats['admin_digest'] = admin_digest.stats()
+    return jsonify(stats)
+
+@app.route('/admin/db-stats')
+@admin_required
+def db_stats():
+    """Backend de datos y estado del pool HTTP de Supabase (por worker)"""
+    stats = {'backend': DATABASE_BACKEND, 'pid': os.getpid(), 'database': database.snapshot()}
+    if supabase_connector is not None:
+        stats['http_pool'] = supabase_connector.stats()
+    return jsonify(stats)
+
+@app.route('/admin/search')
+@admin_required
+def search_developers():
+    """Búsqueda por habilidades, nombre y ubicación con facetas (JSON)"""
+    query = (request.args.get('q') or '').strip()[:200]
+    limit = request.args.get('limit', 20, type=int)
+    try:
+        result = developer_repo.search(query, parse_filters(request.args), limit)
+    except DatabaseUnavailableError:
+        return jsonify({'error': 'Base de datos no disponible'}), 503, {'Retry-After': str(database.retry_after())}
+    except Exception as e:
+        print(f"❌ [SEARCH] Error buscando '{query}': {e}")
+        return jsonify({'error': 'Error en la búsqueda'}), 500
+    for dev in result['results']:
+        dev['created_at_local'] = format_created_at(dev.get('created_at'))
+    result['query'] = query
+    return jsonify(result)
+
+@app.route('/admin/stats')
+@admin_required
+def registration_stats():
+    """Registros por día y semana, ubicaciones, experiencia y habilidades (tabla developer_stats)"""
+    try:
+        stats = developer_repo.stats(
+            request.args.get('days', 30, type=int),
+            request.args.get('weeks', 12, type=int),
+            request.args.get('top', 10, type=int),
+        )
+    except DatabaseUnavailableError:
+        return jsonify({'error': 'Base de datos no disponible'}), 503, {'Retry-After': str(database.retry_after())}
+    except Exception as e:
+        print(f"❌ [STATS] Error leyendo estadísticas: {e}")
+        return jsonify({'error': 'Error obteniendo estadísticas'}), 500
+    return jsonify(stats)
+
+@app.route('/admin/cache-stats')
+@admin_required
+def cache_stats():
+    """Aciertos, fallos, expulsiones y memoria de las cachés de desarrolladores"""
+    return jsonify({
+        'developer_cache': developer_cache.stats(),
+        'developer_counter': developer_counter.stats(),
+        'dashboard_snapshots': dashboard_snapshots.stats(),
+        'email_index': email_index.stats(),
+        'idempotency': idempotency_store.stats(),
+        'registration_batcher': registration_batcher.stats() if registration_batcher else None,
+    })
+
 @app.route('/test-send-email')
 def test_send_email():
     """Endpoint para probar envío real de email"""
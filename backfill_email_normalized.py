@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+📇 Rellena developers.email_normalized - DevPool ABCLM
+Necesario una vez en bases creadas antes del índice único de emails.
+Por cada buzón repetido se conserva el registro más antiguo; el resto se
+informa (y queda con email_normalized vacío) o se borra con --delete-duplicates.
+
+Uso:
+    python backfill_email_normalized.py [--delete-duplicates] [--dry-run] [--batch-size 1000]
+"""
+
+import argparse
+import sys
+
+from dotenv import load_dotenv
+
+from email_identity import normalize_email
+from repository import DEVELOPER_FIELDS, repositories_from_env
+
+# Cargar variables de entorno
+load_dotenv()
+
+
+def iter_developers(developer_repo, batch_size):
+    after_id = None
+    while True:
+        # Columnas explícitas: '*' incluiría search_vector, que no se puede escribir
+        rows = developer_repo.page_by_id(after_id, batch_size, ', '.join(DEVELOPER_FIELDS))
+        yield from rows
+        if len(rows) < batch_size:
+            return
+        after_id = rows[-1]['id']
+
+
+def find_duplicates(developer_repo, batch_size=1000):
+    """{email_normalized: [(created_at, id, email), ...]} del más antiguo al más reciente"""
+    groups = {}
+    for row in iter_developers(developer_repo, batch_size):
+        groups.setdefault(normalize_email(row['email']), []).append((str(row['created_at']), row['id'], row['email']))
+    for registrations in groups.values():
+        registrations.sort()
+    return groups
+
+
+def backfill(developer_repo, delete_duplicates=False, dry_run=False, batch_size=1000):
+    groups = find_duplicates(developer_repo, batch_size)
+    winners = {registrations[0][1]: key for key, registrations in groups.items()}
+    losers = [dev_id for registrations in groups.values() for _, dev_id, _ in registrations[1:]]
+
+    deleted = 0
+    if delete_duplicates and not dry_run:
+        for start in range(0, len(losers), batch_size):
+            deleted += len(developer_repo.delete_many(losers[start:start + batch_size]))
+
+    updated = 0
+    batch = []
+    for row in iter_developers(developer_repo, batch_size):
+        key = winners.get(row['id'])
+        if key and row.get('email_normalized') != key:
+            batch.append({**row, 'email_normalized': key})
+        if len(batch) >= batch_size:
+            updated += len(batch) if dry_run else len(developer_repo.upsert_many(batch) or batch)
+            batch = []
+    if batch:
+        updated += len(batch) if dry_run else len(developer_repo.upsert_many(batch) or batch)
+
+    duplicates = {key: registrations for key, registrations in groups.items() if len(registrations) > 1}
+    return {'updated': updated, 'deleted': deleted, 'duplicates': duplicates}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rellena email_normalized y detecta registros duplicados")
+    parser.add_argument('--delete-duplicates', action='store_true',
+                        help="Borra los registros repetidos (conserva el más antiguo)")
+    parser.add_argument('--dry-run', action='store_true', help="Solo informa, no escribe")
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    print("📇 BACKFILL DE EMAILS NORMALIZADOS - DevPool ABCLM")
+    print("=" * 50)
+
+    try:
+        developer_repo, _ = repositories_from_env()
+        result = backfill(developer_repo, args.delete_duplicates, args.dry_run, args.batch_size)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    for key, registrations in list(result['duplicates'].items())[:20]:
+        emails = ', '.join(email for _, _, email in registrations)
+        print(f"   ⚠️ {key}: {len(registrations)} registros ({emails})")
+    print(f"✅ {result['updated']} filas actualizadas · {len(result['duplicates'])} buzones repetidos · "
+          f"{result['deleted']} registros borrados{' (simulación)' if args.dry_run else ''}")
+    if result['duplicates'] and not args.delete_duplicates:
+        print("ℹ️ Los repetidos quedan sin email_normalized; usa --delete-duplicates para eliminarlos")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
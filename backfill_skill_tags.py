@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+🏷️ Rellena developers.skill_tags - DevPool ABCLM
+Necesario una vez en bases creadas antes de las etiquetas de habilidades,
+y de nuevo cuando cambia la tabla de sinónimos (skill_tags.SKILL_ALIASES).
+Recorre la tabla por lotes de id y solo reescribe las filas cuyas etiquetas
+cambian.
+
+Uso:
+    python backfill_skill_tags.py [--dry-run] [--batch-size 1000]
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+from dotenv import load_dotenv
+
+from repository import DEVELOPER_FIELDS, repositories_from_env
+from skill_tags import normalize_skills
+
+# Cargar variables de entorno
+load_dotenv()
+
+
+def backfill(developer_repo, dry_run=False, batch_size=1000):
+    """Devuelve {'scanned', 'updated', 'tags'} (tags: Counter de etiquetas)"""
+    scanned = updated = 0
+    tags = Counter()
+    after_id = None
+    while True:
+        # Columnas explícitas: '*' incluiría search_vector, que no se puede escribir
+        rows = developer_repo.page_by_id(after_id, batch_size, ', '.join(DEVELOPER_FIELDS))
+        batch = []
+        for row in rows:
+            row_tags = normalize_skills(row['skills'])
+            tags.update(row_tags)
+            if row.get('skill_tags') != row_tags:
+                batch.append({**row, 'skill_tags': row_tags})
+        if batch and not dry_run:
+            developer_repo.upsert_many(batch)
+        scanned += len(rows)
+        updated += len(batch)
+        if len(rows) < batch_size:
+            return {'scanned': scanned, 'updated': updated, 'tags': tags}
+        after_id = rows[-1]['id']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calcula las etiquetas canónicas de habilidades")
+    parser.add_argument('--dry-run', action='store_true', help="Solo informa, no escribe")
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    print("🏷️ BACKFILL DE ETIQUETAS DE HABILIDADES - DevPool ABCLM")
+    print("=" * 50)
+
+    try:
+        developer_repo, _ = repositories_from_env()
+        result = backfill(developer_repo, args.dry_run, args.batch_size)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    for tag, total in result['tags'].most_common(20):
+        print(f"   🏷️ {tag}: {total}")
+    print(f"✅ {result['scanned']} filas revisadas · {result['updated']} actualizadas · "
+          f"{len(result['tags'])} etiquetas distintas{' (simulación)' if args.dry_run else ''}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark de la app completa - DevPool ABCLM
+Ejecuta las rutas principales en proceso (cliente de pruebas de Flask, sin
+servidor HTTP) contra el backend elegido y mide latencia y peticiones/s:
+portada, panel admin (primera página, páginas profundas y con filtros),
+búsqueda con facetas, exportación y registros.
+
+Uso:
+    python bench_app.py [--backend sqlite|supabase] [--rows 100000] [--requests 200]
+                        [--no-cache]
+
+Con --backend sqlite se crea una base temporal con --rows desarrolladores;
+con --backend supabase se usan SUPABASE_URL/SUPABASE_KEY del entorno (¡registra
+datos reales! úsese solo contra un proyecto de pruebas).
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0
+
+
+def measure(name, requests, call):
+    latencies = []
+    started = time.perf_counter()
+    for i in range(requests):
+        t0 = time.perf_counter()
+        response = call(i)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{name}: HTTP {response.status_code}")
+    elapsed = time.perf_counter() - started
+    print(f"  {name:<28} {requests / elapsed:9.1f} req/s   p50 {percentile(latencies, 0.5):8.2f} ms"
+          f"   p95 {percentile(latencies, 0.95):8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la app completa")
+    parser.add_argument('--backend', choices=['sqlite', 'supabase'], default='sqlite')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--no-cache', action='store_true', help="Desactiva la caché de consultas")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ.update({
+            'DATABASE_BACKEND': args.backend,
+            'SQLITE_DATABASE_PATH': os.path.join(workdir, 'devpool.db'),
+            'EMAIL_TRANSPORT': 'memory',
+            'EMAIL_SPOOL_PATH': os.path.join(workdir, 'spool.db'),
+            'ADMIN_NOTIFY_MODE': 'digest',
+        })
+        if args.no_cache:
+            os.environ['DEVELOPER_CACHE_TTL'] = '0'
+            os.environ['DEVELOPER_COUNT_TTL'] = '0'
+            os.environ['DEVELOPER_COUNT_STALE_TTL'] = '0'
+
+        import appy
+        os.chdir(workdir)
+        if args.backend == 'sqlite':
+            from seed_local_db import seed
+            started = time.perf_counter()
+            seed(appy.developer_repo, args.rows)
+            print(f"🌱 {args.rows} desarrolladores cargados en {time.perf_counter() - started:.1f}s")
+
+        appy.app.config['TESTING'] = True
+        client = appy.app.test_client()
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+            sess['admin_username'] = 'bench'
+
+        # Cursores de páginas profundas (recorriendo el panel una vez)
+        cursors, cursor = [], None
+        for _ in range(20):
+            cursor = appy.developer_repo.page({}, cursor, 30)[1]
+            if not cursor:
+                break
+            cursors.append(cursor)
+        cursors = cursors or [None]
+
+        total = appy.developer_repo.count()
+        print()
+        print(f"⏱️ APP COMPLETA - backend {args.backend}, {total} desarrolladores, "
+              f"caché {'desactivada' if args.no_cache else 'activada'}")
+        print("=" * 80)
+        measure("GET /", args.requests, lambda i: client.get('/'))
+        measure("GET /admin/dashboard", args.requests, lambda i: client.get('/admin/dashboard'))
+        measure("dashboard página profunda", args.requests,
+                lambda i: client.get('/admin/dashboard', query_string={'cursor': cursors[i % len(cursors)]}))
+        measure("dashboard con filtros", args.requests,
+                lambda i: client.get('/admin/dashboard', query_string={'location': 'toledo', 'skill': 'rust',
+                                                                     'min_experience': i % 5}))
+        search_queries = ['solidity', 'rust madrid', 'py', 'go toledo', 'zk']
+        measure("GET /admin/search", args.requests,
+                lambda i: client.get('/admin/search', query_string={'q': search_queries[i % len(search_queries)]}))
+        measure("búsqueda con filtros", args.requests,
+                lambda i: client.get('/admin/search', query_string={'q': 'solidity', 'min_experience': i % 5}))
+        measure("POST /submit", args.requests, lambda i: client.post('/submit', data={
+            'name': f'Bench {i}', 'email': f'bench{i}-{time.time_ns()}@example.com',
+            'skills': 'Python, Solidity', 'experience_years': '3', 'location': 'Toledo',
+        }))
+        # buffered=True: se mide la descarga completa, no solo las cabeceras del streaming
+        measure("GET /admin/export", max(1, args.requests // 20),
+                lambda i: client.get('/admin/export', buffered=True))
+
+        print()
+        print(f"🗃️ Caché: {appy.developer_cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
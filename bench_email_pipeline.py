@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark del pipeline de emails sin red - DevPool ABCLM
+Encola N emails de bienvenida en el outbox y mide el coste de encolar,
+el throughput de entrega, la latencia por email y la profundidad de cola.
+
+Transportes:
+  memory      mensajes en memoria
+  file        mbox en un directorio temporal
+  smtp-local  servidor SMTP local (local_smtp_server.py) arrancado en este proceso
+
+Uso:
+    python bench_email_pipeline.py [--transport memory|file|smtp-local] [-n 2000]
+                                   [--workers 2] [--latency-ms 0]
+"""
+
+import argparse
+import os
+import socket
+import tempfile
+import threading
+import time
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def configure(args, workdir):
+    """Configura la app por variables de entorno antes de importarla"""
+    os.environ['EMAIL_SPOOL_PATH'] = os.path.join(workdir, 'spool.db')
+    os.environ['EMAIL_OUTBOX_WORKERS'] = str(args.workers)
+    os.environ['EMAIL_OUTBOX_MAX_QUEUE'] = str(args.n + 10)
+    os.environ['MAIL_USERNAME'] = ''
+    os.environ['MAIL_PASSWORD'] = ''
+
+    if args.transport == 'smtp-local':
+        from local_smtp_server import LocalSMTPServer
+        port = free_port()
+        server = LocalSMTPServer('127.0.0.1', port, latency_ms=args.latency_ms)
+        server.start_in_background()
+        os.environ.update({
+            'EMAIL_TRANSPORT': 'smtp',
+            'MAIL_SERVER': '127.0.0.1',
+            'MAIL_PORT': str(port),
+            'MAIL_USE_TLS': 'False',
+            'MAIL_USE_SSL': 'False',
+            'MAIL_REQUIRE_AUTH': 'False',
+        })
+        return server
+    os.environ['EMAIL_TRANSPORT'] = args.transport
+    os.environ['EMAIL_FILE_PATH'] = os.path.join(workdir, 'outbox.mbox')
+    return None
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline de emails")
+    parser.add_argument('--transport', choices=['memory', 'file', 'smtp-local'], default='memory')
+    parser.add_argument('-n', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--latency-ms', type=float, default=0,
+                        help="Latencia simulada del proveedor (solo smtp-local)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        server = configure(args, workdir)
+        import appy
+
+        depths = []
+        sampling = threading.Event()
+
+        def sample_depth():
+            while not sampling.wait(0.01):
+                depths.append(appy.email_outbox.stats()['queue_depth'])
+
+        sampler = threading.Thread(target=sample_depth, daemon=True)
+        sampler.start()
+
+        started = time.perf_counter()
+        job_ids = [
+            appy.email_outbox.enqueue('welcome', user_name=f"Dev {i}",
+                                      user_email=f"dev{i}@example.com",
+                                      user_skills='Python, Solidity, Rust')
+            for i in range(args.n)
+        ]
+        enqueued = time.perf_counter()
+        appy.email_outbox.wait_idle()
+        finished = time.perf_counter()
+        sampling.set()
+
+        jobs = [appy.email_outbox.get_job(job_id) for job_id in job_ids]
+        latencies = [job['latency_ms'] for job in jobs if job and job['latency_ms'] is not None]
+        sent = sum(1 for job in jobs if job and job['status'] == 'sent')
+
+        print()
+        print(f"⏱️ PIPELINE DE EMAILS - transporte {args.transport}, {args.workers} workers, {args.n} emails")
+        print("=" * 70)
+        print(f"📬 Encolado:    {(enqueued - started) * 1e6 / args.n:8.1f} µs/email (coste añadido a /submit)")
+        print(f"🚚 Entrega:     {sent / (finished - started):8.0f} emails/s ({sent}/{args.n} enviados)")
+        print(f"⏳ Latencia:    p50 {percentile(latencies, 0.5)} ms · p95 {percentile(latencies, 0.95)} ms")
+        print(f"📈 Cola máxima: {max(depths) if depths else 0} trabajos")
+        if server is not None:
+            print(f"📭 Servidor SMTP local: {server.messages} mensajes recibidos")
+            print(f"📮 Pool SMTP: {appy.smtp_pool.stats()}")
+
+
+if __name__ == '__main__':
+    main()
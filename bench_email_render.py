@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+⏱️ Micro-benchmark de construcción de emails - DevPool ABCLM
+Compara mensajes construidos por segundo:
+  - antes: render_template + MIMEMultipart en cada envío
+  - después: CachedEmailTemplate (estructura y partes estáticas cacheadas)
+
+Uso:
+    python bench_email_render.py [N]
+"""
+
+import sys
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from flask import render_template
+
+from appy import app, welcome_template
+
+SENDER = 'contacto@clmblockchain.org'
+
+
+def build_legacy(i):
+    email_html = render_template('emails/welcome_email.html',
+                                 user_name=f"Dev {i} <Núñez>",
+                                 user_skills='Python, Solidity, Rust')
+    message = MIMEMultipart("alternative")
+    message["Subject"] = "Bienvenido al DevPool Blockchain CLM"
+    message["From"] = SENDER
+    message["To"] = f"dev{i}@example.com"
+    message.attach(MIMEText(email_html, "html", "utf-8"))
+    return message.as_bytes()
+
+
+def build_cached(i):
+    return welcome_template.build(SENDER, f"dev{i}@example.com",
+                                  user_name=f"Dev {i} <Núñez>",
+                                  user_skills='Python, Solidity, Rust')
+
+
+def measure(label, func, n):
+    func(0)  # calentamiento (compila la plantilla)
+    started = time.perf_counter()
+    for i in range(n):
+        func(i)
+    elapsed = time.perf_counter() - started
+    rate = n / elapsed
+    print(f"⏱️ {label:<32} {rate:>10,.0f} mensajes/s  ({elapsed * 1000 / n:.3f} ms/mensaje)")
+    return rate
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"⏱️ BENCHMARK DE EMAILS ({n} mensajes de bienvenida)")
+    print("=" * 70)
+    with app.app_context():
+        before = measure("Antes (render + MIMEMultipart)", build_legacy, n)
+        after = measure("Después (plantilla cacheada)", build_cached, n)
+    print("=" * 70)
+    print(f"🚀 Mejora: x{after / before:.1f}")
+
+
+if __name__ == '__main__':
+    main()
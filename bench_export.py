@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark de la exportación - DevPool ABCLM
+Compara bytes y segundos por formato y compresión sobre una base SQLite
+temporal con --rows desarrolladores:
+  - antes: list_all + json.dumps(indent=2) en memoria
+  - después: exportación en streaming (json / ndjson / csv, sin comprimir,
+    gzip y zstd si está instalado) y solo algunas columnas
+El pico de memoria se mide con tracemalloc en una pasada aparte (lo ralentiza).
+
+Uso:
+    python bench_export.py [--rows 100000] [--page-size 1000] [--no-memory]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from developer_export import DEFAULT_EXPORT_PAGE_SIZE, export_stream, iter_export_pages, zstd_available
+from repository import DEVELOPER_FIELDS, create_repositories
+from seed_local_db import fake_developers
+
+
+def legacy_export(repo):
+    yield json.dumps(repo.list_all(), ensure_ascii=False, indent=2, default=str).encode('utf-8')
+
+
+def streaming_export(repo, page_size, fmt, compression, columns=DEVELOPER_FIELDS):
+    return export_stream(iter_export_pages(repo, page_size, columns), fmt, columns, compression)
+
+
+def run(produce, memory):
+    """(bytes, segundos, pico de memoria en MB o None)"""
+    started = time.perf_counter()
+    size = sum(len(chunk) for chunk in produce())
+    elapsed = time.perf_counter() - started
+    peak = None
+    if memory:
+        tracemalloc.start()
+        for _ in produce():
+            pass
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return size, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de formatos de exportación")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=DEFAULT_EXPORT_PAGE_SIZE)
+    parser.add_argument('--no-memory', action='store_true', help="No mide el pico de memoria (más rápido)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        repo, _ = create_repositories('sqlite', sqlite_path=os.path.join(workdir, 'bench.db'))
+        started = time.perf_counter()
+        repo.insert_many(fake_developers(args.rows))
+        print(f"🌱 {args.rows} desarrolladores cargados en {time.perf_counter() - started:.1f}s")
+
+        compressions = ['none', 'gzip'] + (['zstd'] if zstd_available() else [])
+        contact = ('name', 'email', 'skills', 'location')
+        cases = [('antes: JSON indent=2 en memoria', lambda: legacy_export(repo))]
+        for fmt in ('json', 'ndjson', 'csv'):
+            for compression in compressions:
+                cases.append((f"{fmt} {compression}",
+                              lambda fmt=fmt, compression=compression:
+                              streaming_export(repo, args.page_size, fmt, compression)))
+        cases.append(("csv gzip, 4 columnas",
+                      lambda: streaming_export(repo, args.page_size, 'csv', 'gzip', contact)))
+
+        print()
+        print(f"⏱️ EXPORTACIÓN - {args.rows} filas, páginas de {args.page_size}")
+        print("=" * 80)
+        for name, produce in cases:
+            size, elapsed, peak = run(produce, not args.no_memory)
+            memory = f"   pico {peak:7.1f} MB" if peak is not None else ""
+            print(f"  {name:<34} {size / 1024 / 1024:8.1f} MB   {elapsed:6.2f} s"
+                  f"   {args.rows / elapsed:9.0f} filas/s{memory}")
+        if not zstd_available():
+            print("\nℹ️ zstd no medido: instala el paquete zstandard")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+"""
+📣 Envíos masivos a la DevPool - DevPool Blockchain CLM
+Recorre la tabla de desarrolladores por páginas, personaliza cada email
+desde una plantilla cacheada y lo envía por el pool SMTP a un ritmo
+limitado por un token bucket. Cada destinatario queda registrado en
+SQLite, así que tras un reinicio el envío se reanuda sin repetir a nadie.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+
+# Estados de un envío masivo
+RUNNING = 'running'
+COMPLETED = 'completed'
+CANCELLED = 'cancelled'
+INTERRUPTED = 'interrupted'
+
+# Estados de cada destinatario
+SENDING = 'sending'
+SENT = 'sent'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS broadcasts (
+    id TEXT PRIMARY KEY,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    last_id TEXT,
+    created_by TEXT,
+    created_at REAL NOT NULL,
+    heartbeat_at REAL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS broadcast_recipients (
+    broadcast_id TEXT NOT NULL,
+    developer_id TEXT NOT NULL,
+    email TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (broadcast_id, developer_id)
+);
+"""
+
+
+class TokenBucket:
+    """Limitador de ritmo: `rate` envíos por segundo con ráfagas de hasta `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Bloquea hasta que haya un token disponible"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class BroadcastStore:
+    """Checkpoints persistentes de los envíos masivos"""
+
+    def __init__(self, path):
+        self.path = path
+        self._pid = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._connection().execute(sql, params).rowcount
+
+    def _fetchall(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._connection().execute(sql, params).fetchall()]
+
+    def create(self, subject, body, total, created_by=None):
+        broadcast_id = str(uuid.uuid4())
+        now = time.time()
+        self._execute(
+            "INSERT INTO broadcasts (id, subject, body, status, total, created_by, created_at, heartbeat_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (broadcast_id, subject, body, RUNNING, total, created_by, now, now),
+        )
+        return broadcast_id
+
+    def get(self, broadcast_id):
+        rows = self._fetchall("SELECT * FROM broadcasts WHERE id = ?", (broadcast_id,))
+        return rows[0] if rows else None
+
+    def list(self, limit=20):
+        return self._fetchall("SELECT * FROM broadcasts ORDER BY created_at DESC LIMIT ?", (limit,))
+
+    def heartbeat(self, broadcast_id, last_id=None):
+        if last_id is None:
+            self._execute("UPDATE broadcasts SET heartbeat_at = ? WHERE id = ?", (time.time(), broadcast_id))
+        else:
+            self._execute("UPDATE broadcasts SET heartbeat_at = ?, last_id = ? WHERE id = ?",
+                          (time.time(), last_id, broadcast_id))
+
+    def claim(self, broadcast_id, stale_before):
+        """
+        Toma un envío interrumpido o sin heartbeat desde stale_before. Es un
+        UPDATE condicional: si dos workers lo reanudan a la vez, solo uno lo consigue.
+        """
+        return self._execute(
+            "UPDATE broadcasts SET status = ?, heartbeat_at = ?, finished_at = NULL WHERE id = ? "
+            "AND (status = ? OR (status = ? AND COALESCE(heartbeat_at, 0) < ?))",
+            (RUNNING, time.time(), broadcast_id, INTERRUPTED, RUNNING, stale_before),
+        ) == 1
+
+    def set_status(self, broadcast_id, status, only_if=None):
+        """Cambia el estado; con only_if, solo si el estado actual es ese. Devuelve si cambió"""
+        finished = time.time() if status in (COMPLETED, CANCELLED) else None
+        sql = "UPDATE broadcasts SET status = ?, finished_at = ?, heartbeat_at = ? WHERE id = ?"
+        params = [status, finished, time.time(), broadcast_id]
+        if only_if is not None:
+            sql += " AND status = ?"
+            params.append(only_if)
+        return self._execute(sql, params) == 1
+
+    def processed_ids(self, broadcast_id, developer_ids):
+        """Destinatarios de la página que ya se procesaron (en cualquier estado)"""
+        if not developer_ids:
+            return set()
+        placeholders = ','.join('?' * len(developer_ids))
+        rows = self._fetchall(
+            f"SELECT developer_id FROM broadcast_recipients WHERE broadcast_id = ? "
+            f"AND developer_id IN ({placeholders})",
+            [broadcast_id, *developer_ids],
+        )
+        return {row['developer_id'] for row in rows}
+
+    def mark_recipient(self, broadcast_id, developer_id, email, status, error=None):
+        self._execute(
+            "INSERT OR REPLACE INTO broadcast_recipients (broadcast_id, developer_id, email, status, error, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (broadcast_id, developer_id, email, status, error, time.time()),
+        )
+
+    def counts(self, broadcast_id):
+        rows = self._fetchall(
+            "SELECT status, COUNT(*) AS total FROM broadcast_recipients WHERE broadcast_id = ? GROUP BY status",
+            (broadcast_id,),
+        )
+        counts = {SENDING: 0, SENT: 0, FAILED: 0}
+        counts.update({row['status']: row['total'] for row in rows})
+        return counts
+
+    def failures(self, broadcast_id, limit=20):
+        return self._fetchall(
+            "SELECT developer_id, email, error, updated_at FROM broadcast_recipients "
+            "WHERE broadcast_id = ? AND status = ? ORDER BY updated_at DESC LIMIT ?",
+            (broadcast_id, FAILED, limit),
+        )
+
+
+class BroadcastMailer:
+    """Ejecuta envíos masivos en segundo plano"""
+
+    def __init__(self, store, fetch_page, send, rate_limiter, workers=3, page_size=200,
+                 retry_exceptions=(), stale_after=60, retry_delay=5):
+        # fetch_page(after_id, limit) -> [{'id', 'name', 'email'}, ...] ordenados por id
+        # send(broadcast, recipient) -> lanza excepción si el envío falla
+        self.store = store
+        self.fetch_page = fetch_page
+        self.send = send
+        self.rate_limiter = rate_limiter
+        self.workers = max(1, int(workers))
+        self.page_size = page_size
+        # Errores que no son culpa del destinatario (p. ej. circuito SMTP abierto): se espera y reintenta
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.retry_delay = retry_delay
+        self.stale_after = stale_after
+        self._running = {}
+        self._lock = threading.Lock()
+
+    def start(self, subject, body, total, created_by=None):
+        broadcast_id = self.store.create(subject, body, total, created_by)
+        self._launch(broadcast_id)
+        return broadcast_id
+
+    def resume(self, broadcast_id):
+        """Reanuda un envío interrumpido (por ejemplo tras reiniciar el worker)"""
+        broadcast = self.store.get(broadcast_id)
+        if broadcast is None:
+            raise KeyError(broadcast_id)
+        with self._lock:
+            if broadcast_id in self._running:
+                return False
+        # Otro worker puede estar reanudándolo a la vez: solo lanza quien gana el claim
+        if not self.store.claim(broadcast_id, time.time() - self.stale_after):
+            return False
+        self._launch(broadcast_id)
+        return True
+
+    def cancel(self, broadcast_id):
+        with self._lock:
+            run = self._running.get(broadcast_id)
+        if run:
+            run['cancelled'] = True
+        self.store.set_status(broadcast_id, CANCELLED)
+
+    def _cancelled(self, broadcast_id, run):
+        """Cancelado en este worker o en otro: manda el estado guardado en SQLite"""
+        if not run['cancelled']:
+            broadcast = self.store.get(broadcast_id)
+            run['cancelled'] = broadcast is None or broadcast['status'] == CANCELLED
+        return run['cancelled']
+
+    def _launch(self, broadcast_id):
+        run = {'started_at': time.time(), 'sent': 0, 'failed': 0, 'cancelled': False}
+        with self._lock:
+            self._running[broadcast_id] = run
+        thread = threading.Thread(target=self._run, args=(broadcast_id, run),
+                                  name=f"broadcast-{broadcast_id[:8]}", daemon=True)
+        thread.start()
+
+    def _deliver(self, broadcast, recipient, run):
+        while not run['cancelled']:
+            self.rate_limiter.acquire()
+            try:
+                # Se marca antes de enviar: si el proceso muere aquí, no se reenvía al reanudar
+                self.store.mark_recipient(broadcast['id'], recipient['id'], recipient['email'], SENDING)
+                self.send(broadcast, recipient)
+            except self.retry_exceptions:
+                # Heartbeat también mientras se reintenta: una caída larga del SMTP
+                # no debe parecer un worker muerto (otro lo reanudaría y duplicaría envíos)
+                self.store.heartbeat(broadcast['id'])
+                if self._cancelled(broadcast['id'], run):
+                    return
+                time.sleep(self.retry_delay)
+                continue
+            except Exception as e:
+                self.store.mark_recipient(broadcast['id'], recipient['id'], recipient['email'], FAILED,
+                                          f"{type(e).__name__}: {e}")
+                run['failed'] += 1
+            else:
+                self.store.mark_recipient(broadcast['id'], recipient['id'], recipient['email'], SENT)
+                run['sent'] += 1
+            self.store.heartbeat(broadcast['id'])
+            return
+
+    def _run(self, broadcast_id, run):
+        broadcast = self.store.get(broadcast_id)
+        after_id = broadcast['last_id']
+        print(f"📣 [BROADCAST] Iniciando envío {broadcast_id} desde {after_id or 'el principio'}")
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                while not self._cancelled(broadcast_id, run):
+                    page = self.fetch_page(after_id, self.page_size)
+                    if not page:
+                        break
+                    done = self.store.processed_ids(broadcast_id, [r['id'] for r in page])
+                    pending = [r for r in page if r['id'] not in done and r.get('email')]
+                    # Espera a que termine la página antes de guardar el checkpoint
+                    list(executor.map(lambda r: self._deliver(broadcast, r, run), pending))
+                    after_id = page[-1]['id']
+                    self.store.heartbeat(broadcast_id, after_id)
+            # Condicional: una cancelación hecha desde otro worker no se pisa
+            if not run['cancelled'] and self.store.set_status(broadcast_id, COMPLETED, only_if=RUNNING):
+                print(f"✅ [BROADCAST] Envío {broadcast_id} completado: {run['sent']} enviados, {run['failed']} fallidos")
+            else:
+                print(f"🛑 [BROADCAST] Envío {broadcast_id} cancelado: {run['sent']} enviados, {run['failed']} fallidos")
+        except Exception as e:
+            self.store.set_status(broadcast_id, INTERRUPTED, only_if=RUNNING)
+            print(f"❌ [BROADCAST] Envío {broadcast_id} interrumpido: {type(e).__name__}: {e}")
+        finally:
+            with self._lock:
+                self._running.pop(broadcast_id, None)
+
+    def progress(self, broadcast_id):
+        """Progreso, ritmo, errores y ETA de un envío"""
+        broadcast = self.store.get(broadcast_id)
+        if broadcast is None:
+            return None
+        counts = self.store.counts(broadcast_id)
+        with self._lock:
+            run = self._running.get(broadcast_id)
+
+        processed = counts[SENT] + counts[FAILED] + counts[SENDING]
+        remaining = max(0, broadcast['total'] - processed)
+        throughput = eta = None
+        if run:
+            elapsed = time.time() - run['started_at']
+            done_this_run = run['sent'] + run['failed']
+            if elapsed > 0 and done_this_run:
+                throughput = round(done_this_run / elapsed, 2)
+                eta = round(remaining / throughput) if throughput else None
+
+        status = broadcast['status']
+        if status == RUNNING and not run and time.time() - (broadcast['heartbeat_at'] or 0) > self.stale_after:
+            status = INTERRUPTED
+
+        return {
+            'id': broadcast_id,
+            'subject': broadcast['subject'],
+            'status': status,
+            'total': broadcast['total'],
+            'sent': counts[SENT],
+            'failed': counts[FAILED],
+            # Interrumpidos a mitad de envío: no se reintentan para no duplicar
+            'unknown': counts[SENDING] if not run else 0,
+            'remaining': remaining,
+            'throughput_per_second': throughput,
+            'eta_seconds': eta,
+            'created_at': datetime.fromtimestamp(broadcast['created_at']).isoformat(),
+            'recent_failures': self.store.failures(broadcast_id, limit=10),
+        }
@@ -9,6 +9,7 @@ import getpass
 from werkzeug.security import generate_password_hash
 from dotenv import load_dotenv
 from supabase import create_client
+from repository import create_repositories
 
 # Cargar variables de entorno
 load_dotenv()
@@ -17,15 +18,20 @@ def main():
     print("🔐 GESTIÓN DE CONTRASEÑA ADMIN - DevPool ABCLM")
     print("=" * 50)
     
-    # Configurar cliente Supabase
-    SUPABASE_URL = os.environ.get('SUPABASE_URL')
-    SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
+    # Backend de datos: supabase (por defecto) o la base SQLite local
+    backend = os.environ.get('DATABASE_BACKEND', 'supabase').lower()
     
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        print("❌ Error: Variables de entorno SUPABASE_URL y SUPABASE_KEY no configuradas")
-        return
-    
-    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+    if backend == 'sqlite':
+        _, admin_repo = create_repositories('sqlite', sqlite_path=os.environ.get('SQLITE_DATABASE_PATH', 'devpool_local.db'))
+    else:
+        SUPABASE_URL = os.environ.get('SUPABASE_URL')
+        SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
+        
+        if not SUPABASE_URL or not SUPABASE_KEY:
+            print("❌ Error: Variables de entorno SUPABASE_URL y SUPABASE_KEY no configuradas")
+            return
+        
+        _, admin_repo = create_repositories('supabase', supabase_client=create_client(SUPABASE_URL, SUPABASE_KEY))
     
     # Solicitar nueva contraseña
     print("\n📝 Ingrese la nueva contraseña para el administrador:")
@@ -45,33 +51,13 @@ def main():
     hashed_password = generate_password_hash(new_password)
     
     try:
-        # Actualizar contraseña en Supabase
-        admin_table = supabase.table('admin')
-        
-        # Verificar si existe el admin
-        check_response = admin_table.select('id').eq('username', 'admin').execute()
+        # Actualiza la contraseña o crea el admin si no existe
+        result = admin_repo.set_password('admin', hashed_password)
         
-        if check_response.data:
-            # Actualizar contraseña existente
-            update_response = admin_table.update({
-                'hashed_password': hashed_password
-            }).eq('username', 'admin').execute()
-            
-            if update_response.data:
-                print("✅ Contraseña actualizada exitosamente")
-            else:
-                print("❌ Error actualizando la contraseña")
+        if result == 'updated':
+            print("✅ Contraseña actualizada exitosamente")
         else:
-            # Crear nuevo admin
-            insert_response = admin_table.insert({
-                'username': 'admin',
-                'hashed_password': hashed_password
-            }).execute()
-            
-            if insert_response.data:
-                print("✅ Administrador creado exitosamente")
-            else:
-                print("❌ Error creando el administrador")
+            print("✅ Administrador creado exitosamente")
                 
     except Exception as e:
         print(f"❌ Error conectando con la base de datos: {e}")
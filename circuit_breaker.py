@@ -0,0 +1,118 @@
+"""
+⚡ Circuit breaker - DevPool Blockchain CLM
+Corta las llamadas a un servicio que está fallando y lo vuelve a
+probar con intentos "half-open" pasado un tiempo de recuperación.
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """El circuito está abierto: la llamada se rechaza sin intentarla"""
+
+
+class CircuitBreaker:
+    """Circuit breaker con estados closed / open / half_open"""
+
+    def __init__(self, name, failure_threshold=3, recovery_timeout=30, half_open_max_calls=1):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, int(half_open_max_calls))
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._half_open_calls = 0
+        self._transitions = deque(maxlen=20)
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, new_state, reason):
+        # Se llama siempre con el lock tomado
+        if new_state == self._state:
+            return
+        self._transitions.append({
+            'from': self._state,
+            'to': new_state,
+            'reason': reason,
+            'at': datetime.now().isoformat(),
+        })
+        print(f"⚡ [BREAKER:{self.name}] {self._state} -> {new_state} ({reason})")
+        self._state = new_state
+        if new_state == OPEN:
+            self._opened_at = time.time()
+        if new_state in (OPEN, HALF_OPEN):
+            self._half_open_calls = 0
+        if new_state == CLOSED:
+            self._failures = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == OPEN and time.time() - self._opened_at >= self.recovery_timeout:
+                self._transition(HALF_OPEN, 'tiempo de recuperación cumplido')
+            return self._state
+
+    def allow(self):
+        """Indica si se puede intentar una llamada ahora"""
+        with self._lock:
+            if self._state == OPEN and time.time() - self._opened_at >= self.recovery_timeout:
+                self._transition(HALF_OPEN, 'tiempo de recuperación cumplido')
+
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                self._transition(CLOSED, 'llamada de prueba correcta')
+            self._failures = 0
+
+    def record_failure(self, reason='error'):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                self._transition(OPEN, f'falló la prueba: {reason}')
+            elif self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._transition(OPEN, f'{self._failures} fallos seguidos: {reason}')
+
+    def call(self, func, *args, **kwargs):
+        """Ejecuta func protegida por el breaker"""
+        if not self.allow():
+            raise CircuitOpenError(f"Circuito {self.name} abierto")
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(type(e).__name__)
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self):
+        state = self.state
+        with self._lock:
+            retry_in = None
+            if state == OPEN:
+                retry_in = round(max(0.0, self.recovery_timeout - (time.time() - self._opened_at)), 1)
+            return {
+                'name': self.name,
+                'state': state,
+                'consecutive_failures': self._failures,
+                'rejected_calls': self._rejected,
+                'retry_in_seconds': retry_in,
+                'transitions': list(self._transitions),
+            }
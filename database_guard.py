@@ -0,0 +1,120 @@
+"""
+🛡️ Acceso protegido a la base de datos - DevPool Blockchain CLM
+Todas las llamadas a los repositorios pasan por un circuit breaker:
+  - tras varios fallos seguidos (o llamadas demasiado lentas) el circuito
+    se abre y las llamadas fallan al momento con DatabaseUnavailableError,
+    en lugar de bloquear cada petición hasta el timeout HTTP; las escrituras
+    masivas (slow_call_exempt) solo cuentan si fallan, no por lentas
+  - pasado el tiempo de recuperación se deja pasar una llamada de prueba
+    (half-open); si responde, el circuito se cierra
+  - la conexión se crea en el primer uso y, si falla (Supabase caído al
+    arrancar, variables de entorno mal puestas), se vuelve a intentar en
+    la siguiente llamada permitida por el breaker: no hace falta reiniciar
+Los errores de negocio (email duplicado, cursor inválido) no cuentan como
+fallos: la base de datos respondió.
+"""
+
+import threading
+import time
+
+from circuit_breaker import OPEN, CircuitOpenError
+
+
+class DatabaseUnavailableError(CircuitOpenError):
+    """La base de datos no está disponible (circuito abierto o sin conexión)"""
+
+
+class DatabaseConnection:
+    """Repositorios creados de forma perezosa y protegidos por un circuit breaker"""
+
+    def __init__(self, connect, breaker, ignore=(), slow_call_seconds=None, slow_call_exempt=(), name='database'):
+        # connect() -> (repositorio de desarrolladores, repositorio de admins)
+        self.connect = connect
+        self.breaker = breaker
+        # Excepciones que indican que la base de datos respondió (no abren el circuito)
+        self.ignore = tuple(ignore)
+        # Una llamada correcta pero más lenta que esto cuenta como fallo
+        self.slow_call_seconds = slow_call_seconds
+        # Métodos que pueden tardar por volumen (escrituras masivas): solo cuentan sus errores
+        self.slow_call_exempt = frozenset(slow_call_exempt)
+        self.name = name
+        self._repositories = None
+        self._last_error = None
+        self._connect_attempts = 0
+        self._lock = threading.Lock()
+        self.developers = GuardedRepository(self, 0)
+        self.admins = GuardedRepository(self, 1)
+
+    @property
+    def connected(self):
+        return self._repositories is not None
+
+    @property
+    def available(self):
+        """False mientras el circuito está abierto (modo degradado)"""
+        return self.breaker.state != OPEN
+
+    def repositories(self):
+        if self._repositories is not None:
+            return self._repositories
+        with self._lock:
+            if self._repositories is None:
+                self._connect_attempts += 1
+                self._repositories = self.call(self.connect, ignore=())
+                print(f"✅ [DB] Conexión establecida ({self.name}, intento {self._connect_attempts})")
+        return self._repositories
+
+    def call(self, func, *args, ignore=None, check_slow=True, **kwargs):
+        """Ejecuta func protegida por el breaker (check_slow=False: la lentitud no cuenta como fallo)"""
+        if not self.breaker.allow():
+            raise DatabaseUnavailableError(f"Base de datos {self.name} no disponible (circuito abierto)")
+        ignore = self.ignore if ignore is None else ignore
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except ignore:
+            self.breaker.record_success()
+            raise
+        except Exception as e:
+            self._last_error = f"{type(e).__name__}: {e}"[:300]
+            self.breaker.record_failure(type(e).__name__)
+            raise
+        elapsed = time.perf_counter() - started
+        if check_slow and self.slow_call_seconds and elapsed > self.slow_call_seconds:
+            self._last_error = f"llamada lenta: {elapsed:.1f}s"
+            self.breaker.record_failure('llamada lenta')
+        else:
+            self.breaker.record_success()
+        return result
+
+    def retry_after(self):
+        """Segundos hasta la siguiente llamada de prueba (cabecera Retry-After)"""
+        return max(1, int(self.breaker.snapshot()['retry_in_seconds'] or 1))
+
+    def snapshot(self):
+        return {
+            'name': self.name,
+            'connected': self.connected,
+            'connect_attempts': self._connect_attempts,
+            'last_error': self._last_error,
+            'breaker': self.breaker.snapshot(),
+        }
+
+
+class GuardedRepository:
+    """Proxy de un repositorio: cada método público pasa por DatabaseConnection.call"""
+
+    def __init__(self, connection, index):
+        self._connection = connection
+        self._index = index
+
+    def __getattr__(self, name):
+        attribute = getattr(self._connection.repositories()[self._index], name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        check_slow = name not in self._connection.slow_call_exempt
+
+        def guarded(*args, **kwargs):
+            return self._connection.call(attribute, *args, check_slow=check_slow, **kwargs)
+        return guarded
@@ -0,0 +1,123 @@
+"""
+🔢 Contador de desarrolladores en caché - DevPool Blockchain CLM
+Guarda en memoria el número de registrados para la página principal:
+  - dentro del TTL se sirve directamente de la caché
+  - pasado el TTL se sirve el valor anterior y se refresca en segundo plano
+    (stale-while-revalidate), con una sola consulta en vuelo a la vez
+  - pasado stale_ttl (o sin valor) se consulta de forma síncrona
+  - si la consulta falla se sigue sirviendo el último valor, marcado como
+    desactualizado (is_stale) hasta el siguiente refresco correcto
+Los registros y borrados ajustan el valor al momento; el refresco
+periódico corrige cualquier desviación.
+"""
+
+import threading
+import time
+
+
+class CachedCounter:
+    """Valor numérico cacheado con refresco stale-while-revalidate"""
+
+    def __init__(self, fetch, ttl=30, stale_ttl=300, name='counter'):
+        # fetch() -> int, hace la consulta real (p. ej. COUNT en Supabase)
+        self.fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.name = name
+        self._value = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._failing = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._counters = {'hits': 0, 'stale_served': 0, 'misses': 0,
+                          'refreshes': 0, 'refresh_errors': 0, 'adjustments': 0}
+
+    def _age(self):
+        return time.monotonic() - self._fetched_at
+
+    def get(self):
+        """Devuelve el valor; lanza la excepción de fetch() si nunca se pudo obtener"""
+        with self._lock:
+            if self._value is not None:
+                age = self._age()
+                if age < self.ttl:
+                    self._counters['hits'] += 1
+                    return self._value
+                if age < self.stale_ttl:
+                    self._counters['stale_served'] += 1
+                    if not self._refreshing:
+                        self._refreshing = True
+                        threading.Thread(target=self._background_refresh,
+                                         name=f"{self.name}-refresh", daemon=True).start()
+                    return self._value
+            self._counters['misses'] += 1
+        return self.refresh()
+
+    def refresh(self):
+        """Consulta el valor real y lo guarda en la caché"""
+        with self._refresh_lock:
+            # Otro hilo pudo refrescar mientras esperábamos el lock
+            with self._lock:
+                if self._value is not None and self._age() < self.ttl:
+                    return self._value
+            try:
+                value = int(self.fetch())
+            except Exception:
+                with self._lock:
+                    self._counters['refresh_errors'] += 1
+                    self._failing = True
+                    if self._value is not None:
+                        # Mejor un valor antiguo que un error en la portada
+                        return self._value
+                raise
+            with self._lock:
+                self._value = value
+                self._fetched_at = time.monotonic()
+                self._failing = False
+                self._counters['refreshes'] += 1
+                return value
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"⚠️ [COUNTER] No se pudo refrescar {self.name}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def adjust(self, delta):
+        """Ajuste optimista tras una escritura confirmada"""
+        with self._lock:
+            if self._value is not None:
+                self._value = max(0, self._value + delta)
+                self._counters['adjustments'] += 1
+
+    def increment(self, amount=1):
+        self.adjust(amount)
+
+    def decrement(self, amount=1):
+        self.adjust(-amount)
+
+    def is_stale(self):
+        """True si el valor que se sirve es de antes de un refresco fallido"""
+        with self._lock:
+            return self._value is not None and self._failing
+
+    def invalidate(self):
+        with self._lock:
+            self._value = None
+            self._fetched_at = 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'value': self._value,
+                'age_seconds': round(self._age(), 1) if self._value is not None else None,
+                'ttl': self.ttl,
+                'stale_ttl': self.stale_ttl,
+                'stale': self._value is not None and self._failing,
+                **self._counters,
+            }
@@ -0,0 +1,178 @@
+"""
+📤 Exportación en streaming - DevPool Blockchain CLM
+La exportación no carga la tabla entera ni escribe ficheros temporales:
+recorre developers por páginas de cursor (keyset sobre created_at, id,
+el mismo orden que el panel) y va escribiendo el resultado en la respuesta
+a medida que llegan las filas. La memoria depende del tamaño de página, no
+del número de registros.
+
+Formatos: json (array), ndjson (una fila por línea, lo más cómodo para ETL)
+y csv. Compresión opcional en streaming: gzip, o zstd si está instalado el
+paquete zstandard. Se puede pedir solo un subconjunto de columnas.
+"""
+
+import csv
+import io
+import json
+import zlib
+
+from developer_pages import encode_cursor
+from repository import DEVELOPER_FIELDS
+
+
+# Por debajo del max-rows de PostgREST (1000 por defecto): una página más
+# grande llegaría recortada
+DEFAULT_EXPORT_PAGE_SIZE = 500
+
+# formato -> (tipo MIME, extensión)
+FORMATS = {
+    'json': ('application/json', 'json'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv', 'csv'),
+}
+# compresión -> (tipo MIME, sufijo del fichero)
+COMPRESSIONS = {
+    'none': (None, ''),
+    'gzip': ('application/gzip', '.gz'),
+    'zstd': ('application/zstd', '.zst'),
+}
+# Columnas que necesita el cursor aunque no se exporten
+CURSOR_COLUMNS = ('id', 'created_at')
+
+
+def zstd_available():
+    try:
+        import zstandard  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def parse_columns(value):
+    """Columnas pedidas ('name,email'), en el orden pedido; todas si no se indica"""
+    if not value:
+        return DEVELOPER_FIELDS
+    columns = tuple(dict.fromkeys(column.strip() for column in value.split(',') if column.strip()))
+    unknown = [column for column in columns if column not in DEVELOPER_FIELDS]
+    if unknown or not columns:
+        raise ValueError(f"Columnas desconocidas: {', '.join(unknown) or value}")
+    return columns
+
+
+def iter_export_pages(developer_repo, page_size=DEFAULT_EXPORT_PAGE_SIZE, columns=DEVELOPER_FIELDS):
+    """
+    Páginas de filas con `columns`, de la más reciente a la más antigua (una
+    consulta por página). Termina con la primera página vacía, no con el
+    cursor de page(): si el servidor recorta las respuestas (max-rows de
+    PostgREST) la fila de más que lo calcula no llega y se cortaría a medias.
+    """
+    fetched = ', '.join(dict.fromkeys((*columns, *CURSOR_COLUMNS)))
+    extra = [column for column in CURSOR_COLUMNS if column not in columns]
+    cursor = None
+    while True:
+        rows, _ = developer_repo.page(None, cursor, page_size, fetched, max_page_size=page_size)
+        if not rows:
+            return
+        cursor = encode_cursor(rows[-1])
+        if extra:
+            rows = [{column: row.get(column) for column in columns} for row in rows]
+        yield rows
+
+
+def stream_json(pages, on_finish=None):
+    """
+    Fragmentos de un array JSON, uno por página. on_finish(filas) se llama
+    al terminar (no se llama si el recorrido falla a medias).
+    """
+    total = 0
+    yield '['
+    for rows in pages:
+        chunk = ',\n'.join(json.dumps(row, ensure_ascii=False, default=str) for row in rows)
+        yield ('\n' if total == 0 else ',\n') + chunk
+        total += len(rows)
+    yield '\n]\n' if total else ']\n'
+    if on_finish is not None:
+        on_finish(total)
+
+
+def stream_ndjson(pages, on_finish=None):
+    """Una fila JSON por línea; un fragmento por página"""
+    total = 0
+    for rows in pages:
+        yield ''.join(json.dumps(row, ensure_ascii=False, default=str) + '\n' for row in rows)
+        total += len(rows)
+    if on_finish is not None:
+        on_finish(total)
+
+
+# Columnas con listas: en CSV van separadas por comas dentro de la celda
+LIST_COLUMNS = frozenset({'skill_tags'})
+
+
+def _csv_rows(rows, columns):
+    lists = [i for i, column in enumerate(columns) if column in LIST_COLUMNS]
+    for row in rows:
+        # csv.writer ya escribe None como celda vacía: solo se convierten las listas
+        values = [row.get(column) for column in columns]
+        for i in lists:
+            if values[i] is not None:
+                values[i] = ', '.join(values[i])
+        yield values
+
+
+def stream_csv(pages, columns=DEVELOPER_FIELDS, on_finish=None):
+    """CSV con cabecera; un fragmento por página"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    total = 0
+    for rows in pages:
+        writer.writerows(_csv_rows(rows, columns))
+        total += len(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+    if on_finish is not None:
+        on_finish(total)
+
+
+def compress(chunks, method='none', level=None):
+    """Codifica los fragmentos en UTF-8 y los comprime sobre la marcha (un bloque por fragmento)"""
+    if method == 'gzip':
+        # wbits 31: cabecera y cola gzip (un .gz normal)
+        compressor = zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+        finish = compressor.flush
+    elif method == 'zstd':
+        import zstandard
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+        finish = compressor.flush
+    else:
+        for chunk in chunks:
+            yield chunk.encode('utf-8')
+        return
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield finish()
+
+
+def export_stream(pages, fmt='json', columns=DEVELOPER_FIELDS, compression='none', on_finish=None):
+    """Bytes de la exportación completa en el formato y compresión pedidos"""
+    if fmt == 'csv':
+        chunks = stream_csv(pages, columns, on_finish=on_finish)
+    elif fmt == 'ndjson':
+        chunks = stream_ndjson(pages, on_finish=on_finish)
+    else:
+        chunks = stream_json(pages, on_finish=on_finish)
+    return compress(chunks, compression)
+
+
+def export_filename(timestamp, fmt='json', compression='none'):
+    return f"developers_export_{timestamp}.{FORMATS[fmt][1]}{COMPRESSIONS[compression][1]}"
+
+
+def export_mimetype(fmt='json', compression='none'):
+    return COMPRESSIONS[compression][0] or FORMATS[fmt][0]
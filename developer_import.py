@@ -0,0 +1,326 @@
+"""
+📥 Importación masiva de desarrolladores - DevPool Blockchain CLM
+Lee JSON (array, como los developers_export_*.json), NDJSON o CSV en
+streaming, sin cargar el fichero entero en memoria; valida cada fila con
+las mismas reglas que /submit, resuelve duplicados por email normalizado
+(skip o merge) e inserta por lotes. Devuelve un informe con progreso y los
+errores de cada fila.
+"""
+
+import csv
+import io
+import json
+import re
+import time
+import uuid
+from datetime import datetime
+
+from email_identity import normalize_email
+from repository import DEVELOPER_FIELDS
+from skill_tags import normalize_skills
+
+
+SKIP = 'skip'
+MERGE = 'merge'
+
+FORMATS = ('json', 'ndjson', 'csv')
+EMAIL_PATTERN = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+IMPORT_FIELDS = ('name', 'email', 'skills', 'experience_years', 'portfolio_url', 'location', 'ip')
+
+
+class ImportFormatError(ValueError):
+    """El fichero no tiene un formato reconocible"""
+
+
+# ────────────────────────────────────────────────
+# Lectura en streaming
+
+def iter_json_array(stream, chunk_size=64 * 1024):
+    """Recorre un array JSON objeto a objeto leyendo el texto por bloques"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    started = False
+    eof = False
+
+    while True:
+        # Salta espacios y comas entre elementos
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            chunk = stream.read(chunk_size)
+            buffer, position = buffer[position:] + chunk, 0
+            eof = not chunk
+
+        if position >= len(buffer):
+            if not started:
+                raise ImportFormatError("Fichero JSON vacío")
+            raise ImportFormatError("Array JSON sin cerrar")
+
+        if not started:
+            if buffer[position] != '[':
+                raise ImportFormatError("Se esperaba un array JSON")
+            started = True
+            position += 1
+            continue
+
+        if buffer[position] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise ImportFormatError("JSON mal formado")
+            # El objeto está cortado entre dos bloques: se lee más
+            chunk = stream.read(chunk_size)
+            buffer, position = buffer[position:] + chunk, 0
+            eof = not chunk
+            continue
+        yield item
+        position = end
+
+
+def iter_ndjson(stream):
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            # Se devuelve el error como fila para que cuente en el informe
+            yield {'__error__': f"Línea {line_number}: JSON inválido ({e.msg})"}
+
+
+def iter_csv(stream):
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield {key.strip(): value for key, value in row.items() if key}
+
+
+def detect_format(filename=None, first_char=None):
+    name = (filename or '').lower()
+    for extension, file_format in (('.ndjson', 'ndjson'), ('.jsonl', 'ndjson'), ('.json', 'json'), ('.csv', 'csv')):
+        if name.endswith(extension):
+            return file_format
+    if first_char == '[':
+        return 'json'
+    if first_char == '{':
+        return 'ndjson'
+    return 'csv'
+
+
+def iter_records(binary_stream, file_format=None, filename=None):
+    """Filas del fichero (stream binario) como diccionarios"""
+    if not hasattr(binary_stream, 'peek'):
+        binary_stream = io.BufferedReader(binary_stream)
+    if file_format in (None, '', 'auto'):
+        # peek() no consume: solo mira el primer carácter significativo
+        head = binary_stream.peek(64)[:64].decode('utf-8-sig', errors='ignore').lstrip()
+        file_format = detect_format(filename, head[:1])
+    if file_format not in FORMATS:
+        raise ImportFormatError(f"Formato desconocido: {file_format}")
+
+    stream = io.TextIOWrapper(binary_stream, encoding='utf-8-sig', errors='replace', newline='')
+    if file_format == 'json':
+        return iter_json_array(stream)
+    if file_format == 'ndjson':
+        return iter_ndjson(stream)
+    return iter_csv(stream)
+
+
+# ────────────────────────────────────────────────
+# Validación
+
+def _clean_text(value, limit=500):
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value[:limit] or None
+
+
+def validate_developer(record):
+    """Devuelve (fila_limpia, None) o (None, mensaje_de_error) con las reglas de /submit"""
+    if not isinstance(record, dict):
+        return None, "La fila no es un objeto"
+    if '__error__' in record:
+        return None, record['__error__']
+
+    missing = [field for field in ('name', 'email', 'skills', 'experience_years')
+               if record.get(field) in (None, '') or not str(record.get(field)).strip()]
+    if missing:
+        return None, f"Campos requeridos faltantes: {', '.join(missing)}"
+
+    email = str(record['email']).strip().lower()
+    if not EMAIL_PATTERN.match(email):
+        return None, f"Email no válido: {email}"
+
+    try:
+        experience_years = int(str(record['experience_years']).strip())
+    except ValueError:
+        return None, "Años de experiencia debe ser un número"
+    if experience_years < 0 or experience_years > 50:
+        return None, "Años de experiencia debe estar entre 0 y 50"
+
+    try:
+        dev_id = str(uuid.UUID(str(record.get('id')))) if record.get('id') else str(uuid.uuid4())
+    except ValueError:
+        dev_id = str(uuid.uuid4())
+
+    skills = _clean_text(record['skills'], 1000)
+    created_at = record.get('created_at')
+    try:
+        created_at = datetime.fromisoformat(str(created_at)).isoformat() if created_at else None
+    except ValueError:
+        created_at = None
+
+    return {
+        'id': dev_id,
+        'name': _clean_text(record['name'], 200),
+        'email': email,
+        'email_normalized': normalize_email(email),
+        'skills': skills,
+        'skill_tags': normalize_skills(skills),
+        'experience_years': experience_years,
+        'portfolio_url': _clean_text(record.get('portfolio_url'), 500),
+        'location': _clean_text(record.get('location'), 200),
+        'ip': _clean_text(record.get('ip'), 100),
+        'created_at': created_at or datetime.now().isoformat(),
+    }, None
+
+
+def merge_developer(existing, incoming):
+    """Completa la fila existente con los valores no vacíos del fichero (conserva id y fecha)"""
+    # Solo columnas escribibles: search_vector es generada y Postgres rechaza el upsert
+    merged = {field: existing[field] for field in DEVELOPER_FIELDS if field in existing}
+    for field in IMPORT_FIELDS:
+        if incoming.get(field) not in (None, ''):
+            merged[field] = incoming[field]
+    merged['email_normalized'] = incoming['email_normalized']
+    merged['skill_tags'] = normalize_skills(merged.get('skills'))
+    merged['id'] = existing['id']
+    merged['created_at'] = existing.get('created_at') or incoming['created_at']
+    return merged
+
+
+# ────────────────────────────────────────────────
+# Importación por lotes
+
+class DeveloperImporter:
+    """Importa filas validadas en lotes de `chunk_size`"""
+
+    def __init__(self, developer_repo, mode=SKIP, chunk_size=500, dry_run=False, max_errors=1000,
+                 progress=None):
+        if mode not in (SKIP, MERGE):
+            raise ValueError(f"Modo de duplicados desconocido: {mode}")
+        self.repo = developer_repo
+        self.mode = mode
+        self.chunk_size = max(1, int(chunk_size))
+        self.dry_run = dry_run
+        self.max_errors = max_errors
+        # progress(report) se llama tras cada lote
+        self.progress = progress
+        self.report = {
+            'status': 'running',
+            'mode': mode,
+            'dry_run': dry_run,
+            'processed': 0,
+            'inserted': 0,
+            'merged': 0,
+            'skipped_duplicates': 0,
+            'errors': 0,
+            'error_rows': [],
+            'started_at': time.time(),
+            'finished_at': None,
+            'rows_per_second': None,
+        }
+        self._seen_emails = set()
+
+    def _error(self, row_number, message, email=None):
+        self.report['errors'] += 1
+        if len(self.report['error_rows']) < self.max_errors:
+            self.report['error_rows'].append({'row': row_number, 'email': email, 'error': message})
+
+    def run(self, records):
+        chunk = []
+        for row_number, record in enumerate(records, start=1):
+            self.report['processed'] += 1
+            developer, error = validate_developer(record)
+            if error:
+                email = record.get('email') if isinstance(record, dict) else None
+                self._error(row_number, error, email)
+                continue
+            if developer['email_normalized'] in self._seen_emails:
+                # Duplicado dentro del propio fichero: gana la primera aparición
+                self.report['skipped_duplicates'] += 1
+                continue
+            self._seen_emails.add(developer['email_normalized'])
+            chunk.append((row_number, developer))
+            if len(chunk) >= self.chunk_size:
+                self._flush(chunk)
+                chunk = []
+        self._flush(chunk)
+        self._finish('completed')
+        return self.report
+
+    def _flush(self, chunk):
+        if not chunk:
+            self._notify()
+            return
+        emails = [developer['email_normalized'] for _, developer in chunk]
+        # Columnas explícitas: '*' incluiría search_vector, que no se puede escribir
+        existing = {row['email_normalized']: row
+                    for row in self.repo.find_by_emails(emails, ', '.join(DEVELOPER_FIELDS))}
+
+        new_rows, merged_rows = [], []
+        for row_number, developer in chunk:
+            current = existing.get(developer['email_normalized'])
+            if current is None:
+                new_rows.append((row_number, developer))
+            elif self.mode == MERGE:
+                merged_rows.append((row_number, merge_developer(current, developer)))
+            else:
+                self.report['skipped_duplicates'] += 1
+
+        self._write(new_rows, self.repo.insert_many, 'inserted')
+        self._write(merged_rows, self.repo.upsert_many, 'merged')
+        self._notify()
+
+    def _write(self, rows, write, counter):
+        if not rows:
+            return
+        if self.dry_run:
+            self.report[counter] += len(rows)
+            return
+        try:
+            write([developer for _, developer in rows])
+            self.report[counter] += len(rows)
+        except Exception:
+            # El lote falló entero: se reintenta fila a fila para aislar las malas
+            for row_number, developer in rows:
+                try:
+                    write([developer])
+                    self.report[counter] += 1
+                except Exception as e:
+                    self._error(row_number, f"{type(e).__name__}: {e}", developer['email'])
+
+    def _notify(self):
+        elapsed = time.time() - self.report['started_at']
+        if elapsed > 0:
+            self.report['rows_per_second'] = round(self.report['processed'] / elapsed, 1)
+        if self.progress:
+            self.progress(self.report)
+
+    def _finish(self, status):
+        self.report['status'] = status
+        self.report['finished_at'] = time.time()
+        self._notify()
+
+    def fail(self, error):
+        """Marca la importación como fallida (error al leer el fichero o de la base de datos)"""
+        self.report['fatal_error'] = str(error)
+        self._finish('failed')
+        return self.report
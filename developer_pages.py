@@ -0,0 +1,130 @@
+"""
+📄 Paginación del panel admin - DevPool Blockchain CLM
+Paginación por cursor (keyset) sobre (created_at, id) en orden descendente:
+cada página pide solo `page_size + 1` filas a partir del último registro
+mostrado, con filtros aplicados en el servidor y solo las columnas que
+pinta la tarjeta. El coste de una página no depende del tamaño de la tabla
+(requiere el índice developers(created_at DESC, id DESC)).
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from skill_tags import canonical_skill, row_skill_tags
+
+
+# Columnas que muestra cada tarjeta del panel
+DASHBOARD_COLUMNS = 'id, name, email, skills, experience_years, portfolio_url, location, ip, created_at'
+
+DEFAULT_PAGE_SIZE = 30
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """El cursor de paginación no es válido"""
+
+
+def encode_cursor(row):
+    """Cursor opaco con la posición del último registro de la página"""
+    payload = json.dumps([row['created_at'], row['id']], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        created_at, dev_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return str(created_at), str(dev_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(str(e)) from e
+
+
+def _int_or_none(value):
+    try:
+        return int(value) if value not in (None, '') else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_filters(args):
+    """Filtros del panel a partir de los parámetros de la URL"""
+    filters = {
+        'location': (args.get('location') or '').strip()[:100] or None,
+        'skill': (args.get('skill') or '').strip()[:100] or None,
+        'min_experience': _int_or_none(args.get('min_experience')),
+        'max_experience': _int_or_none(args.get('max_experience')),
+    }
+    return {key: value for key, value in filters.items() if value is not None}
+
+
+def row_matches(filters, row):
+    """Indica si un desarrollador cumple los filtros (mismo criterio que apply_filters)"""
+    if 'location' in filters and filters['location'].lower() not in (row.get('location') or '').lower():
+        return False
+    if 'skill' in filters and canonical_skill(filters['skill']) not in row_skill_tags(row):
+        return False
+    experience = row.get('experience_years')
+    if 'min_experience' in filters and (experience is None or experience < filters['min_experience']):
+        return False
+    if 'max_experience' in filters and (experience is None or experience > filters['max_experience']):
+        return False
+    return True
+
+
+def _contains(value):
+    """Patrón ILIKE 'contiene' escapando los comodines que escriba el admin"""
+    escaped = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+def _quote(value):
+    """Valor entre comillas para los filtros or=(...) de PostgREST"""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def apply_filters(query, filters):
+    if 'location' in filters:
+        query = query.ilike('location', _contains(filters['location']))
+    if 'skill' in filters:
+        # Etiqueta canónica contra developers.skill_tags (índice GIN), no ILIKE sobre el texto
+        query = query.contains('skill_tags', [canonical_skill(filters['skill'])])
+    if 'min_experience' in filters:
+        query = query.gte('experience_years', filters['min_experience'])
+    if 'max_experience' in filters:
+        query = query.lte('experience_years', filters['max_experience'])
+    return query
+
+
+def fetch_page(table, filters=None, cursor=None, page_size=DEFAULT_PAGE_SIZE, columns=DASHBOARD_COLUMNS,
+               max_page_size=MAX_PAGE_SIZE):
+    """Devuelve (filas, cursor_siguiente) de una página del panel (o de la exportación)"""
+    page_size = max(1, min(int(page_size), max_page_size))
+    query = apply_filters(table.select(columns), filters or {})
+
+    position = decode_cursor(cursor)
+    if position:
+        created_at, dev_id = position
+        # Keyset: (created_at, id) < (cursor_created_at, cursor_id)
+        query = query.or_(
+            f"created_at.lt.{_quote(created_at)},"
+            f"and(created_at.eq.{_quote(created_at)},id.lt.{_quote(dev_id)})"
+        )
+
+    # Una fila de más para saber si hay página siguiente sin contar la tabla
+    response = query.order('created_at', desc=True).order('id', desc=True).limit(page_size + 1).execute()
+    rows = response.data or []
+    next_cursor = encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+    return rows[:page_size], next_cursor
+
+
+def format_created_at(value):
+    """Fecha de registro legible para la tarjeta"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)).strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return value
@@ -0,0 +1,347 @@
+"""
+🔎 Búsqueda de desarrolladores con facetas - DevPool Blockchain CLM
+Búsqueda por habilidades, nombre y ubicación con resultados ordenados por
+relevancia y recuentos por faceta (habilidades, ubicaciones y tramos de
+experiencia).
+  - supabase: columna tsvector ponderada + índice GIN y la función
+              search_developers() de schema.sql (una sola llamada RPC)
+  - sqlite:   SearchIndex, índice invertido en memoria que el repositorio
+              mantiene al día en cada alta, fusión y baja
+Ambos tokenizan igual: minúsculas, sin acentos, y cada palabra de la
+consulta se busca como prefijo ('sol' encuentra 'solidity').
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+from datetime import datetime
+from collections import Counter, defaultdict
+
+from skill_tags import canonical_skill, fold, row_skill_tags
+
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+# Peso de cada campo en la relevancia (como setweight A/B/C en Postgres)
+FIELD_WEIGHTS = {'skills': 3.0, 'name': 2.0, 'location': 1.0}
+EXPERIENCE_BUCKETS = (('0-1', 0, 1), ('2-4', 2, 4), ('5-9', 5, 9), ('10+', 10, None))
+RESULT_COLUMNS = ('id', 'name', 'email', 'skills', 'skill_tags', 'experience_years', 'portfolio_url', 'location',
+                  'created_at')
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+FACET_LIMIT = 10
+MAX_QUERY_TOKENS = 8
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(fold(text))
+
+
+def query_tokens(query):
+    """Palabras de la consulta (sin repetir, acotadas)"""
+    return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
+
+
+def build_tsquery(query):
+    """Consulta para to_tsquery('simple', ...): todas las palabras, como prefijo"""
+    return ' & '.join(f"{token}:*" for token in query_tokens(query))
+
+
+def experience_bucket(years):
+    if years is None:
+        return None
+    for label, low, high in EXPERIENCE_BUCKETS:
+        if years >= low and (high is None or years <= high):
+            return label
+    return None
+
+
+def _timestamp(created_at):
+    """Fecha como número: los desempates comparan floats, no cadenas"""
+    try:
+        return datetime.fromisoformat(str(created_at)).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def empty_facets():
+    return {'skills': [], 'locations': [], 'experience': []}
+
+
+class SearchIndex:
+    """
+    Índice invertido en memoria sobre skills, name y location.
+    Cada token y cada valor de faceta tiene el conjunto de ids y un bitset
+    (entero de Python, un bit por desarrollador): el total y las facetas de
+    una búsqueda son AND + bit_count() en C, sin recorrer los resultados.
+    Solo la relevancia se calcula desarrollador a desarrollador.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        # token -> {id: puntuación del token en ese desarrollador}
+        self._postings = defaultdict(dict)
+        self._docs = {}
+        # id -> posición del bit; las bajas dejan huecos hasta la siguiente reconstrucción
+        self._ordinals = {}
+        self._next_ordinal = 0
+        self._bits = {}
+        self._all_bits = 0
+        # (faceta, valor) -> ids; 'years' solo sirve para filtrar por experiencia
+        self._values = defaultdict(set)
+        self._created = {}
+        # (-fecha, id) ordenado: los más recientes primero, sin ordenar en cada búsqueda
+        self._recency = []
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+
+    def __len__(self):
+        return len(self._docs)
+
+    def build(self, rows):
+        with self._lock:
+            self._reset()
+            members = defaultdict(list)
+            for row in rows:
+                for key in self._add(row, bulk=True):
+                    members[key].append(self._ordinals[row['id']])
+            # Bitsets construidos de una vez (bit a bit serían cuadráticos)
+            size = self._next_ordinal // 8 + 1
+            for key, ordinals in members.items():
+                self._bits[key] = _bitset(ordinals, size)
+            self._all_bits = _bitset(list(self._ordinals.values()), size)
+            self._recency.sort()
+            self._vocabulary_dirty = True
+
+    def add(self, row):
+        """Alta o actualización incremental"""
+        with self._lock:
+            self._remove(row['id'])
+            bit = 1 << self._next_ordinal
+            for key in self._add(row):
+                self._bits[key] = self._bits.get(key, 0) | bit
+            self._all_bits |= bit
+
+    def remove(self, dev_id):
+        with self._lock:
+            self._remove(dev_id)
+
+    def _add(self, row, bulk=False):
+        """Registra la fila; devuelve las claves (token o faceta) a las que pertenece"""
+        dev_id = row['id']
+        doc = {column: row.get(column) for column in RESULT_COLUMNS}
+        doc['skill_tags'] = row_skill_tags(row)
+        terms = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(row.get(field)):
+                terms[token] += weight
+        bucket = experience_bucket(doc['experience_years'])
+        facet_keys = (
+            [('skills', tag) for tag in dict.fromkeys(doc['skill_tags'])]
+            + ([('locations', doc['location'])] if doc['location'] else [])
+            + ([('experience', bucket)] if bucket else [])
+            + [('years', doc['experience_years'])]
+        )
+        doc['_keys'] = tuple(('term', token) for token in terms) + tuple(facet_keys)
+        self._docs[dev_id] = doc
+        self._ordinals[dev_id] = self._next_ordinal
+        self._next_ordinal += 1
+
+        created = _timestamp(row.get('created_at'))
+        self._created[dev_id] = created
+        if bulk:
+            self._recency.append((-created, dev_id))
+        else:
+            bisect.insort(self._recency, (-created, dev_id))
+
+        for key in facet_keys:
+            self._values[key].add(dev_id)
+        for token, score in terms.items():
+            if token not in self._postings:
+                self._vocabulary_dirty = True
+            self._postings[token][dev_id] = score
+        return doc['_keys']
+
+    def _remove(self, dev_id):
+        doc = self._docs.pop(dev_id, None)
+        if doc is None:
+            return
+        mask = ~(1 << self._ordinals.pop(dev_id))
+        self._all_bits &= mask
+        position = bisect.bisect_left(self._recency, (-self._created.pop(dev_id), dev_id))
+        del self._recency[position]
+        for key in doc['_keys']:
+            bits = self._bits.get(key, 0) & mask
+            if bits:
+                self._bits[key] = bits
+            else:
+                self._bits.pop(key, None)
+            kind, value = key
+            if kind == 'term':
+                postings = self._postings.get(value)
+                if postings is not None:
+                    postings.pop(dev_id, None)
+                    if not postings:
+                        del self._postings[value]
+                        self._vocabulary_dirty = True
+            else:
+                ids = self._values.get(key)
+                if ids is not None:
+                    ids.discard(dev_id)
+                    if not ids:
+                        del self._values[key]
+
+    def _expand(self, prefix):
+        """Tokens del vocabulario que empiezan por `prefix` (búsqueda binaria)"""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + '\uffff')
+        return self._vocabulary[start:end]
+
+    def _allowed(self, filters):
+        """(ids, bitset) que cumplen los filtros del panel (mismo criterio que row_matches)"""
+        conditions = []
+        if 'location' in filters:
+            needle = filters['location'].lower()
+            conditions.append(lambda kind, value: kind == 'locations' and needle in value.lower())
+        if 'skill' in filters:
+            tag = canonical_skill(filters['skill'])
+            conditions.append(lambda kind, value: kind == 'skills' and value == tag)
+        if 'min_experience' in filters or 'max_experience' in filters:
+            low = filters.get('min_experience', 0)
+            high = filters.get('max_experience')
+            conditions.append(lambda kind, value: kind == 'years' and value is not None and value >= low
+                              and (high is None or value <= high))
+
+        ids, bits = None, None
+        for condition in conditions:
+            keys = [key for key in self._values if condition(*key)]
+            condition_ids = set().union(*(self._values[key] for key in keys))
+            condition_bits = 0
+            for key in keys:
+                condition_bits |= self._bits.get(key, 0)
+            ids = condition_ids if ids is None else ids & condition_ids
+            bits = condition_bits if bits is None else bits & condition_bits
+        return ids, bits
+
+    def _score(self, tokens):
+        """({id: puntuación}, bitset); cada palabra de la consulta debe aparecer (AND), como prefijo"""
+        total_docs = max(len(self._docs), 1)
+        scores, bits = None, self._all_bits
+        for token in tokens:
+            token_scores, token_bits = None, 0
+            for term in self._expand(token):
+                postings = self._postings[term]
+                token_bits |= self._bits.get(('term', term), 0)
+                weight = math.log(1 + total_docs / len(postings)) * (1.0 if term == token else 0.5)
+                if token_scores is None:
+                    token_scores = {dev_id: score * weight for dev_id, score in postings.items()}
+                else:
+                    for dev_id, score in postings.items():
+                        token_scores[dev_id] = token_scores.get(dev_id, 0.0) + score * weight
+            if token_scores is None:
+                return {}, 0
+            bits &= token_bits
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {dev_id: scores[dev_id] + value
+                          for dev_id, value in token_scores.items() if dev_id in scores}
+            if not scores:
+                return {}, 0
+        return scores, bits
+
+    def search(self, query='', filters=None, limit=DEFAULT_LIMIT, facet_limit=FACET_LIMIT):
+        """{'total', 'results', 'facets', 'took_ms'}; results ordenados por relevancia"""
+        started = time.perf_counter()
+        filters = filters or {}
+        limit = max(1, min(int(limit), MAX_LIMIT))
+        tokens = query_tokens(query)
+
+        with self._lock:
+            allowed_ids, allowed_bits = self._allowed(filters) if filters else (None, None)
+            if tokens:
+                scores, matches = self._score(tokens)
+                if allowed_ids is not None:
+                    scores = {dev_id: score for dev_id, score in scores.items() if dev_id in allowed_ids}
+                    matches &= allowed_bits
+                top = self._top_scored(scores, limit)
+            else:
+                matches = allowed_bits
+                top = [(dev_id, 0.0) for dev_id in self._newest(allowed_ids, limit)]
+
+            facets = {facet: [] for facet in ('skills', 'locations', 'experience')}
+            for key, ids in self._values.items():
+                facet, value = key
+                if facet not in facets:
+                    continue
+                count = len(ids) if matches is None else (matches & self._bits.get(key, 0)).bit_count()
+                if count:
+                    facets[facet].append((value, count))
+            for facet, values in facets.items():
+                if facet == 'experience':
+                    order = [label for label, _, _ in EXPERIENCE_BUCKETS]
+                    values.sort(key=lambda item: order.index(item[0]))
+                else:
+                    # Mismo orden que la función SQL: más frecuentes y, a igualdad, alfabético
+                    values = heapq.nsmallest(facet_limit, values, key=lambda item: (-item[1], item[0]))
+                facets[facet] = [{'value': value, 'count': count} for value, count in values]
+
+            results = [{**{column: self._docs[dev_id][column] for column in RESULT_COLUMNS},
+                        'rank': round(rank, 4)}
+                       for dev_id, rank in top]
+            total = len(self._docs) if matches is None else matches.bit_count()
+
+        return {
+            'total': total,
+            'results': results,
+            'facets': facets,
+            'took_ms': round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _top_scored(self, scores, limit):
+        """Los `limit` mejores por puntuación y, a igualdad, los más recientes"""
+        if not scores:
+            return []
+        threshold = heapq.nlargest(limit, scores.values())[-1]
+        above = sorted((dev_id for dev_id, score in scores.items() if score > threshold),
+                       key=lambda dev_id: (scores[dev_id], self._created[dev_id]), reverse=True)
+        # Los empates (muy habituales con una sola palabra) se resuelven solo por fecha
+        ties = {dev_id for dev_id, score in scores.items() if score == threshold}
+        return [(dev_id, scores[dev_id]) for dev_id in above + self._newest(ties, limit - len(above))]
+
+    def _newest(self, ids, limit):
+        """Los `limit` más recientes de `ids` (None = todos)"""
+        if ids is None:
+            return [dev_id for _, dev_id in self._recency[:limit]]
+        if len(ids) * len(ids) < limit * len(self._recency):
+            # Pocos candidatos: se ordenan ellos
+            return heapq.nlargest(limit, ids, key=self._created.__getitem__)
+        # Muchos candidatos: se recorre el orden por fecha hasta completar
+        newest = []
+        for _, dev_id in self._recency:
+            if dev_id in ids:
+                newest.append(dev_id)
+                if len(newest) >= limit:
+                    break
+        return newest
+
+
+def _bitset(ordinals, size):
+    if len(ordinals) < 16:
+        # Términos raros (nombres propios): unos pocos desplazamientos salen más baratos
+        bits = 0
+        for ordinal in ordinals:
+            bits |= 1 << ordinal
+        return bits
+    buffer = bytearray(size)
+    for ordinal in ordinals:
+        buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(buffer, 'little')
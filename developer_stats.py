@@ -0,0 +1,82 @@
+"""
+📊 Estadísticas de registros - DevPool Blockchain CLM
+Los totales viven en la tabla developer_stats (dimensión, valor, total),
+que mantienen triggers de la base de datos en cada alta, cambio y baja de
+developers (también las de otros workers, importaciones y scripts):
+  total       ''            todos los registrados
+  day         '2025-01-31'  registros por día (fecha UTC)
+  week        '2025-01-27'  registros por semana (lunes de la semana)
+  location    'Toledo'      por ubicación ('' = sin indicar)
+  experience  '4'           histograma de años de experiencia
+  skill       'Solidity'    por etiqueta de habilidad (skill_tags)
+Leer el resumen cuesta lo mismo con 100 que con 10 millones de filas: solo
+se consultan los días/semanas de la ventana y los N valores más frecuentes.
+Si los totales se desajustan (restauraciones, cambios manuales), se
+recalculan desde cero con rebuild_stats.py.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+
+DIMENSIONS = ('total', 'day', 'week', 'location', 'experience', 'skill')
+
+DEFAULT_DAYS = 30
+DEFAULT_WEEKS = 12
+DEFAULT_TOP = 10
+MAX_DAYS = 366
+MAX_WEEKS = 104
+MAX_TOP = 50
+
+
+def clamp_window(days=DEFAULT_DAYS, weeks=DEFAULT_WEEKS, top=DEFAULT_TOP):
+    """Ventana pedida por el cliente, acotada para que la respuesta tenga tamaño fijo"""
+    return (max(1, min(int(days), MAX_DAYS)),
+            max(1, min(int(weeks), MAX_WEEKS)),
+            max(1, min(int(top), MAX_TOP)))
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def window_start(days, weeks, today=None):
+    """(primer día, primer lunes) de la ventana, como cadenas ISO comparables con los valores"""
+    today = today or datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=days - 1)
+    first_week = week_start(today) - timedelta(weeks=weeks - 1)
+    return first_day.isoformat(), first_week.isoformat()
+
+
+def _series(totals, first, count, step):
+    """Serie continua (con ceros) desde `first`, para que el gráfico no salte huecos"""
+    return [{'bucket': (first + step * i).isoformat(), 'count': totals.get((first + step * i).isoformat(), 0)}
+            for i in range(count)]
+
+
+def summarize(rows, days=DEFAULT_DAYS, weeks=DEFAULT_WEEKS, today=None):
+    """
+    Resumen del panel a partir de las filas de developer_stats ya acotadas
+    (dimension, bucket, total) que devuelve el repositorio.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    grouped = {dimension: {} for dimension in DIMENSIONS}
+    for row in rows:
+        if row['total'] > 0 and row['dimension'] in grouped:
+            grouped[row['dimension']][row['bucket']] = row['total']
+
+    def top(dimension):
+        ranked = sorted(grouped[dimension].items(), key=lambda item: (-item[1], item[0]))
+        return [{'value': value or None, 'count': total} for value, total in ranked]
+
+    return {
+        'total': grouped['total'].get('', 0),
+        'per_day': _series(grouped['day'], today - timedelta(days=days - 1), days, timedelta(days=1)),
+        'per_week': _series(grouped['week'], week_start(today) - timedelta(weeks=weeks - 1), weeks,
+                            timedelta(weeks=1)),
+        'locations': top('location'),
+        'experience': [{'years': int(years), 'count': total}
+                       for years, total in sorted(grouped['experience'].items(), key=lambda item: int(item[0]))],
+        'skills': top('skill'),
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+    }
+
@@ -0,0 +1,160 @@
+"""
+📇 Identidad por email - DevPool Blockchain CLM
+normalize_email() reduce las variantes de un mismo buzón a una sola clave
+(mayúsculas, espacios, +etiquetas, puntos de Gmail, googlemail.com), que la
+base de datos protege con un índice único (developers.email_normalized).
+
+EmailIndex es un conjunto en memoria de esas claves, cargado al arrancar y
+actualizado en cada alta/baja de este worker:
+  - si la clave no está, el registro va directo al INSERT (sin SELECT previo)
+  - si está, es un duplicado y se responde sin consultar la base de datos
+Guarda huellas de 64 bits en lugar de los emails (menos memoria y sin datos
+personales). A diferencia de un filtro de Bloom admite bajas y no da falsos
+positivos. Las altas y bajas de otros workers se recogen con la recarga
+periódica; mientras tanto el índice único de la base de datos es la garantía.
+"""
+
+import hashlib
+import threading
+import time
+
+
+# Proveedores que ignoran los puntos de la parte local
+DOTLESS_DOMAINS = {'gmail.com'}
+DOMAIN_ALIASES = {'googlemail.com': 'gmail.com'}
+
+
+def normalize_email(email):
+    """Clave canónica del buzón: 'Ana.Perez+web@GoogleMail.com ' -> 'anaperez@gmail.com'"""
+    email = (email or '').strip().lower()
+    local, at, domain = email.rpartition('@')
+    if not at or not local:
+        return email
+    domain = DOMAIN_ALIASES.get(domain, domain)
+    local = local.split('+', 1)[0] or local
+    if domain in DOTLESS_DOMAINS:
+        local = local.replace('.', '')
+    return f"{local}@{domain}"
+
+
+def _fingerprint(key):
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class EmailIndex:
+    """Conjunto en memoria de emails normalizados ya registrados"""
+
+    def __init__(self, loader=None, refresh_interval=600, name='emails'):
+        # loader() -> iterable de emails normalizados (recorrido completo de la tabla)
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.name = name
+        self._keys = set()
+        self._ready = False
+        self._loaded_at = 0.0
+        self._loading = False
+        # Altas/bajas ocurridas durante una recarga, para no perderlas al sustituir el conjunto
+        self._pending = None
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'not_ready': 0, 'loads': 0, 'load_errors': 0}
+
+    @property
+    def ready(self):
+        return self._ready
+
+    def contains(self, key):
+        """True si el email ya está registrado; False si no consta (o el índice aún no cargó)"""
+        with self._lock:
+            if self._ready:
+                self._maybe_refresh()
+            # Antes de la carga solo constan las altas de este worker, pero son ciertas
+            if _fingerprint(key) in self._keys:
+                self._counters['hits'] += 1
+                return True
+            self._counters['misses' if self._ready else 'not_ready'] += 1
+            return False
+
+    def add(self, key):
+        self._apply(True, key)
+
+    def discard(self, key):
+        self._apply(False, key)
+
+    def _apply(self, present, key):
+        if not key:
+            return
+        fingerprint = _fingerprint(key)
+        with self._lock:
+            if present:
+                self._keys.add(fingerprint)
+            else:
+                self._keys.discard(fingerprint)
+            if self._pending is not None:
+                self._pending.append((present, fingerprint))
+
+    def _maybe_refresh(self):
+        # Llamado con el lock tomado
+        if self.loader and not self._loading and time.monotonic() - self._loaded_at > self.refresh_interval:
+            self._loading = True
+            threading.Thread(target=self._background_load, name=f"{self.name}-index", daemon=True).start()
+
+    def load(self):
+        """Recorre la tabla y sustituye el conjunto (las escrituras concurrentes se conservan)"""
+        with self._lock:
+            self._pending = []
+            self._loading = True
+        try:
+            keys = {_fingerprint(key) for key in self.loader() if key}
+        except Exception:
+            with self._lock:
+                self._pending = None
+                self._loading = False
+                self._counters['load_errors'] += 1
+                # Se reintenta en el siguiente intervalo
+                self._loaded_at = time.monotonic()
+            raise
+        with self._lock:
+            for present, fingerprint in self._pending:
+                if present:
+                    keys.add(fingerprint)
+                else:
+                    keys.discard(fingerprint)
+            self._keys = keys
+            self._pending = None
+            self._ready = True
+            self._loading = False
+            self._loaded_at = time.monotonic()
+            self._counters['loads'] += 1
+            return len(keys)
+
+    def _background_load(self):
+        try:
+            size = self.load()
+            print(f"📇 [EMAIL INDEX] {size} emails cargados ({self.name})")
+        except Exception as e:
+            print(f"⚠️ [EMAIL INDEX] No se pudo cargar {self.name}: {e}")
+
+    def warm(self):
+        """Carga inicial en segundo plano (el arranque no espera a la base de datos)"""
+        with self._lock:
+            if self._loading or not self.loader:
+                return
+            self._loading = True
+        threading.Thread(target=self._background_load, name=f"{self.name}-index", daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._keys = set()
+            self._ready = False
+            self._loaded_at = 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'ready': self._ready,
+                'size': len(self._keys),
+                'age_seconds': round(time.monotonic() - self._loaded_at, 1) if self._ready else None,
+                'refresh_interval': self.refresh_interval,
+                **self._counters,
+            }
@@ -0,0 +1,274 @@
+"""
+📬 Outbox de emails - DevPool Blockchain CLM
+Cola acotada + pool de workers en segundo plano para que /submit
+responda sin esperar al SMTP. Con un spool configurado, cada trabajo
+se persiste antes de enviarse y los fallos se reintentan.
+"""
+
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime
+
+
+class OutboxFullError(Exception):
+    """La cola del outbox está llena"""
+
+
+class EmailOutbox:
+    """Cola de trabajos de email con un número fijo de workers"""
+
+    def __init__(self, workers=2, max_queue=500, history_size=1000, context_factory=None,
+                 spool=None, poll_interval=5):
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+        self.history_size = max(1, int(history_size))
+        # context_factory permite ejecutar cada trabajo dentro de app.app_context()
+        self.context_factory = context_factory
+        # spool: EmailSpool opcional para persistir y reintentar los envíos
+        self.spool = spool
+        self.poll_interval = poll_interval
+
+        self._handlers = {}
+        self._queue = queue.Queue(maxsize=self.max_queue)
+        self._jobs = OrderedDict()
+        self._latencies = deque(maxlen=200)
+        self._counters = {'enqueued': 0, 'sent': 0, 'failed': 0, 'retried': 0, 'rejected': 0}
+        self._lock = threading.Lock()
+        self._threads = []
+        self._started_pid = None
+
+    def register(self, kind, handler):
+        """Asocia un tipo de email con la función que lo envía (devuelve bool)"""
+        self._handlers[kind] = handler
+
+    # ────────────────────────────────────────────────
+    # Ciclo de vida
+    def _ensure_started(self):
+        """Arranca los workers de forma perezosa (seguro tras el fork de gunicorn)"""
+        pid = os.getpid()
+        if self._started_pid == pid and all(t.is_alive() for t in self._threads):
+            return
+        with self._lock:
+            if self._started_pid == pid and all(t.is_alive() for t in self._threads):
+                return
+            self._threads = [t for t in self._threads if t.is_alive()] if self._started_pid == pid else []
+            running = {t.name for t in self._threads}
+            for i in range(self.workers):
+                name = f"email-outbox-{i}"
+                if name not in running:
+                    thread = threading.Thread(target=self._worker_loop, name=name, daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+            if self.spool is not None and 'email-outbox-retry' not in running:
+                thread = threading.Thread(target=self._retry_loop, name='email-outbox-retry', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            self._started_pid = pid
+            print(f"📬 [OUTBOX] {self.workers} workers iniciados (cola máx. {self.max_queue})")
+
+    def start(self):
+        """Arranca workers y reintentos sin esperar al primer envío"""
+        self._ensure_started()
+
+    def _worker_loop(self):
+        while True:
+            job_id = self._queue.get()
+            try:
+                self._run_job(job_id)
+            finally:
+                self._queue.task_done()
+
+    def _retry_loop(self):
+        """Recoge del spool los reintentos pendientes (también los de procesos anteriores)"""
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                free = self.max_queue - self._queue.qsize()
+                if free <= 0:
+                    continue
+                for record in self.spool.claim_due(limit=min(free, 50)):
+                    self._track(record['id'], record['kind'], record['payload'], record['attempts'])
+                    try:
+                        self._queue.put_nowait(record['id'])
+                    except queue.Full:
+                        break
+                    with self._lock:
+                        self._counters['retried'] += 1
+                self.spool.purge_sent()
+            except Exception as e:
+                print(f"❌ [OUTBOX] Error leyendo reintentos del spool: {type(e).__name__}: {e}")
+
+    def _track(self, job_id, kind, payload, attempts=0):
+        job = {
+            'id': job_id,
+            'kind': kind,
+            'payload': payload,
+            'status': 'queued',
+            'attempts': attempts,
+            'enqueued_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'latency_ms': None,
+            'send_ms': None,
+            'error': None,
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+            self._jobs.move_to_end(job_id)
+            while len(self._jobs) > self.history_size:
+                self._jobs.popitem(last=False)
+        return job
+
+    def _run_job(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job['status'] = 'sending'
+        job['started_at'] = time.time()
+        job['attempts'] += 1
+
+        result = False
+        try:
+            handler = self._handlers[job['kind']]
+            if self.context_factory:
+                with self.context_factory():
+                    result = handler(**job['payload'])
+            else:
+                result = handler(**job['payload'])
+            if not result:
+                job['error'] = 'El envío devolvió False'
+        except Exception as e:
+            job['error'] = f"{type(e).__name__}: {e}"
+            print(f"❌ [OUTBOX] Trabajo {job_id} ({job['kind']}) falló: {job['error']}")
+
+        finished = time.time()
+        job['finished_at'] = finished
+        job['latency_ms'] = round((finished - job['enqueued_at']) * 1000, 1)
+        job['send_ms'] = round((finished - job['started_at']) * 1000, 1)
+        job['status'] = 'sent' if result else 'failed'
+
+        if self.spool is not None:
+            try:
+                if result:
+                    self.spool.mark_sent(job_id)
+                else:
+                    # 'pending' = reintento programado, 'dead' = intentos agotados
+                    spool_status = self.spool.mark_failed(job_id, job['error'])
+                    job['status'] = 'retrying' if spool_status == 'pending' else 'dead'
+            except Exception as e:
+                print(f"❌ [OUTBOX] Error actualizando el spool: {type(e).__name__}: {e}")
+
+        with self._lock:
+            self._latencies.append(job['latency_ms'])
+            self._counters['sent' if result else 'failed'] += 1
+
+        print(f"📬 [OUTBOX] Trabajo {job_id} ({job['kind']}) -> {job['status']} en {job['latency_ms']} ms")
+
+    # ────────────────────────────────────────────────
+    # API pública
+    def enqueue(self, kind, **payload):
+        """Persiste (si hay spool) y encola un envío; devuelve su job id sin bloquear"""
+        if kind not in self._handlers:
+            raise ValueError(f"Tipo de email no registrado: {kind}")
+        self._ensure_started()
+
+        job_id = str(uuid.uuid4())
+        if self.spool is not None:
+            self.spool.add(kind, payload, job_id=job_id)
+        job = self._track(job_id, kind, payload)
+
+        try:
+            self._queue.put_nowait(job_id)
+        except queue.Full:
+            with self._lock:
+                self._counters['rejected'] += 1
+            if self.spool is not None:
+                # Queda en el spool: el bucle de reintentos lo enviará cuando haya hueco
+                self.spool.release(job_id)
+                job['status'] = 'retrying'
+                print(f"⚠️ [OUTBOX] Cola llena, trabajo {kind} aplazado en el spool")
+                return job_id
+            job['status'] = 'rejected'
+            job['error'] = 'Cola de emails llena'
+            print(f"⚠️ [OUTBOX] Cola llena, trabajo {kind} rechazado")
+            raise OutboxFullError(job_id)
+
+        with self._lock:
+            self._counters['enqueued'] += 1
+        return job_id
+
+    def get_job(self, job_id):
+        """Devuelve una copia serializable del estado de un trabajo"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return self._spool_job(job_id)
+        snapshot = {key: value for key, value in job.items() if key != 'payload'}
+        for key in ('enqueued_at', 'started_at', 'finished_at'):
+            if snapshot[key] is not None:
+                snapshot[key] = datetime.fromtimestamp(snapshot[key]).isoformat()
+        return snapshot
+
+    def _spool_job(self, job_id):
+        # Trabajos de otro worker o de antes de un reinicio: se consultan en el spool
+        if self.spool is None:
+            return None
+        record = self.spool.get(job_id)
+        if record is None:
+            return None
+        status = record['status']
+        if status == 'pending':
+            status = 'retrying' if record['attempts'] else 'queued'
+        return {
+            'id': record['id'],
+            'kind': record['kind'],
+            'status': status,
+            'attempts': record['attempts'],
+            'enqueued_at': datetime.fromtimestamp(record['created_at']).isoformat(),
+            'next_attempt_at': datetime.fromtimestamp(record['next_attempt_at']).isoformat(),
+            'error': record['last_error'],
+        }
+
+    def wait_idle(self, timeout=None):
+        """Espera a que la cola se vacíe (útil en tests y al apagar)"""
+        deadline = None if timeout is None else time.time() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.time() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stats(self):
+        """Profundidad de cola, latencias y resultados"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counters = dict(self._counters)
+            in_flight = sum(1 for job in self._jobs.values() if job['status'] == 'sending')
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+        stats = {
+            'queue_depth': self._queue.qsize(),
+            'max_queue': self.max_queue,
+            'workers': self.workers,
+            'in_flight': in_flight,
+            'counters': counters,
+            'latency_ms': {
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'max': latencies[-1] if latencies else None,
+                'samples': len(latencies),
+            },
+        }
+        if self.spool is not None:
+            try:
+                stats['spool'] = self.spool.stats()
+            except Exception as e:
+                stats['spool'] = {'error': str(e)}
+        return stats
@@ -0,0 +1,196 @@
+"""
+📦 Spool duradero de emails - DevPool Blockchain CLM
+Cada email se registra en SQLite antes de intentar enviarlo. Los fallos
+se reintentan con backoff exponencial + jitter y, agotados los intentos,
+quedan como dead letters para reenviarlos o purgarlos desde el CLI.
+"""
+
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+
+
+PENDING = 'pending'
+SENT = 'sent'
+DEAD = 'dead'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS email_spool (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    lease_until REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_email_spool_due ON email_spool (status, next_attempt_at);
+"""
+
+
+class EmailSpool:
+    """Registro persistente de emails salientes con reintentos"""
+
+    def __init__(self, path, max_attempts=6, base_delay=30, max_delay=3600, lease_seconds=300):
+        self.path = path
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lease_seconds = lease_seconds
+        self._pid = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # Una conexión por proceso (las heredadas del fork no son seguras)
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            # WAL + synchronous=NORMAL: los commits no hacen fsync, el WAL se
+            # sincroniza por lotes en cada checkpoint
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _execute(self, sql, params=()):
+        """Ejecuta una escritura y devuelve las filas afectadas"""
+        with self._lock:
+            return self._connection().execute(sql, params).rowcount
+
+    def _fetchall(self, sql, params=()):
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def _row_to_dict(self, row):
+        record = dict(row)
+        record['payload'] = json.loads(record['payload'])
+        return record
+
+    def _backoff(self, attempts):
+        """Retardo exponencial con jitter completo, acotado a max_delay"""
+        delay = min(self.max_delay, self.base_delay * (2 ** max(0, attempts - 1)))
+        return random.uniform(delay / 2, delay)
+
+    # ────────────────────────────────────────────────
+    # Escritura desde la aplicación
+    def add(self, kind, payload, job_id=None):
+        """Registra un email antes de enviarlo; queda arrendado por este proceso"""
+        job_id = job_id or str(uuid.uuid4())
+        now = time.time()
+        self._execute(
+            "INSERT INTO email_spool (id, kind, payload, status, attempts, next_attempt_at, "
+            "lease_until, created_at, updated_at) VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+            (job_id, kind, json.dumps(payload, ensure_ascii=False, default=str), PENDING,
+             now, now + self.lease_seconds, now, now),
+        )
+        return job_id
+
+    def mark_sent(self, job_id):
+        now = time.time()
+        self._execute(
+            "UPDATE email_spool SET status = ?, attempts = attempts + 1, lease_until = NULL, "
+            "last_error = NULL, updated_at = ? WHERE id = ?",
+            (SENT, now, job_id),
+        )
+
+    def mark_failed(self, job_id, error):
+        """Programa el siguiente reintento o pasa el mensaje a dead letter"""
+        row = self.get(job_id)
+        if row is None:
+            return None
+        attempts = row['attempts'] + 1
+        now = time.time()
+        if attempts >= self.max_attempts:
+            status, next_attempt = DEAD, now
+        else:
+            status, next_attempt = PENDING, now + self._backoff(attempts)
+        self._execute(
+            "UPDATE email_spool SET status = ?, attempts = ?, next_attempt_at = ?, lease_until = NULL, "
+            "last_error = ?, updated_at = ? WHERE id = ?",
+            (status, attempts, next_attempt, error, now, job_id),
+        )
+        return status
+
+    def release(self, job_id):
+        """Libera el arriendo para que el bucle de reintentos lo recoja cuanto antes"""
+        self._execute("UPDATE email_spool SET lease_until = NULL WHERE id = ?", (job_id,))
+
+    def claim_due(self, limit=50):
+        """Arrienda los mensajes pendientes cuyo reintento ya toca"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT id FROM email_spool WHERE status = ? AND next_attempt_at <= ? "
+                "AND (lease_until IS NULL OR lease_until < ?) ORDER BY next_attempt_at LIMIT ?",
+                (PENDING, now, now, limit),
+            ).fetchall()
+            claimed = []
+            for row in rows:
+                # El UPDATE condicional evita que dos workers tomen el mismo mensaje
+                cursor = conn.execute(
+                    "UPDATE email_spool SET lease_until = ? WHERE id = ? "
+                    "AND (lease_until IS NULL OR lease_until < ?)",
+                    (now + self.lease_seconds, row['id'], now),
+                )
+                if cursor.rowcount:
+                    claimed.append(row['id'])
+            if not claimed:
+                return []
+            placeholders = ','.join('?' * len(claimed))
+            return [self._row_to_dict(r) for r in conn.execute(
+                f"SELECT * FROM email_spool WHERE id IN ({placeholders})", claimed).fetchall()]
+
+    # ────────────────────────────────────────────────
+    # Consulta y administración
+    def get(self, job_id):
+        rows = self._fetchall("SELECT * FROM email_spool WHERE id = ?", (job_id,))
+        return self._row_to_dict(rows[0]) if rows else None
+
+    def list(self, status=None, limit=100):
+        if status:
+            rows = self._fetchall("SELECT * FROM email_spool WHERE status = ? ORDER BY created_at LIMIT ?",
+                                  (status, limit))
+        else:
+            rows = self._fetchall("SELECT * FROM email_spool ORDER BY created_at LIMIT ?", (limit,))
+        return [self._row_to_dict(r) for r in rows]
+
+    def replay_dead(self, ids=None):
+        """Devuelve dead letters a la cola para reintentarlas desde cero"""
+        now = time.time()
+        sql = ("UPDATE email_spool SET status = ?, attempts = 0, next_attempt_at = ?, lease_until = NULL, "
+               "updated_at = ? WHERE status = ?")
+        params = [PENDING, now, now, DEAD]
+        if ids:
+            sql += f" AND id IN ({','.join('?' * len(ids))})"
+            params.extend(ids)
+        return self._execute(sql, params)
+
+    def purge_dead(self, ids=None):
+        sql = "DELETE FROM email_spool WHERE status = ?"
+        params = [DEAD]
+        if ids:
+            sql += f" AND id IN ({','.join('?' * len(ids))})"
+            params.extend(ids)
+        return self._execute(sql, params)
+
+    def purge_sent(self, older_than_seconds=86400):
+        cutoff = time.time() - older_than_seconds
+        return self._execute("DELETE FROM email_spool WHERE status = ? AND updated_at < ?",
+                             (SENT, cutoff))
+
+    def stats(self):
+        rows = self._fetchall("SELECT status, COUNT(*) AS total FROM email_spool GROUP BY status")
+        counts = {PENDING: 0, SENT: 0, DEAD: 0}
+        counts.update({row['status']: row['total'] for row in rows})
+        return counts
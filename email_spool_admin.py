@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+📦 Administración del spool de emails - DevPool ABCLM
+Lista, reenvía o purga los emails que agotaron sus reintentos (dead letters).
+La aplicación en marcha recoge los mensajes reenviados en su siguiente ciclo.
+
+Uso:
+    python email_spool_admin.py stats
+    python email_spool_admin.py list [--status dead|pending|sent]
+    python email_spool_admin.py replay [ID ...] [--all]
+    python email_spool_admin.py purge [ID ...] [--all]
+"""
+
+import argparse
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+
+from email_spool import EmailSpool, DEAD
+
+# Cargar variables de entorno
+load_dotenv()
+
+
+def get_spool():
+    path = os.environ.get('EMAIL_SPOOL_PATH') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'email_spool.db')
+    return EmailSpool(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gestión del spool de emails")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('stats', help="Mensajes por estado")
+
+    list_parser = subparsers.add_parser('list', help="Listar mensajes")
+    list_parser.add_argument('--status', default=DEAD)
+    list_parser.add_argument('--limit', type=int, default=50)
+
+    for name, help_text in (('replay', "Reenviar dead letters"), ('purge', "Eliminar dead letters")):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('ids', nargs='*')
+        sub.add_argument('--all', action='store_true', help="Aplicar a todas las dead letters")
+
+    args = parser.parse_args()
+    spool = get_spool()
+
+    print("📦 SPOOL DE EMAILS - DevPool ABCLM")
+    print("=" * 50)
+
+    if args.command == 'stats':
+        for status, total in spool.stats().items():
+            print(f"📊 {status}: {total}")
+
+    elif args.command == 'list':
+        records = spool.list(status=args.status, limit=args.limit)
+        if not records:
+            print(f"✅ No hay mensajes en estado '{args.status}'")
+        for record in records:
+            created = datetime.fromtimestamp(record['created_at']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"📧 {record['id']} [{record['kind']}] {created} - intentos: {record['attempts']}")
+            if record['last_error']:
+                print(f"   ❌ {record['last_error']}")
+
+    elif args.command in ('replay', 'purge'):
+        if not args.ids and not args.all:
+            print("❌ Indique IDs concretos o --all")
+            return
+        ids = None if args.all else args.ids
+        if args.command == 'replay':
+            total = spool.replay_dead(ids)
+            print(f"🔁 {total} mensajes devueltos a la cola de reintentos")
+        else:
+            total = spool.purge_dead(ids)
+            print(f"🗑️ {total} dead letters eliminadas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+🧩 Plantillas de email precompiladas - DevPool Blockchain CLM
+Cada plantilla se renderiza una sola vez por proceso con marcadores en
+lugar de los datos del usuario. Las partes estáticas del HTML, la
+alternativa en texto plano y la estructura MIME quedan cacheadas; en
+cada envío solo se sustituyen los campos escapados.
+"""
+
+import base64
+import html
+import re
+import threading
+import uuid
+from email.header import Header
+from email.utils import formatdate, make_msgid
+from html.parser import HTMLParser
+
+
+SENTINEL = '\x00{}\x00'
+SENTINEL_RE = re.compile('\x00([a-z_]+)\x00')
+CRLF = '\r\n'
+
+BLOCK_TAGS = {'p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'li', 'tr', 'table', 'ul', 'ol'}
+SKIP_TAGS = {'head', 'style', 'script', 'title'}
+
+
+class _TextExtractor(HTMLParser):
+    """Convierte el HTML de la plantilla en texto plano legible"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+    def text(self):
+        lines = [' '.join(line.split()) for line in ''.join(self.parts).splitlines()]
+        text = '\n'.join(lines)
+        return re.sub(r'\n{3,}', '\n\n', text).strip() + '\n'
+
+
+def html_to_text(markup):
+    parser = _TextExtractor()
+    parser.feed(markup)
+    parser.close()
+    return parser.text()
+
+
+def _split(skeleton):
+    """Divide un texto con marcadores en [estático, campo, estático, campo, ...]"""
+    return SENTINEL_RE.split(skeleton)
+
+
+def _fill(segments, values):
+    out = []
+    for i, segment in enumerate(segments):
+        out.append(values[segment] if i % 2 else segment)
+    return ''.join(out)
+
+
+def _encode_header(value):
+    # Los saltos de línea en datos del usuario permitirían inyectar cabeceras
+    value = value.replace('\r', ' ').replace('\n', ' ')
+    try:
+        value.encode('ascii')
+        return value
+    except UnicodeEncodeError:
+        return Header(value, 'utf-8').encode()
+
+
+def _b64_body(text):
+    return base64.encodebytes(text.encode('utf-8')).decode('ascii').replace('\n', CRLF)
+
+
+class CachedEmailTemplate:
+    """Plantilla HTML + texto con la estructura MIME construida una vez"""
+
+    def __init__(self, name, render, fields, subject):
+        # render: función(**contexto) -> HTML; se llama una vez con marcadores
+        self.name = name
+        self.render = render
+        self.fields = tuple(fields)
+        self.subject = subject
+        self._lock = threading.Lock()
+        self._compiled = False
+
+    def compile(self):
+        """Renderiza la plantilla con marcadores y prepara la estructura MIME"""
+        if self._compiled:
+            return
+        with self._lock:
+            if self._compiled:
+                return
+            skeleton = self.render(**{field: SENTINEL.format(field) for field in self.fields})
+            self._html_segments = _split(skeleton)
+            self._text_segments = _split(html_to_text(skeleton))
+
+            # Asunto fijo: se codifica una sola vez
+            self._static_subject = None if '{' in self.subject else _encode_header(self.subject)
+
+            boundary = f"===============devpool{uuid.uuid4().hex}=="
+            self._content_type = f'Content-Type: multipart/alternative; boundary="{boundary}"'
+            self._text_header = CRLF.join([
+                f"--{boundary}",
+                'Content-Type: text/plain; charset="utf-8"',
+                'Content-Transfer-Encoding: base64',
+                '', ''])
+            self._html_header = CRLF.join([
+                f"--{boundary}",
+                'Content-Type: text/html; charset="utf-8"',
+                'Content-Transfer-Encoding: base64',
+                '', ''])
+            self._closing = f"--{boundary}--{CRLF}"
+            self._compiled = True
+            print(f"🧩 [TEMPLATES] Plantilla '{self.name}' precompilada")
+
+    def render_parts(self, **values):
+        """Devuelve (html, texto) con los campos del usuario sustituidos"""
+        self.compile()
+        raw = {field: '' if values.get(field) is None else str(values[field]) for field in self.fields}
+        escaped = {field: html.escape(value) for field, value in raw.items()}
+        return _fill(self._html_segments, escaped), _fill(self._text_segments, raw)
+
+    def build(self, sender, recipient, **values):
+        """Construye el mensaje completo (bytes RFC 5322 con CRLF) listo para sendmail"""
+        html_body, text_body = self.render_parts(**values)
+        subject = self._static_subject or _encode_header(self.subject.format(**values))
+
+        headers = CRLF.join([
+            f"Subject: {subject}",
+            f"From: {_encode_header(sender)}",
+            f"To: {_encode_header(recipient)}",
+            f"Date: {formatdate(localtime=True)}",
+            f"Message-ID: {make_msgid(domain='devpool')}",
+            'MIME-Version: 1.0',
+            self._content_type,
+            '', ''])
+        message = ''.join([
+            headers,
+            self._text_header, _b64_body(text_body),
+            self._html_header, _b64_body(html_body),
+            self._closing,
+        ])
+        return message.encode('ascii')
@@ -0,0 +1,151 @@
+"""
+🚚 Transportes de email - DevPool Blockchain CLM
+Abstracción sobre el envío final de los mensajes ya construidos:
+  - smtp:   pool de sesiones SMTP (producción o servidor SMTP local)
+  - file:   buzón local mbox/maildir (pruebas de carga sin red)
+  - memory: lista en memoria (tests y benchmarks)
+Se elige con EMAIL_TRANSPORT.
+"""
+
+import mailbox
+import os
+import threading
+import time
+from collections import deque
+
+
+class EmailTransport:
+    """Interfaz común: send(sender, recipients, raw_message)"""
+
+    name = 'base'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {'messages_sent': 0, 'bytes_sent': 0}
+
+    def _count(self, raw_message):
+        with self._lock:
+            self._counters['messages_sent'] += 1
+            self._counters['bytes_sent'] += len(raw_message)
+
+    def ready(self):
+        """Indica si el transporte está configurado para enviar"""
+        return True
+
+    def send(self, sender, recipients, raw_message):
+        raise NotImplementedError
+
+    def check(self):
+        """Sonda de salud: lanza excepción si el transporte no está disponible"""
+        return True
+
+    def stats(self):
+        with self._lock:
+            return {'transport': self.name, **self._counters}
+
+
+class SMTPTransport(EmailTransport):
+    """Envío real a través del pool de sesiones SMTP"""
+
+    name = 'smtp'
+
+    def __init__(self, pool, require_auth=True):
+        super().__init__()
+        self.pool = pool
+        # Un servidor SMTP local de pruebas no necesita credenciales
+        self.require_auth = require_auth
+
+    def ready(self):
+        return bool(self.pool.username and self.pool.password) or not self.require_auth
+
+    def send(self, sender, recipients, raw_message):
+        self.pool.sendmail(sender, recipients, raw_message)
+        self._count(raw_message)
+
+    def check(self):
+        return self.pool.check()
+
+    def stats(self):
+        stats = super().stats()
+        stats['pool'] = self.pool.stats()
+        return stats
+
+
+class FileTransport(EmailTransport):
+    """Guarda cada mensaje en un buzón local (mbox o maildir)"""
+
+    name = 'file'
+
+    def __init__(self, path, file_format='mbox'):
+        super().__init__()
+        self.path = path
+        self.file_format = file_format
+        self._mailbox = None
+        self._write_lock = threading.Lock()
+
+    def _box(self):
+        if self._mailbox is None:
+            if self.file_format == 'maildir':
+                self._mailbox = mailbox.Maildir(self.path, create=True)
+            else:
+                self._mailbox = mailbox.mbox(self.path, create=True)
+        return self._mailbox
+
+    def send(self, sender, recipients, raw_message):
+        with self._write_lock:
+            box = self._box()
+            if isinstance(box, mailbox.mbox):
+                box.lock()
+                try:
+                    box.add(raw_message)
+                    box.flush()
+                finally:
+                    box.unlock()
+            else:
+                box.add(raw_message)
+        self._count(raw_message)
+
+    def check(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if not os.access(directory, os.W_OK):
+            raise PermissionError(f"No se puede escribir en {directory}")
+        return True
+
+    def stats(self):
+        stats = super().stats()
+        stats.update({'path': self.path, 'format': self.file_format})
+        return stats
+
+
+class MemoryTransport(EmailTransport):
+    """Guarda los últimos mensajes en memoria"""
+
+    name = 'memory'
+
+    def __init__(self, max_messages=10000):
+        super().__init__()
+        self.messages = deque(maxlen=max_messages)
+
+    def send(self, sender, recipients, raw_message):
+        self.messages.append({
+            'sender': sender,
+            'recipients': list(recipients),
+            'raw': raw_message,
+            'sent_at': time.time(),
+        })
+        self._count(raw_message)
+
+    def clear(self):
+        self.messages.clear()
+
+
+def create_transport(kind, pool=None, require_auth=True, path=None, file_format='mbox'):
+    """Crea el transporte configurado en EMAIL_TRANSPORT"""
+    kind = (kind or 'smtp').lower()
+    if kind == 'memory':
+        return MemoryTransport()
+    if kind == 'file':
+        return FileTransport(path or 'email_outbox.mbox', file_format=file_format)
+    if kind == 'smtp':
+        return SMTPTransport(pool, require_auth=require_auth)
+    raise ValueError(f"Transporte de email desconocido: {kind}")
@@ -0,0 +1,206 @@
+"""
+🔁 Claves de idempotencia - DevPool Blockchain CLM
+Guarda clave -> respuesta en SQLite (compartido por los workers) con TTL y
+un máximo de entradas. La primera petición con una clave la reserva y hace
+el trabajo; las repeticiones reciben la respuesta guardada sin tocar la base
+de datos ni el SMTP. Las peticiones simultáneas con la misma clave esperan a
+la primera (un Event dentro del proceso, sondeo entre workers). Si el worker
+que la reservó muere, la reserva caduca y otra petición puede retomarla.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+NEW = 'new'
+REPLAY = 'replay'
+IN_PROGRESS = 'in_progress'
+MISMATCH = 'mismatch'
+
+PENDING = 'pending'
+DONE = 'done'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    status TEXT NOT NULL,
+    response_status INTEGER,
+    response_body TEXT,
+    response_mimetype TEXT,
+    lease_until REAL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_idempotency_expires ON idempotency_keys (expires_at);
+"""
+
+
+def request_fingerprint(fields):
+    """Huella del cuerpo de la petición: la misma clave con otros datos es un error del cliente"""
+    canonical = json.dumps(sorted(fields), ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class IdempotencyStore:
+    """Respuestas por clave de idempotencia, con TTL y tamaño acotado"""
+
+    def __init__(self, path, ttl=86400, max_entries=100_000, lease_seconds=60, wait_timeout=30,
+                 poll_interval=0.05, purge_every=200):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Tiempo máximo que una petición puede tener reservada la clave
+        self.lease_seconds = lease_seconds
+        # Cuánto espera un duplicado simultáneo antes de responder "en curso"
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.purge_every = purge_every
+        self._pid = None
+        self._conn = None
+        self._lock = threading.Lock()
+        # Claves en curso en este proceso: los duplicados esperan al Event
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._claims = 0
+        self._counters = {'new': 0, 'replayed': 0, 'coalesced': 0, 'mismatches': 0,
+                          'timeouts': 0, 'released': 0, 'purged': 0}
+
+    def _connection(self):
+        # Una conexión por proceso (las heredadas del fork no son seguras)
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._connection().execute(sql, params).rowcount
+
+    def _fetchone(self, sql, params=()):
+        with self._lock:
+            row = self._connection().execute(sql, params).fetchone()
+            return dict(row) if row else None
+
+    def _try_claim(self, key, fingerprint):
+        """INSERT condicional: solo una petición (de cualquier worker) se queda la clave"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            # Claves caducadas o reservas abandonadas (worker caído) se pueden retomar
+            conn.execute(
+                "DELETE FROM idempotency_keys WHERE key = ? AND (expires_at < ? OR (status = ? AND lease_until < ?))",
+                (key, now, PENDING, now),
+            )
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO idempotency_keys (key, fingerprint, status, lease_until, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, fingerprint, PENDING, now + self.lease_seconds, now, now + self.ttl),
+            )
+            return cursor.rowcount == 1
+
+    def begin(self, key, fingerprint):
+        """
+        Devuelve (estado, respuesta):
+          NEW         la petición debe hacer el trabajo y llamar a complete() o release()
+          REPLAY      respuesta guardada (status, body, mimetype)
+          MISMATCH    la clave ya se usó con otros datos
+          IN_PROGRESS la primera petición sigue trabajando tras wait_timeout
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            if self._try_claim(key, fingerprint):
+                with self._inflight_lock:
+                    self._inflight[key] = threading.Event()
+                self._count('new')
+                self._maybe_purge()
+                return NEW, None
+
+            row = self._fetchone("SELECT * FROM idempotency_keys WHERE key = ?", (key,))
+            if row is None:
+                # Se liberó entre el INSERT y el SELECT: se vuelve a intentar
+                continue
+            if row['fingerprint'] != fingerprint:
+                self._count('mismatches')
+                return MISMATCH, None
+            if row['status'] == DONE:
+                self._count('replayed')
+                return REPLAY, (row['response_status'], row['response_body'], row['response_mimetype'])
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._count('timeouts')
+                return IN_PROGRESS, None
+            self._count('coalesced')
+            with self._inflight_lock:
+                event = self._inflight.get(key)
+            if event is not None:
+                event.wait(remaining)
+            else:
+                # La reservó otro worker: sondeo
+                time.sleep(min(self.poll_interval, remaining))
+
+    def complete(self, key, status, body, mimetype='application/json'):
+        """Guarda la respuesta para las repeticiones y despierta a los que esperan"""
+        self._execute(
+            "UPDATE idempotency_keys SET status = ?, response_status = ?, response_body = ?, "
+            "response_mimetype = ?, lease_until = NULL WHERE key = ?",
+            (DONE, status, body, mimetype, key),
+        )
+        self._wake(key)
+
+    def release(self, key):
+        """Olvida la clave sin guardar respuesta (errores transitorios: el reintento vuelve a trabajar)"""
+        self._execute("DELETE FROM idempotency_keys WHERE key = ? AND status = ?", (key, PENDING))
+        self._count('released')
+        self._wake(key)
+
+    def _count(self, name, amount=1):
+        with self._inflight_lock:
+            self._counters[name] += amount
+
+    def _wake(self, key):
+        with self._inflight_lock:
+            event = self._inflight.pop(key, None)
+        if event is not None:
+            event.set()
+
+    def _maybe_purge(self):
+        self._claims += 1
+        if self._claims % self.purge_every == 0:
+            self.purge()
+
+    def purge(self):
+        """Borra las claves caducadas y, si sobran, las más antiguas"""
+        now = time.time()
+        purged = self._execute("DELETE FROM idempotency_keys WHERE expires_at < ?", (now,))
+        excess = self._fetchone("SELECT COUNT(*) AS total FROM idempotency_keys")['total'] - self.max_entries
+        if excess > 0:
+            purged += self._execute(
+                "DELETE FROM idempotency_keys WHERE key IN "
+                "(SELECT key FROM idempotency_keys WHERE status = ? ORDER BY created_at LIMIT ?)",
+                (DONE, excess),
+            )
+        self._count('purged', purged)
+        return purged
+
+    def stats(self):
+        row = self._fetchone(
+            "SELECT COUNT(*) AS total, SUM(status = ?) AS pending FROM idempotency_keys", (PENDING,)
+        )
+        return {
+            'entries': row['total'],
+            'pending': row['pending'] or 0,
+            'ttl': self.ttl,
+            'max_entries': self.max_entries,
+            **self._counters,
+        }
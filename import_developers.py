@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+📥 Importación masiva de desarrolladores - DevPool ABCLM
+Carga un fichero JSON (como los developers_export_*.json), NDJSON o CSV en
+la base de datos configurada (DATABASE_BACKEND) leyendo en streaming.
+
+Uso:
+    python import_developers.py fichero.json [--mode skip|merge] [--chunk-size 500]
+                                [--format auto|json|ndjson|csv] [--dry-run] [--errors errores.csv]
+"""
+
+import argparse
+import csv
+import sys
+
+from dotenv import load_dotenv
+
+from developer_import import MERGE, SKIP, DeveloperImporter, iter_records
+from repository import repositories_from_env
+
+# Cargar variables de entorno
+load_dotenv()
+
+
+def print_progress(report):
+    print(f"\r📥 {report['processed']} filas · {report['inserted']} insertadas · {report['merged']} fusionadas · "
+          f"{report['skipped_duplicates']} duplicadas · {report['errors']} errores · "
+          f"{report['rows_per_second'] or 0} filas/s", end='', flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa desarrolladores desde JSON/NDJSON/CSV")
+    parser.add_argument('path')
+    parser.add_argument('--mode', choices=[SKIP, MERGE], default=SKIP,
+                        help="Qué hacer con emails ya registrados")
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--format', default='auto', choices=['auto', 'json', 'ndjson', 'csv'])
+    parser.add_argument('--dry-run', action='store_true', help="Valida sin escribir en la base de datos")
+    parser.add_argument('--errors', help="Guardar el informe de errores por fila en este CSV")
+    args = parser.parse_args()
+
+    print("📥 IMPORTACIÓN DE DESARROLLADORES - DevPool ABCLM")
+    print("=" * 50)
+
+    try:
+        developer_repo, _ = repositories_from_env()
+    except Exception as e:
+        print(f"❌ Error conectando con la base de datos: {e}")
+        return 1
+
+    importer = DeveloperImporter(developer_repo, mode=args.mode, chunk_size=args.chunk_size,
+                                 dry_run=args.dry_run, max_errors=1_000_000, progress=print_progress)
+    try:
+        with open(args.path, 'rb') as f:
+            report = importer.run(iter_records(f, args.format, filename=args.path))
+    except Exception as e:
+        report = importer.fail(e)
+    print()
+
+    if report['status'] == 'completed':
+        elapsed = report['finished_at'] - report['started_at']
+        print(f"✅ Importación {'simulada ' if args.dry_run else ''}completada en {elapsed:.1f}s")
+    else:
+        print(f"❌ Importación interrumpida: {report.get('fatal_error')}")
+
+    if args.errors and report['error_rows']:
+        with open(args.errors, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['row', 'email', 'error'])
+            writer.writeheader()
+            writer.writerows(report['error_rows'])
+        print(f"📝 {len(report['error_rows'])} errores guardados en {args.errors}")
+    else:
+        for error in report['error_rows'][:10]:
+            print(f"   ⚠️ Fila {error['row']}: {error['error']}")
+
+    return 0 if report['status'] == 'completed' else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+📭 Servidor SMTP local de pruebas - DevPool ABCLM
+Acepta y descarta (o guarda en un mbox) todos los mensajes, sin TLS ni
+autenticación. Permite medir registros y emails sin red ni proveedor real.
+
+Uso:
+    python local_smtp_server.py [--port 1025] [--latency-ms 0] [--mbox salida.mbox]
+
+Y en la app:
+    MAIL_SERVER=localhost MAIL_PORT=1025 MAIL_USE_TLS=False MAIL_REQUIRE_AUTH=False
+"""
+
+import argparse
+import mailbox
+import socketserver
+import threading
+import time
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Implementa el subconjunto de SMTP que usa smtplib"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode('ascii'))
+
+    def handle(self):
+        server = self.server
+        self.reply("220 devpool-local ESMTP listo")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command[:4].upper()
+
+            if verb in ('EHLO', 'HELO'):
+                if verb == 'EHLO':
+                    self.wfile.write(b"250-devpool-local\r\n250-8BITMIME\r\n250 SIZE 52428800\r\n")
+                else:
+                    self.reply("250 devpool-local")
+            elif verb == 'MAIL':
+                recipients = []
+                self.reply("250 OK")
+            elif verb == 'RCPT':
+                recipients.append(command[8:].strip(' <>'))
+                self.reply("250 OK")
+            elif verb == 'DATA':
+                self.reply("354 Fin con <CRLF>.<CRLF>")
+                chunks = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    chunks.append(data_line[1:] if data_line.startswith(b"..") else data_line)
+                if server.latency:
+                    time.sleep(server.latency)
+                server.store(b"".join(chunks), recipients)
+                self.reply("250 OK: mensaje aceptado")
+            elif verb == 'RSET':
+                recipients = []
+                self.reply("250 OK")
+            elif verb == 'NOOP':
+                self.reply("250 OK")
+            elif verb == 'QUIT':
+                self.reply("221 Adiós")
+                return
+            else:
+                self.reply("502 Comando no implementado")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """Servidor SMTP sumidero con contador de mensajes"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host='127.0.0.1', port=1025, latency_ms=0, mbox_path=None):
+        super().__init__((host, port), SMTPSinkHandler)
+        self.latency = latency_ms / 1000.0
+        self.mbox = mailbox.mbox(mbox_path) if mbox_path else None
+        self.messages = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def store(self, raw, recipients):
+        with self._lock:
+            self.messages += 1
+            self.bytes += len(raw)
+            if self.mbox is not None:
+                self.mbox.add(raw)
+                self.mbox.flush()
+
+    def start_in_background(self):
+        """Arranca el servidor en un hilo (para benchmarks y tests)"""
+        thread = threading.Thread(target=self.serve_forever, name='local-smtp', daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor SMTP local de pruebas")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=1025)
+    parser.add_argument('--latency-ms', type=float, default=0,
+                        help="Retardo simulado del proveedor por mensaje")
+    parser.add_argument('--mbox', help="Guardar los mensajes recibidos en este mbox")
+    args = parser.parse_args()
+
+    server = LocalSMTPServer(args.host, args.port, args.latency_ms, args.mbox)
+    print(f"📭 Servidor SMTP local escuchando en {args.host}:{args.port} (latencia {args.latency_ms} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📭 {server.messages} mensajes recibidos ({server.bytes} bytes)")
+
+
+if __name__ == '__main__':
+    main()
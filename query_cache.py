@@ -0,0 +1,159 @@
+"""
+🗃️ Caché de consultas - DevPool Blockchain CLM
+Caché read-through en memoria para resultados de consultas a Supabase,
+indexada por la forma de la consulta (filtros, cursor, tamaño de página).
+  - LRU acotada por número de entradas y por bytes estimados
+  - TTL como red de seguridad entre procesos
+  - invalidación precisa por etiquetas (p. ej. 'dev:<id>') o por predicado
+  - lecturas con `min_time`: quien acaba de escribir ignora entradas
+    anteriores a su escritura (read-your-writes aunque le atienda otro worker)
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class QueryCache:
+    """LRU de resultados de consultas con invalidación por etiquetas"""
+
+    def __init__(self, max_entries=512, max_bytes=8 * 1024 * 1024, ttl=60, name='query-cache'):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Un resultado que ocupe más que esto no se cachea (p. ej. la tabla entera)
+        self.max_entry_bytes = max_bytes // 4
+        self.ttl = ttl
+        self.name = name
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._bytes = 0
+        # Se incrementa en cada invalidación: un resultado leído antes no se guarda
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'bypassed': 0, 'expired': 0,
+                          'evictions': 0, 'invalidations': 0, 'too_large': 0, 'discarded': 0}
+
+    @staticmethod
+    def _estimate_size(value):
+        return len(json.dumps(value, default=str, separators=(',', ':')))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry['size']
+        for tag in entry['tags']:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return True
+
+    def get(self, key, min_time=None):
+        """Devuelve (encontrado, valor)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters['misses'] += 1
+                return False, None
+            if time.time() - entry['stored_at'] > self.ttl:
+                self._remove(key)
+                self._counters['expired'] += 1
+                self._counters['misses'] += 1
+                return False, None
+            if min_time is not None and entry['stored_at'] < min_time:
+                # Entrada anterior a una escritura de este usuario: se relee
+                self._counters['bypassed'] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return True, entry['value']
+
+    def set(self, key, value, tags=(), stored_at=None, generation=None):
+        size = self._estimate_size(value)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                # Hubo una escritura mientras se consultaba: el resultado puede ser antiguo
+                self._counters['discarded'] += 1
+                return False
+            if size > self.max_entry_bytes:
+                self._counters['too_large'] += 1
+                self._remove(key)
+                return False
+            self._remove(key)
+            self._entries[key] = {
+                'value': value,
+                'size': size,
+                'tags': frozenset(tags),
+                'stored_at': stored_at if stored_at is not None else time.time(),
+            }
+            self._bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._counters['evictions'] += 1
+            return True
+
+    def get_or_load(self, key, loader, tags=None, min_time=None):
+        """Read-through: si no está en caché ejecuta loader() y guarda el resultado"""
+        found, value = self.get(key, min_time=min_time)
+        if found:
+            return value
+        with self._lock:
+            generation = self._generation
+        started = time.time()
+        value = loader()
+        self.set(key, value, tags=tags(value) if callable(tags) else (tags or ()),
+                 stored_at=started, generation=generation)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._generation += 1
+            if self._remove(key):
+                self._counters['invalidations'] += 1
+
+    def invalidate_tag(self, tag):
+        """Elimina todas las entradas con esta etiqueta"""
+        with self._lock:
+            self._generation += 1
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self._counters['invalidations'] += len(keys)
+            return len(keys)
+
+    def invalidate_where(self, predicate):
+        """Elimina las entradas cuya clave cumpla predicate(key)"""
+        with self._lock:
+            self._generation += 1
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._remove(key)
+            self._counters['invalidations'] += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses'] + self._counters['bypassed']
+            return {
+                'name': self.name,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hit_ratio': round(self._counters['hits'] / lookups, 3) if lookups else None,
+                **self._counters,
+            }
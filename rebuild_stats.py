@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+📊 Recalcula las estadísticas de registros - DevPool ABCLM
+Los totales de developer_stats se mantienen solos (triggers); este script
+los vuelve a calcular desde la tabla developers cuando se han desajustado
+(restauración de una copia, cambios manuales en la base de datos, etc.).
+Bloquea las escrituras en developers mientras dura.
+
+Uso:
+    python rebuild_stats.py [--days 30] [--weeks 12] [--top 10]
+"""
+
+import argparse
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from repository import repositories_from_env
+
+# Cargar variables de entorno
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recalcula developer_stats desde cero")
+    parser.add_argument('--days', type=int, default=30, help="Días del resumen que se muestra al terminar")
+    parser.add_argument('--weeks', type=int, default=12)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    print("📊 RECÁLCULO DE ESTADÍSTICAS - DevPool ABCLM")
+    print("=" * 50)
+
+    try:
+        developer_repo, _ = repositories_from_env()
+        started = time.perf_counter()
+        rows = developer_repo.rebuild_stats()
+        elapsed = time.perf_counter() - started
+        summary = developer_repo.stats(args.days, args.weeks, args.top)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    print(f"✅ {rows} totales recalculados en {elapsed:.2f}s · {summary['total']} desarrolladores")
+    print(f"   📅 Últimos {len(summary['per_day'])} días: {sum(day['count'] for day in summary['per_day'])} registros")
+    for skill in summary['skills']:
+        print(f"   🏷️ {skill['value']}: {skill['count']}")
+    for location in summary['locations']:
+        print(f"   📍 {location['value'] or 'Sin indicar'}: {location['count']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
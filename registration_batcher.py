@@ -0,0 +1,470 @@
+"""
+🚦 Registros con diario local (write-ahead) - DevPool Blockchain CLM
+/submit deja cada registro validado primero en un diario local (SQLite en
+disco) y después en un búfer acotado en memoria; un hilo lo replica a la
+base de datos en lotes de hasta `batch_size` filas o cada `flush_interval`
+segundos (una sola llamada a Supabase por lote) y avisa a las peticiones
+que esperan. Un registro solo sale del diario cuando está en la base de
+datos: una caída de Supabase no pierde altas.
+
+Cada petición espera como máximo `max_ack_delay` (0 = responde en cuanto
+el registro está en el diario, sin esperar a la red): si su lote no se ha
+escrito para entonces (o la base de datos falla) responde "en cola". Los
+lotes fallidos se reintentan con espera exponencial (retry_delay,
+2·retry_delay, ... hasta max_retry_delay). Los registros del diario de un
+worker que se cayó los recoge otro al cabo de
+RegistrationJournal.stale_after segundos, y replay_registrations.py vacía
+el diario a mano. Las escrituras son upserts por id y los registros
+recuperados del diario se comprueban antes por id (existing_ids), así que
+reenviar una fila ya guardada no la duplica. Un registro sale del diario
+justo antes de ejecutar sus efectos (emails, contador, cachés): si sigue
+en el diario y ya está en la BD (se perdió la respuesta del upsert), sus
+efectos no llegaron a ejecutarse y el replay los ejecuta.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from repository import DuplicateEmailError
+
+
+INSERTED = 'inserted'
+DUPLICATE = 'duplicate'
+QUEUED = 'queued'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS registration_journal (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    owner_pid INTEGER NOT NULL,
+    claimed_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_registration_journal_claimed ON registration_journal (claimed_at);
+"""
+
+
+class RegistrationJournal:
+    """Diario local de registros aún no escritos en la base de datos (compartido por los workers)"""
+
+    def __init__(self, path, stale_after=60, synchronous='NORMAL'):
+        self.path = path
+        # Registros que su worker no ha escrito en este tiempo: cualquiera puede reclamarlos
+        self.stale_after = stale_after
+        # NORMAL: sobrevive a la caída del proceso · FULL: fsync en cada alta (también a un corte de luz)
+        self.synchronous = 'FULL' if str(synchronous).upper() == 'FULL' else 'NORMAL'
+        self._pid = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # Una conexión por proceso (las heredadas del fork no son seguras)
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def append(self, developer, claimed=True):
+        """Guarda el registro; claimed=False lo deja para el siguiente adopt() (sin sitio en el búfer)"""
+        now = time.time()
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO registration_journal (id, payload, owner_pid, claimed_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (developer['id'], json.dumps(developer, ensure_ascii=False, default=str), os.getpid(),
+                 now if claimed else 0, now),
+            )
+
+    def remove(self, ids):
+        ids = list(ids)
+        if not ids:
+            return 0
+        with self._lock:
+            return self._connection().execute(
+                f"DELETE FROM registration_journal WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).rowcount
+
+    def touch(self, ids):
+        """Renueva claimed_at de registros que este proceso aún tiene en memoria (no los adopta nadie)"""
+        ids = list(ids)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                conn.execute(
+                    f"UPDATE registration_journal SET claimed_at = ? "
+                    f"WHERE owner_pid = ? AND id IN ({','.join('?' * len(chunk))})",
+                    [now, os.getpid(), *chunk],
+                )
+
+    def mark_failed(self, ids, error, base_delay, max_delay):
+        """Programa el reintento con espera exponencial según los intentos: adopt() los recoge entonces"""
+        ids = list(ids)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            attempts = conn.execute(
+                f"SELECT id, attempts FROM registration_journal WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+            conn.executemany(
+                "UPDATE registration_journal SET attempts = ?, last_error = ?, claimed_at = ? WHERE id = ?",
+                [(row['attempts'] + 1, str(error)[:500],
+                  now + min(base_delay * 2 ** row['attempts'], max_delay) - self.stale_after, row['id'])
+                 for row in attempts],
+            )
+
+    def adopt(self, limit=500, include_claimed=False):
+        """
+        Reclama registros sin escribir cuyo dueño no los ha tocado en `stale_after`
+        segundos (o cuyo reintento ya toca). include_claimed: también los que tiene
+        en curso un worker vivo (replay manual con la aplicación parada).
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._connection().execute(
+                "UPDATE registration_journal SET owner_pid = ?, claimed_at = ? WHERE id IN ("
+                "SELECT id FROM registration_journal WHERE claimed_at < ? ORDER BY created_at LIMIT ?"
+                ") RETURNING payload",
+                (os.getpid(), now, float('inf') if include_claimed else now - self.stale_after, limit),
+            ).fetchall()
+        return [json.loads(row['payload']) for row in rows]
+
+    def entries(self, limit=100):
+        """Registros pendientes, los más antiguos primero (para revisar el diario a mano)"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id, payload, owner_pid, claimed_at, attempts, last_error, created_at "
+                "FROM registration_journal ORDER BY created_at LIMIT ?", (limit,)
+            ).fetchall()
+        entries = []
+        for row in rows:
+            payload = json.loads(row['payload'])
+            entries.append({
+                'id': row['id'],
+                'email': payload.get('email'),
+                'owner_pid': row['owner_pid'],
+                'attempts': row['attempts'],
+                'last_error': row['last_error'],
+                'age_seconds': round(time.time() - row['created_at'], 1),
+                'retry_in_seconds': round(max(0.0, row['claimed_at'] + self.stale_after - time.time()), 1),
+            })
+        return entries
+
+    def stats(self):
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COUNT(*) AS pending, MIN(created_at) AS oldest, SUM(attempts > 0) AS failing "
+                "FROM registration_journal"
+            ).fetchone()
+        return {
+            'pending': row['pending'],
+            'failing': row['failing'] or 0,
+            'oldest_age_seconds': round(time.time() - row['oldest'], 1) if row['oldest'] else None,
+        }
+
+
+class _Ticket:
+    __slots__ = ('event', 'outcome', 'result')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.outcome = None
+        self.result = None
+
+
+class RegistrationBatcher:
+    """Búfer acotado + hilo que replica los registros del diario en lotes"""
+
+    def __init__(self, journal, upsert_many, existing_ids=None, on_inserted=None, on_duplicate=None,
+                 batch_size=50, flush_interval=0.2, max_ack_delay=2.0, max_pending=1000,
+                 retry_delay=5, max_retry_delay=300):
+        self.journal = journal
+        # upsert_many(filas): escritura por id en la base de datos (DeveloperRepository.upsert_many)
+        self.upsert_many = upsert_many
+        # existing_ids(ids) -> ids ya guardados: deduplica los registros recuperados del diario
+        self.existing_ids = existing_ids
+        # on_inserted(developer) -> valor que recibe la petición (se llama en el hilo del lote)
+        self.on_inserted = on_inserted
+        # on_duplicate(developer): email repetido cuando ya nadie espera la respuesta
+        self.on_duplicate = on_duplicate
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = flush_interval
+        # Espera máxima de cada petición (0 = no espera); si espera, nunca menos que el intervalo
+        self.max_ack_delay = max(max_ack_delay, flush_interval) if max_ack_delay > 0 else 0
+        self.max_pending = max(1, int(max_pending))
+        # Primer reintento de un lote fallido (y cada cuánto se revisa el diario); se duplica en cada fallo
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max(max_retry_delay, retry_delay)
+
+        self._buffer = []
+        self._oldest = None
+        self._tickets = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._started_pid = None
+        self._last_adopt = 0.0
+        self._last_touch = 0.0
+        self._batch_sizes = []
+        self._counters = {'submitted': 0, 'inserted': 0, 'duplicates': 0, 'queued_acks': 0,
+                          'batches': 0, 'failed_batches': 0, 'overflow': 0, 'adopted': 0, 'deduplicated': 0}
+
+    # ────────────────────────────────────────────────
+    # Ciclo de vida
+    def _ensure_started(self):
+        """Arranca el hilo de escritura de forma perezosa (seguro tras el fork de gunicorn)"""
+        pid = os.getpid()
+        if self._started_pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._cond:
+            if self._started_pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            if self._started_pid != pid:
+                # Tras el fork: lo heredado pertenece al proceso padre
+                self._buffer, self._tickets, self._oldest = [], {}, None
+            self._thread = threading.Thread(target=self._flush_loop, name='registration-batcher', daemon=True)
+            self._thread.start()
+            self._started_pid = pid
+            print(f"🚦 [BATCHER] Escritura en lotes de {self.batch_size} o cada "
+                  f"{int(self.flush_interval * 1000)} ms (espera máx. {int(self.max_ack_delay * 1000)} ms)")
+
+    def start(self):
+        self._ensure_started()
+
+    def _flush_loop(self):
+        while True:
+            batch = self._next_batch()
+            self._refresh_claims(batch)
+            if batch:
+                self._write(batch)
+            self._maybe_adopt()
+
+    def _refresh_claims(self, batch=()):
+        """
+        Mantiene reclamados en el diario los registros del búfer y del lote en curso:
+        si vaciar el búfer tarda más que stale_after (ráfaga, BD lenta), adopt() no
+        debe tomarlos y escribirlos a la vez (on_inserted se ejecutaría dos veces)
+        """
+        now = time.monotonic()
+        if now - self._last_touch < self.journal.stale_after / 3:
+            return
+        with self._cond:
+            ids = [developer['id'] for developer in self._buffer]
+        ids.extend(developer['id'] for developer in batch)
+        self._last_touch = now
+        try:
+            self.journal.touch(ids)
+        except Exception as e:
+            print(f"❌ [BATCHER] Error renovando el diario: {e}")
+
+    def _next_batch(self):
+        """Espera a tener `batch_size` registros o a que el más antiguo cumpla `flush_interval`"""
+        with self._cond:
+            deadline = time.monotonic() + self.retry_delay
+            while not self._buffer:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._cond.wait(remaining)
+            while len(self._buffer) < self.batch_size:
+                remaining = self._oldest + self.flush_interval - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._take_batch()
+
+    def _take_batch(self):
+        # Llamado con el lock tomado
+        batch, self._buffer = self._buffer[:self.batch_size], self._buffer[self.batch_size:]
+        self._oldest = time.monotonic() if self._buffer else None
+        return batch
+
+    def flush(self):
+        """Escribe ya todo lo pendiente (al apagar el worker y en tests)"""
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+            if not batch:
+                return
+            self._write(batch)
+
+    # ────────────────────────────────────────────────
+    # Escritura
+    def _upsert_rows(self, batch):
+        """{id: INSERTED | DUPLICATE}; un email repetido invalida el lote entero y se reintenta fila a fila"""
+        try:
+            self.upsert_many(batch)
+            return {developer['id']: INSERTED for developer in batch}
+        except DuplicateEmailError:
+            pass
+        outcomes = {}
+        for developer in batch:
+            try:
+                self.upsert_many([developer])
+                outcomes[developer['id']] = INSERTED
+            except DuplicateEmailError:
+                outcomes[developer['id']] = DUPLICATE
+        return outcomes
+
+    def _write(self, batch, replayed=False):
+        """Replica un lote; devuelve False si falló (los registros siguen en el diario)"""
+        started = time.perf_counter()
+        try:
+            # Recuperados del diario: pudieron llegar a la BD justo antes de una caída
+            written = self.existing_ids([developer['id'] for developer in batch]) \
+                if replayed and self.existing_ids is not None else set()
+            pending = [developer for developer in batch if developer['id'] not in written]
+            outcomes = self._upsert_rows(pending) if pending else {}
+        except Exception as e:
+            print(f"❌ [BATCHER] Lote de {len(batch)} registros sin escribir, quedan en el diario: {e}")
+            self._count('failed_batches')
+            try:
+                self.journal.mark_failed([developer['id'] for developer in batch], e,
+                                         self.retry_delay, self.max_retry_delay)
+            except Exception as journal_error:
+                print(f"❌ [BATCHER] Error actualizando el diario: {journal_error}")
+            for developer in batch:
+                self._resolve(developer['id'], QUEUED)
+            return False
+
+        self.journal.remove([developer['id'] for developer in batch])
+        with self._cond:
+            self._counters['batches'] += 1
+            self._counters['deduplicated'] += len(written)
+            self._batch_sizes = (self._batch_sizes + [len(batch)])[-200:]
+        for developer in batch:
+            dev_id = developer['id']
+            with self._cond:
+                ticket = self._tickets.pop(dev_id, None)
+            # Ya en la BD pero aún en el diario: la escritura llegó y sus efectos no
+            outcome, result = outcomes.get(dev_id, INSERTED), None
+            try:
+                if outcome == INSERTED:
+                    if dev_id not in written:
+                        self._count('inserted')
+                    if self.on_inserted is not None:
+                        result = self.on_inserted(developer)
+                else:
+                    self._count('duplicates')
+                    if ticket is None and self.on_duplicate is not None:
+                        self.on_duplicate(developer)
+            except Exception as e:
+                print(f"⚠️ [BATCHER] Error tras registrar {dev_id}: {e}")
+            if ticket is not None:
+                ticket.outcome, ticket.result = outcome, result
+                ticket.event.set()
+        print(f"🚦 [BATCHER] Lote de {len(batch)} registros escrito en "
+              f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        return True
+
+    def _resolve(self, dev_id, outcome, result=None):
+        with self._cond:
+            ticket = self._tickets.pop(dev_id, None)
+        if ticket is not None:
+            ticket.outcome, ticket.result = outcome, result
+            ticket.event.set()
+
+    def replay(self, limit=None, include_claimed=False):
+        """
+        Replica lo que quede en el diario (huérfanos, reintentos que ya tocan y altas
+        que no cupieron en el búfer) hasta vaciarlo, llegar a `limit` o fallar un lote.
+        Devuelve el número de registros recuperados.
+        """
+        replayed = 0
+        while limit is None or replayed < limit:
+            size = self.batch_size if limit is None else min(self.batch_size, limit - replayed)
+            rows = self.journal.adopt(limit=size, include_claimed=include_claimed)
+            if not rows:
+                break
+            replayed += len(rows)
+            self._count('adopted', len(rows))
+            if not self._write(rows, replayed=True):
+                break
+        return replayed
+
+    def _maybe_adopt(self):
+        """Recoge del diario registros huérfanos (worker caído) o de lotes que fallaron"""
+        now = time.monotonic()
+        if now - self._last_adopt < self.retry_delay:
+            return
+        self._last_adopt = now
+        try:
+            replayed = self.replay(limit=self.max_pending)
+        except Exception as e:
+            print(f"❌ [BATCHER] Error leyendo el diario: {e}")
+            return
+        if replayed:
+            print(f"🚦 [BATCHER] {replayed} registros pendientes recuperados del diario")
+
+    # ────────────────────────────────────────────────
+    # API pública
+    def submit(self, developer):
+        """
+        Registra en el diario, encola y espera al lote (máximo max_ack_delay).
+        Devuelve (INSERTED | DUPLICATE | QUEUED, valor de on_inserted).
+        Con el búfer lleno el registro queda solo en el diario (QUEUED) y lo
+        replica la siguiente revisión del diario.
+        """
+        self._ensure_started()
+        with self._cond:
+            overflow = len(self._buffer) >= self.max_pending
+        if overflow:
+            self.journal.append(developer, claimed=False)
+            self._count('overflow')
+            self._count('queued_acks')
+            return QUEUED, None
+
+        self.journal.append(developer)
+        ticket = _Ticket() if self.max_ack_delay else None
+        with self._cond:
+            self._counters['submitted'] += 1
+            if ticket is not None:
+                self._tickets[developer['id']] = ticket
+            self._buffer.append(developer)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            self._cond.notify()
+
+        if ticket is None:
+            self._count('queued_acks')
+            return QUEUED, None
+        if not ticket.event.wait(self.max_ack_delay):
+            with self._cond:
+                self._tickets.pop(developer['id'], None)
+            ticket.outcome = QUEUED
+        if ticket.outcome == QUEUED:
+            self._count('queued_acks')
+        return ticket.outcome, ticket.result
+
+    def _count(self, name, amount=1):
+        with self._cond:
+            self._counters[name] += amount
+
+    def stats(self):
+        with self._cond:
+            sizes = list(self._batch_sizes)
+            stats = {
+                'buffered': len(self._buffer),
+                'waiting': len(self._tickets),
+                'batch_size': self.batch_size,
+                'flush_interval_ms': int(self.flush_interval * 1000),
+                'max_ack_delay_ms': int(self.max_ack_delay * 1000),
+                'max_pending': self.max_pending,
+                'avg_batch_size': round(sum(sizes) / len(sizes), 1) if sizes else None,
+                **self._counters,
+            }
+        try:
+            stats['journal'] = self.journal.stats()
+        except Exception as e:
+            stats['journal'] = {'error': str(e)}
+        return stats
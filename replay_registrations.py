@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+🚦 Vacía el diario local de registros - DevPool ABCLM
+Los workers replican el diario solos (reintentos y registros de workers
+caídos); este script lo hace a mano cuando la base de datos vuelve tras
+una caída larga o con la aplicación parada. Cada registro se comprueba
+por id antes de escribirlo: repetirlo no duplica filas.
+Los emails de bienvenida de estas altas no se envían desde aquí.
+
+Uso:
+    python replay_registrations.py [--list] [--all] [--batch-size 50] [--journal registration_journal.db]
+    python replay_registrations.py --discard ID [ID ...]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from registration_batcher import RegistrationBatcher, RegistrationJournal
+from repository import repositories_from_env
+
+# Cargar variables de entorno
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replica a la base de datos los registros pendientes del diario")
+    parser.add_argument('--journal', default=os.environ.get('REGISTRATION_JOURNAL_PATH', 'registration_journal.db'))
+    parser.add_argument('--list', action='store_true', help="Solo muestra los registros pendientes")
+    parser.add_argument('--all', action='store_true',
+                        help="Incluye los que tiene en curso un worker (usar con la aplicación parada)")
+    parser.add_argument('--discard', nargs='+', metavar='ID', help="Elimina registros del diario sin escribirlos")
+    parser.add_argument('--batch-size', type=int, default=50)
+    args = parser.parse_args()
+
+    print("🚦 REPLAY DEL DIARIO DE REGISTROS - DevPool ABCLM")
+    print("=" * 50)
+
+    if not os.path.exists(args.journal):
+        print(f"❌ No existe el diario: {args.journal}")
+        return 1
+    journal = RegistrationJournal(args.journal,
+                                  stale_after=int(os.environ.get('REGISTRATION_JOURNAL_STALE_AFTER', 60)))
+    stats = journal.stats()
+    print(f"📒 {stats['pending']} registros pendientes ({stats['failing']} con errores)")
+
+    if args.list:
+        for entry in journal.entries(limit=1000):
+            print(f"   {entry['id']} {entry['email']} · {entry['age_seconds']}s · "
+                  f"{entry['attempts']} intentos · {entry['last_error'] or 'sin errores'}")
+        return 0
+
+    if args.discard:
+        print(f"🗑️ {journal.remove(args.discard)} registros eliminados del diario")
+        return 0
+
+    try:
+        developer_repo, _ = repositories_from_env()
+        batcher = RegistrationBatcher(journal, developer_repo.upsert_many, existing_ids=developer_repo.existing_ids,
+                                      batch_size=args.batch_size)
+        started = time.perf_counter()
+        replayed = batcher.replay(include_claimed=args.all)
+        elapsed = time.perf_counter() - started
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    result = batcher.stats()
+    print(f"✅ {replayed} registros procesados en {elapsed:.2f}s")
+    print(f"   ➕ {result['inserted']} altas · 🔁 {result['deduplicated']} ya estaban en la BD · "
+          f"📇 {result['duplicates']} emails duplicados")
+    remaining = result['journal']['pending']
+    if remaining:
+        print(f"⚠️ Quedan {remaining} registros en el diario "
+              f"({'falló un lote' if result['failed_batches'] else 'en curso en otro worker, usa --all'})")
+        return 1 if result['failed_batches'] else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
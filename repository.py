@@ -0,0 +1,702 @@
+"""
+🗄️ Repositorios de datos - DevPool Blockchain CLM
+Interfaz única para desarrolladores y administradores con dos backends:
+  - supabase: la base de datos de producción (PostgREST)
+  - sqlite:   base de datos local con las mismas tablas, índices y
+              semántica, para pruebas de carga y perfilado sin red
+Se elige con DATABASE_BACKEND.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from developer_search import DEFAULT_LIMIT, FACET_LIMIT, MAX_LIMIT, SearchIndex, build_tsquery, empty_facets
+from developer_stats import DEFAULT_DAYS, DEFAULT_TOP, DEFAULT_WEEKS, clamp_window, summarize, window_start
+from email_identity import normalize_email
+from skill_tags import canonical_skill, normalize_skills
+from developer_pages import (DASHBOARD_COLUMNS, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor,
+                             encode_cursor, fetch_page)
+
+
+DEVELOPER_FIELDS = ('id', 'name', 'email', 'email_normalized', 'skills', 'skill_tags', 'experience_years',
+                    'portfolio_url', 'location', 'ip', 'created_at')
+# Campos que se actualizan cuando alguien repite el registro con el mismo email
+REGISTRATION_UPDATE_FIELDS = ('name', 'email', 'skills', 'skill_tags', 'experience_years', 'portfolio_url',
+                              'location', 'ip')
+ADMIN_FIELDS = ('id', 'username', 'hashed_password', 'created_at')
+
+
+class DuplicateEmailError(Exception):
+    """El email normalizado ya está registrado (índice único developers_email_normalized_key)"""
+
+
+def with_derived_fields(developer):
+    """Copia de la fila con email_normalized y skill_tags calculados si faltan"""
+    derived = {}
+    if not developer.get('email_normalized') and developer.get('email'):
+        derived['email_normalized'] = normalize_email(developer['email'])
+    if developer.get('skill_tags') is None and developer.get('skills') is not None:
+        derived['skill_tags'] = normalize_skills(developer['skills'])
+    return {**developer, **derived} if derived else developer
+
+
+class DeveloperRepository:
+    """Operaciones sobre la tabla developers"""
+
+    backend = 'base'
+
+    def insert(self, developer):
+        """Inserta un desarrollador y devuelve la fila guardada (o None).
+        Lanza DuplicateEmailError si el email normalizado ya existe."""
+        raise NotImplementedError
+
+    def insert_many(self, developers):
+        raise NotImplementedError
+
+    def upsert_many(self, developers):
+        """Inserta o actualiza (por id) varias filas completas"""
+        raise NotImplementedError
+
+    def count(self, mode='exact'):
+        raise NotImplementedError
+
+    def get(self, dev_id, columns='*'):
+        raise NotImplementedError
+
+    def existing_ids(self, dev_ids):
+        """Subconjunto de los ids que ya están guardados (una sola consulta)"""
+        raise NotImplementedError
+
+    def find_by_emails(self, emails, columns='*'):
+        """Filas cuyo email normalizado está en la lista (una sola consulta)"""
+        raise NotImplementedError
+
+    def update_by_email(self, email_normalized, fields):
+        """Actualiza en el sitio al desarrollador con ese email; devuelve la fila o None"""
+        raise NotImplementedError
+
+    def iter_email_keys(self, batch_size=1000):
+        """Todos los emails normalizados, por páginas de id (carga del EmailIndex)"""
+        after_id = None
+        while True:
+            rows = self.page_by_id(after_id, batch_size, 'id, email_normalized')
+            for row in rows:
+                yield row['email_normalized']
+            if len(rows) < batch_size:
+                return
+            after_id = rows[-1]['id']
+
+    def page(self, filters=None, cursor=None, page_size=DEFAULT_PAGE_SIZE, columns=DASHBOARD_COLUMNS,
+             max_page_size=MAX_PAGE_SIZE):
+        """Página del panel: (filas, cursor_siguiente) ordenada por created_at, id descendente.
+        max_page_size sube el límite de filas por página (exportación)"""
+        raise NotImplementedError
+
+    def page_by_id(self, after_id=None, limit=200, columns='id, name, email'):
+        """Página ordenada por id ascendente (recorridos completos, envíos masivos)"""
+        raise NotImplementedError
+
+    def list_all(self, columns='*'):
+        raise NotImplementedError
+
+    def search(self, query='', filters=None, limit=DEFAULT_LIMIT):
+        """Búsqueda por relevancia con facetas: {'total', 'results', 'facets', 'took_ms'}"""
+        raise NotImplementedError
+
+    def stats(self, days=DEFAULT_DAYS, weeks=DEFAULT_WEEKS, top=DEFAULT_TOP):
+        """Resumen de developer_stats (ver developer_stats.summarize); no depende del tamaño de la tabla"""
+        raise NotImplementedError
+
+    def rebuild_stats(self):
+        """Recalcula developer_stats desde cero; devuelve el número de filas de totales"""
+        raise NotImplementedError
+
+    def delete(self, dev_id):
+        """Borra y devuelve la fila borrada (o None si no existía)"""
+        raise NotImplementedError
+
+    def delete_many(self, dev_ids):
+        raise NotImplementedError
+
+
+class AdminRepository:
+    """Operaciones sobre la tabla admin"""
+
+    backend = 'base'
+
+    def get_by_username(self, username, columns='*'):
+        raise NotImplementedError
+
+    def set_password(self, username, hashed_password):
+        """Actualiza la contraseña o crea el admin; devuelve 'updated' o 'created'"""
+        raise NotImplementedError
+
+
+# ────────────────────────────────────────────────
+# Backend Supabase (PostgREST)
+
+class SupabaseDeveloperRepository(DeveloperRepository):
+
+    backend = 'supabase'
+
+    def __init__(self, table, rpc=None):
+        self.table = table
+        # rpc(nombre, parámetros): funciones SQL de schema.sql (search_developers)
+        self.rpc = rpc
+
+    @staticmethod
+    def _execute(query):
+        try:
+            return query.execute()
+        except Exception as e:
+            # 23505 = unique_violation de Postgres (APIError de postgrest)
+            if getattr(e, 'code', None) == '23505' and 'email_normalized' in str(e):
+                raise DuplicateEmailError(str(e)) from e
+            raise
+
+    def insert(self, developer):
+        response = self._execute(self.table.insert(with_derived_fields(developer)))
+        return response.data[0] if response.data else None
+
+    def insert_many(self, developers):
+        if not developers:
+            return []
+        response = self._execute(self.table.insert([with_derived_fields(developer) for developer in developers]))
+        return response.data or []
+
+    def upsert_many(self, developers):
+        if not developers:
+            return []
+        response = self._execute(
+            self.table.upsert([with_derived_fields(developer) for developer in developers], on_conflict='id')
+        )
+        return response.data or []
+
+    def count(self, mode='exact'):
+        response = self.table.select('id', count=mode, head=True).execute()
+        return response.count or 0
+
+    def get(self, dev_id, columns='*'):
+        response = self.table.select(columns).eq('id', dev_id).limit(1).execute()
+        return response.data[0] if response.data else None
+
+    def existing_ids(self, dev_ids):
+        if not dev_ids:
+            return set()
+        response = self.table.select('id').in_('id', list(dev_ids)).execute()
+        return {row['id'] for row in response.data or []}
+
+    def find_by_emails(self, emails, columns='*'):
+        if not emails:
+            return []
+        response = self.table.select(columns).in_('email_normalized', list(emails)).execute()
+        return response.data or []
+
+    def update_by_email(self, email_normalized, fields):
+        response = self.table.update(dict(fields)).eq('email_normalized', email_normalized).execute()
+        return response.data[0] if response.data else None
+
+    def page(self, filters=None, cursor=None, page_size=DEFAULT_PAGE_SIZE, columns=DASHBOARD_COLUMNS,
+             max_page_size=MAX_PAGE_SIZE):
+        return fetch_page(self.table, filters, cursor, page_size, columns, max_page_size)
+
+    def page_by_id(self, after_id=None, limit=200, columns='id, name, email'):
+        query = self.table.select(columns).order('id').limit(limit)
+        if after_id:
+            query = query.gt('id', after_id)
+        response = query.execute()
+        return response.data or []
+
+    def list_all(self, columns='*'):
+        response = self.table.select(columns).order('created_at', desc=True).execute()
+        return response.data or []
+
+    def search(self, query='', filters=None, limit=DEFAULT_LIMIT):
+        filters = filters or {}
+        started = time.perf_counter()
+        # Índice GIN sobre search_vector; ranking y facetas en una sola llamada
+        response = self.rpc('search_developers', {
+            'search_query': build_tsquery(query),
+            'location_filter': filters.get('location'),
+            'skill_filter': canonical_skill(filters['skill']) if filters.get('skill') else None,
+            'min_experience': filters.get('min_experience'),
+            'max_experience': filters.get('max_experience'),
+            'result_limit': max(1, min(int(limit), MAX_LIMIT)),
+            'facet_limit': FACET_LIMIT,
+        }).execute()
+        result = response.data or {'total': 0, 'results': [], 'facets': empty_facets()}
+        result['took_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    def stats(self, days=DEFAULT_DAYS, weeks=DEFAULT_WEEKS, top=DEFAULT_TOP):
+        days, weeks, top = clamp_window(days, weeks, top)
+        since_day, since_week = window_start(days, weeks)
+        response = self.rpc('developer_stats_window', {
+            'since_day': since_day, 'since_week': since_week, 'top_limit': top,
+        }).execute()
+        return summarize(response.data or [], days, weeks)
+
+    def rebuild_stats(self):
+        return self.rpc('rebuild_developer_stats', {}).execute().data
+
+    def delete(self, dev_id):
+        response = self.table.delete().eq('id', dev_id).execute()
+        return response.data[0] if response.data else None
+
+    def delete_many(self, dev_ids):
+        if not dev_ids:
+            return []
+        response = self.table.delete().in_('id', list(dev_ids)).execute()
+        return response.data or []
+
+
+class SupabaseAdminRepository(AdminRepository):
+
+    backend = 'supabase'
+
+    def __init__(self, table):
+        self.table = table
+
+    def get_by_username(self, username, columns='*'):
+        response = self.table.select(columns).eq('username', username).limit(1).execute()
+        return response.data[0] if response.data else None
+
+    def set_password(self, username, hashed_password):
+        if self.get_by_username(username, 'id'):
+            self.table.update({'hashed_password': hashed_password}).eq('username', username).execute()
+            return 'updated'
+        self.table.insert({'username': username, 'hashed_password': hashed_password}).execute()
+        return 'created'
+
+
+# ────────────────────────────────────────────────
+# Backend SQLite local (mismas tablas e índices que schema.sql)
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS developers (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_normalized TEXT,
+    skills TEXT NOT NULL,
+    skill_tags TAGS,
+    experience_years INTEGER NOT NULL CHECK (experience_years BETWEEN 0 AND 50),
+    portfolio_url TEXT,
+    location TEXT,
+    ip TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+CREATE INDEX IF NOT EXISTS developers_created_at_id_idx ON developers (created_at DESC, id DESC);
+CREATE TABLE IF NOT EXISTS admin (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL UNIQUE,
+    hashed_password TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+"""
+
+# Columnas añadidas después de la primera versión de la tabla
+SQLITE_MIGRATIONS = (
+    ('email_normalized', "ALTER TABLE developers ADD COLUMN email_normalized TEXT"),
+    ('skill_tags', "ALTER TABLE developers ADD COLUMN skill_tags TAGS"),
+)
+
+# Después de migrar bases locales creadas antes de email_normalized
+SQLITE_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS developers_email_normalized_key ON developers (email_normalized);
+CREATE TABLE IF NOT EXISTS developer_stats (
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, bucket)
+);
+CREATE INDEX IF NOT EXISTS developer_stats_top_idx ON developer_stats (dimension, total DESC);
+"""
+
+
+def _stats_delta(row, sign):
+    """Sentencias del trigger: suma (+1) o resta (-1) la fila NEW/OLD en developer_stats"""
+    upsert = "ON CONFLICT (dimension, bucket) DO UPDATE SET total = total + excluded.total;"
+    return f"""
+    INSERT INTO developer_stats (dimension, bucket, total) VALUES
+        ('total', '', {sign}),
+        ('day', date({row}.created_at), {sign}),
+        ('week', date({row}.created_at, 'weekday 0', '-6 days'), {sign}),
+        ('location', coalesce({row}.location, ''), {sign}),
+        ('experience', CAST({row}.experience_years AS TEXT), {sign})
+    {upsert}
+    INSERT INTO developer_stats (dimension, bucket, total)
+        SELECT 'skill', value, {sign} FROM json_each(coalesce({row}.skill_tags, '[]')) WHERE true
+    {upsert}"""
+
+
+# Mismos totales que los triggers de schema.sql (días en UTC, semanas desde el lunes)
+SQLITE_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS developers_stats_insert AFTER INSERT ON developers BEGIN
+{_stats_delta('NEW', 1)}
+END;
+CREATE TRIGGER IF NOT EXISTS developers_stats_delete AFTER DELETE ON developers BEGIN
+{_stats_delta('OLD', -1)}
+END;
+CREATE TRIGGER IF NOT EXISTS developers_stats_update
+AFTER UPDATE OF created_at, location, experience_years, skill_tags ON developers BEGIN
+{_stats_delta('OLD', -1)}
+{_stats_delta('NEW', 1)}
+END;
+"""
+
+SQLITE_REBUILD_STATS = """
+DELETE FROM developer_stats;
+INSERT INTO developer_stats (dimension, bucket, total)
+    SELECT 'total', '', count(*) FROM developers
+    UNION ALL SELECT 'day', date(created_at), count(*) FROM developers GROUP BY 2
+    UNION ALL SELECT 'week', date(created_at, 'weekday 0', '-6 days'), count(*) FROM developers GROUP BY 2
+    UNION ALL SELECT 'location', coalesce(location, ''), count(*) FROM developers GROUP BY 2
+    UNION ALL SELECT 'experience', CAST(experience_years AS TEXT), count(*) FROM developers GROUP BY 2
+    UNION ALL SELECT 'skill', j.value, count(*)
+        FROM developers, json_each(coalesce(developers.skill_tags, '[]')) j GROUP BY 2;
+"""
+
+# Ventana del resumen: días y semanas recientes, histograma completo y los N más frecuentes
+SQLITE_STATS_WINDOW = """
+SELECT dimension, bucket, total FROM developer_stats WHERE dimension IN ('total', 'experience')
+UNION ALL SELECT dimension, bucket, total FROM developer_stats WHERE dimension = 'day' AND bucket >= :since_day
+UNION ALL SELECT dimension, bucket, total FROM developer_stats WHERE dimension = 'week' AND bucket >= :since_week
+UNION ALL SELECT * FROM (SELECT dimension, bucket, total FROM developer_stats
+                         WHERE dimension = 'location' ORDER BY total DESC LIMIT :top_limit)
+UNION ALL SELECT * FROM (SELECT dimension, bucket, total FROM developer_stats
+                         WHERE dimension = 'skill' ORDER BY total DESC LIMIT :top_limit)
+"""
+
+
+def _columns(columns, allowed):
+    """Traduce la proyección estilo PostgREST ('id, name') a SQL validando los nombres"""
+    if not columns or columns.strip() == '*':
+        return ', '.join(allowed)
+    names = [name.strip() for name in columns.split(',') if name.strip()]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"Columnas desconocidas: {', '.join(unknown)}")
+    return ', '.join(names)
+
+
+def _encode_tags(tags):
+    return json.dumps(list(tags), ensure_ascii=False) if tags is not None else None
+
+
+sqlite3.register_converter('TAGS', json.loads)
+
+
+def _like_contains(value):
+    escaped = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+class SQLiteDatabase:
+    """Conexión SQLite compartida por los repositorios locales"""
+
+    def __init__(self, path):
+        self.path = path
+        self._pid = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None or self._pid != os.getpid():
+            # PARSE_DECLTYPES: las columnas TAGS se leen como listas (igual que text[] en PostgREST)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None,
+                                   detect_types=sqlite3.PARSE_DECLTYPES)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SQLITE_SCHEMA)
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(developers)")}
+            for column, migration in SQLITE_MIGRATIONS:
+                if column not in columns:
+                    conn.execute(migration)
+            conn.executescript(SQLITE_INDEXES)
+            conn.executescript(SQLITE_TRIGGERS)
+            if (conn.execute("SELECT 1 FROM developer_stats LIMIT 1").fetchone() is None
+                    and conn.execute("SELECT 1 FROM developers LIMIT 1").fetchone() is not None):
+                # Base creada antes de las estadísticas: se calculan una vez
+                conn.executescript(f"BEGIN IMMEDIATE; {SQLITE_REBUILD_STATS} COMMIT;")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _translate(error):
+        if isinstance(error, sqlite3.IntegrityError) and 'email_normalized' in str(error):
+            return DuplicateEmailError(str(error))
+        return error
+
+    def execute(self, sql, params=()):
+        with self._lock:
+            try:
+                return self._connection().execute(sql, params).rowcount
+            except sqlite3.IntegrityError as e:
+                raise self._translate(e) from e
+
+    def executemany(self, sql, rows):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(sql, rows)
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                raise self._translate(e) from e
+
+    def fetchall(self, sql, params=()):
+        with self._lock:
+            try:
+                return [dict(row) for row in self._connection().execute(sql, params).fetchall()]
+            except sqlite3.IntegrityError as e:
+                raise self._translate(e) from e
+
+    def fetchone(self, sql, params=()):
+        rows = self.fetchall(sql, params)
+        return rows[0] if rows else None
+
+    def transaction(self, script):
+        """Varias sentencias en una transacción (BEGIN IMMEDIATE: bloquea a otros escritores)"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in filter(str.strip, script.split(';')):
+                    conn.execute(statement)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def data_version(self):
+        """Cambia cuando otra conexión (otro proceso) escribe en la base"""
+        with self._lock:
+            return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+
+class SQLiteDeveloperRepository(DeveloperRepository):
+
+    backend = 'sqlite'
+
+    def __init__(self, db):
+        self.db = db
+        # Índice de búsqueda en memoria: se crea en la primera búsqueda y
+        # después se actualiza con cada escritura de este repositorio
+        self._search_index = None
+        self._search_version = None
+        self._search_lock = threading.Lock()
+
+    def _index(self, rows):
+        # Con el lock: una escritura durante la reconstrucción llega al índice nuevo
+        with self._search_lock:
+            if self._search_index is not None:
+                for row in rows:
+                    self._search_index.add(with_derived_fields(row))
+
+    def _unindex(self, rows):
+        with self._search_lock:
+            if self._search_index is not None:
+                for row in rows:
+                    self._search_index.remove(row['id'])
+
+    def _row(self, developer):
+        developer = with_derived_fields(developer)
+        return tuple(_encode_tags(developer.get(field)) if field == 'skill_tags' else developer.get(field)
+                     for field in DEVELOPER_FIELDS)
+
+    def insert(self, developer):
+        self.db.execute(
+            f"INSERT INTO developers ({', '.join(DEVELOPER_FIELDS)}) VALUES ({', '.join('?' * len(DEVELOPER_FIELDS))})",
+            self._row(developer),
+        )
+        self._index([developer])
+        return self.get(developer['id'])
+
+    def insert_many(self, developers):
+        developers = list(developers)
+        if developers:
+            self.db.executemany(
+                f"INSERT INTO developers ({', '.join(DEVELOPER_FIELDS)}) VALUES ({', '.join('?' * len(DEVELOPER_FIELDS))})",
+                [self._row(developer) for developer in developers],
+            )
+            self._index(developers)
+        return developers
+
+    def upsert_many(self, developers):
+        developers = list(developers)
+        if developers:
+            updates = ', '.join(f"{field} = excluded.{field}" for field in DEVELOPER_FIELDS if field != 'id')
+            self.db.executemany(
+                f"INSERT INTO developers ({', '.join(DEVELOPER_FIELDS)}) VALUES ({', '.join('?' * len(DEVELOPER_FIELDS))}) "
+                f"ON CONFLICT(id) DO UPDATE SET {updates}",
+                [self._row(developer) for developer in developers],
+            )
+            self._index(developers)
+        return developers
+
+    def count(self, mode='exact'):
+        return self.db.fetchone("SELECT COUNT(*) AS total FROM developers")['total']
+
+    def get(self, dev_id, columns='*'):
+        return self.db.fetchone(f"SELECT {_columns(columns, DEVELOPER_FIELDS)} FROM developers WHERE id = ?",
+                                (dev_id,))
+
+    def existing_ids(self, dev_ids):
+        dev_ids = list(dev_ids)
+        if not dev_ids:
+            return set()
+        rows = self.db.fetchall(f"SELECT id FROM developers WHERE id IN ({','.join('?' * len(dev_ids))})", dev_ids)
+        return {row['id'] for row in rows}
+
+    def find_by_emails(self, emails, columns='*'):
+        emails = list(emails)
+        if not emails:
+            return []
+        placeholders = ','.join('?' * len(emails))
+        return self.db.fetchall(
+            f"SELECT {_columns(columns, DEVELOPER_FIELDS)} FROM developers WHERE email_normalized IN ({placeholders})",
+            emails,
+        )
+
+    def update_by_email(self, email_normalized, fields):
+        fields = {field: _encode_tags(value) if field == 'skill_tags' else value
+                  for field, value in fields.items()}
+        assignments = ', '.join(f"{field} = ?" for field in fields if field in DEVELOPER_FIELDS)
+        rows = self.db.fetchall(
+            f"UPDATE developers SET {assignments} WHERE email_normalized = ? RETURNING {', '.join(DEVELOPER_FIELDS)}",
+            [value for field, value in fields.items() if field in DEVELOPER_FIELDS] + [email_normalized],
+        )
+        self._index(rows)
+        return rows[0] if rows else None
+
+    def page(self, filters=None, cursor=None, page_size=DEFAULT_PAGE_SIZE, columns=DASHBOARD_COLUMNS,
+             max_page_size=MAX_PAGE_SIZE):
+        filters = filters or {}
+        page_size = max(1, min(int(page_size), max_page_size))
+        where, params = [], []
+        if 'location' in filters:
+            where.append("location LIKE ? ESCAPE '\\'")
+            params.append(_like_contains(filters['location']))
+        if 'skill' in filters:
+            where.append("EXISTS (SELECT 1 FROM json_each(developers.skill_tags) WHERE value = ?)")
+            params.append(canonical_skill(filters['skill']))
+        if 'min_experience' in filters:
+            where.append("experience_years >= ?")
+            params.append(filters['min_experience'])
+        if 'max_experience' in filters:
+            where.append("experience_years <= ?")
+            params.append(filters['max_experience'])
+
+        position = decode_cursor(cursor)
+        if position:
+            # Keyset: (created_at, id) < (cursor_created_at, cursor_id)
+            where.append("(created_at < ? OR (created_at = ? AND id < ?))")
+            params.extend([position[0], position[0], position[1]])
+
+        sql = f"SELECT {_columns(columns, DEVELOPER_FIELDS)} FROM developers"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        rows = self.db.fetchall(sql, [*params, page_size + 1])
+        next_cursor = encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+        return rows[:page_size], next_cursor
+
+    def page_by_id(self, after_id=None, limit=200, columns='id, name, email'):
+        sql = f"SELECT {_columns(columns, DEVELOPER_FIELDS)} FROM developers"
+        params = []
+        if after_id:
+            sql += " WHERE id > ?"
+            params.append(after_id)
+        return self.db.fetchall(sql + " ORDER BY id LIMIT ?", [*params, limit])
+
+    def list_all(self, columns='*'):
+        return self.db.fetchall(
+            f"SELECT {_columns(columns, DEVELOPER_FIELDS)} FROM developers ORDER BY created_at DESC, id DESC"
+        )
+
+    def search(self, query='', filters=None, limit=DEFAULT_LIMIT):
+        with self._search_lock:
+            version = self.db.data_version()
+            if self._search_index is None or version != self._search_version:
+                # Primera búsqueda o escrituras desde otro proceso: se reconstruye
+                index = SearchIndex()
+                index.build(self.db.fetchall(f"SELECT {', '.join(DEVELOPER_FIELDS)} FROM developers"))
+                self._search_index, self._search_version = index, version
+        return self._search_index.search(query, filters, limit)
+
+    def stats(self, days=DEFAULT_DAYS, weeks=DEFAULT_WEEKS, top=DEFAULT_TOP):
+        days, weeks, top = clamp_window(days, weeks, top)
+        since_day, since_week = window_start(days, weeks)
+        rows = self.db.fetchall(SQLITE_STATS_WINDOW,
+                                {'since_day': since_day, 'since_week': since_week, 'top_limit': top})
+        return summarize(rows, days, weeks)
+
+    def rebuild_stats(self):
+        self.db.transaction(SQLITE_REBUILD_STATS)
+        return self.db.fetchone("SELECT COUNT(*) AS total FROM developer_stats")['total']
+
+    def delete(self, dev_id):
+        deleted = self.delete_many([dev_id])
+        return deleted[0] if deleted else None
+
+    def delete_many(self, dev_ids):
+        dev_ids = list(dev_ids)
+        if not dev_ids:
+            return []
+        placeholders = ','.join('?' * len(dev_ids))
+        # Igual que PostgREST (return=representation): devuelve las filas borradas
+        deleted = self.db.fetchall(
+            f"DELETE FROM developers WHERE id IN ({placeholders}) RETURNING {', '.join(DEVELOPER_FIELDS)}",
+            dev_ids,
+        )
+        self._unindex(deleted)
+        return deleted
+
+
+class SQLiteAdminRepository(AdminRepository):
+
+    backend = 'sqlite'
+
+    def __init__(self, db):
+        self.db = db
+
+    def get_by_username(self, username, columns='*'):
+        return self.db.fetchone(f"SELECT {_columns(columns, ADMIN_FIELDS)} FROM admin WHERE username = ?",
+                                (username,))
+
+    def set_password(self, username, hashed_password):
+        if self.db.execute("UPDATE admin SET hashed_password = ? WHERE username = ?", (hashed_password, username)):
+            return 'updated'
+        self.db.execute("INSERT INTO admin (username, hashed_password) VALUES (?, ?)", (username, hashed_password))
+        return 'created'
+
+
+def repositories_from_env():
+    """Repositorios según DATABASE_BACKEND (para scripts de línea de comandos)"""
+    backend = os.environ.get('DATABASE_BACKEND', 'supabase').lower()
+    if backend == 'sqlite':
+        return create_repositories('sqlite', sqlite_path=os.environ.get('SQLITE_DATABASE_PATH', 'devpool_local.db'))
+    url, key = os.environ.get('SUPABASE_URL'), os.environ.get('SUPABASE_KEY')
+    if not url or not key:
+        raise ValueError("Variables de entorno SUPABASE_URL y SUPABASE_KEY son requeridas")
+    from supabase import create_client
+    return create_repositories('supabase', supabase_client=create_client(url, key))
+
+
+def create_repositories(backend, supabase_client=None, sqlite_path=None):
+    """Devuelve (repositorio de desarrolladores, repositorio de admins) del backend elegido"""
+    backend = (backend or 'supabase').lower()
+    if backend == 'sqlite':
+        db = SQLiteDatabase(sqlite_path or 'devpool_local.db')
+        return SQLiteDeveloperRepository(db), SQLiteAdminRepository(db)
+    if backend == 'supabase':
+        return (SupabaseDeveloperRepository(supabase_client.table('developers'), rpc=supabase_client.rpc),
+                SupabaseAdminRepository(supabase_client.table('admin')))
+    raise ValueError(f"Backend de base de datos desconocido: {backend}")
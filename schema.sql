@@ -0,0 +1,219 @@
+-- 🗄️ Esquema de la base de datos - DevPool Blockchain CLM (Supabase / Postgres)
+-- El backend SQLite local (repository.py) crea las mismas tablas e índices.
+
+CREATE TABLE IF NOT EXISTS developers (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_normalized TEXT,
+    skills TEXT NOT NULL,
+    skill_tags TEXT[] NOT NULL DEFAULT '{}',
+    experience_years INTEGER NOT NULL CHECK (experience_years BETWEEN 0 AND 50),
+    portfolio_url TEXT,
+    location TEXT,
+    ip TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Paginación por cursor del panel admin: ORDER BY created_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS developers_created_at_id_idx ON developers (created_at DESC, id DESC);
+
+-- Detección de registros duplicados: un buzón (email normalizado) = un registro.
+-- En una base existente, antes de crear el índice:
+--   python backfill_email_normalized.py [--delete-duplicates]
+ALTER TABLE developers ADD COLUMN IF NOT EXISTS email_normalized TEXT;
+CREATE UNIQUE INDEX IF NOT EXISTS developers_email_normalized_key ON developers (email_normalized);
+
+-- 🏷️ Habilidades como etiquetas canónicas (skill_tags.py), calculadas al registrar/importar.
+-- Filtros, facetas y estadísticas usan el array en lugar de ILIKE sobre el texto.
+-- En una base existente, después de añadir la columna:
+--   python backfill_skill_tags.py
+ALTER TABLE developers ADD COLUMN IF NOT EXISTS skill_tags TEXT[] NOT NULL DEFAULT '{}';
+CREATE INDEX IF NOT EXISTS developers_skill_tags_idx ON developers USING GIN (skill_tags);
+
+CREATE TABLE IF NOT EXISTS admin (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    hashed_password TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- 🔎 Búsqueda del panel admin: tsvector ponderado (skills > name > location) + GIN.
+-- Mismo tokenizado que developer_search.py: minúsculas y sin acentos.
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+CREATE OR REPLACE FUNCTION immutable_unaccent(value TEXT) RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS $$
+    SELECT public.unaccent('public.unaccent', value)
+$$;
+
+ALTER TABLE developers ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', immutable_unaccent(coalesce(skills, ''))), 'A') ||
+    setweight(to_tsvector('simple', immutable_unaccent(coalesce(name, ''))), 'B') ||
+    setweight(to_tsvector('simple', immutable_unaccent(coalesce(location, ''))), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS developers_search_idx ON developers USING GIN (search_vector);
+
+-- Resultados por relevancia y facetas en una sola llamada (RPC de PostgREST).
+-- search_query llega ya construido por build_tsquery(): 'solid:* & madrid:*'
+-- skill_filter es una etiqueta canónica (canonical_skill())
+CREATE OR REPLACE FUNCTION search_developers(
+    search_query TEXT DEFAULT '',
+    location_filter TEXT DEFAULT NULL,
+    skill_filter TEXT DEFAULT NULL,
+    min_experience INTEGER DEFAULT NULL,
+    max_experience INTEGER DEFAULT NULL,
+    result_limit INTEGER DEFAULT 20,
+    facet_limit INTEGER DEFAULT 10
+) RETURNS JSONB
+LANGUAGE sql STABLE AS $$
+WITH matches AS (
+    SELECT d.id, d.name, d.email, d.skills, d.skill_tags, d.experience_years, d.portfolio_url, d.location, d.created_at,
+           CASE WHEN coalesce(search_query, '') = '' THEN 0
+                ELSE ts_rank_cd(d.search_vector, to_tsquery('simple', search_query)) END AS rank
+    FROM developers d
+    WHERE (coalesce(search_query, '') = '' OR d.search_vector @@ to_tsquery('simple', search_query))
+      -- Comodines escapados como _contains() del panel: '%' y '_' se buscan literalmente
+      AND (location_filter IS NULL OR d.location ILIKE
+           '%' || replace(replace(replace(location_filter, '\', '\\'), '%', '\%'), '_', '\_') || '%' ESCAPE '\')
+      AND (skill_filter IS NULL OR d.skill_tags @> ARRAY[skill_filter])
+      AND (min_experience IS NULL OR d.experience_years >= min_experience)
+      AND (max_experience IS NULL OR d.experience_years <= max_experience)
+)
+SELECT jsonb_build_object(
+    'total', (SELECT count(*) FROM matches),
+    'results', coalesce((
+        SELECT jsonb_agg(r) FROM (
+            SELECT * FROM matches ORDER BY rank DESC, created_at DESC LIMIT result_limit
+        ) r), '[]'::jsonb),
+    'facets', jsonb_build_object(
+        'skills', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('value', value, 'count', total)) FROM (
+                SELECT tag AS value, count(*) AS total
+                FROM matches, unnest(skill_tags) tag
+                GROUP BY tag ORDER BY total DESC, tag LIMIT facet_limit
+            ) f), '[]'::jsonb),
+        'locations', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('value', location, 'count', total)) FROM (
+                SELECT location, count(*) AS total FROM matches WHERE location IS NOT NULL
+                GROUP BY location ORDER BY total DESC, location LIMIT facet_limit
+            ) f), '[]'::jsonb),
+        'experience', coalesce((
+            SELECT jsonb_agg(jsonb_build_object('value', bucket, 'count', total) ORDER BY low) FROM (
+                SELECT CASE WHEN experience_years <= 1 THEN '0-1'
+                            WHEN experience_years <= 4 THEN '2-4'
+                            WHEN experience_years <= 9 THEN '5-9'
+                            ELSE '10+' END AS bucket,
+                       min(experience_years) AS low, count(*) AS total
+                FROM matches GROUP BY 1
+            ) f), '[]'::jsonb)
+    )
+);
+$$;
+
+-- 📊 Estadísticas de registros (developer_stats.py): totales por dimensión y valor,
+-- mantenidos por triggers en cada alta, cambio y baja. Leer el resumen no depende
+-- del tamaño de developers. Recalcular desde cero (reparaciones):
+--   python rebuild_stats.py        (o SELECT rebuild_developer_stats();)
+CREATE TABLE IF NOT EXISTS developer_stats (
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    total BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, bucket)
+);
+CREATE INDEX IF NOT EXISTS developer_stats_top_idx ON developer_stats (dimension, total DESC);
+
+-- (dimensión, valor) que suma cada desarrollador. Días en UTC; semanas desde el lunes
+CREATE OR REPLACE FUNCTION developer_stat_keys(d developers)
+RETURNS TABLE (dimension TEXT, bucket TEXT)
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT 'total', ''
+    UNION ALL SELECT 'day', (d.created_at AT TIME ZONE 'UTC')::date::text
+    UNION ALL SELECT 'week', date_trunc('week', d.created_at AT TIME ZONE 'UTC')::date::text
+    UNION ALL SELECT 'location', coalesce(d.location, '')
+    UNION ALL SELECT 'experience', d.experience_years::text
+    UNION ALL SELECT 'skill', tag FROM unnest(d.skill_tags) tag
+$$;
+
+-- Triggers por sentencia con tablas de transición: una importación de 5.000 filas
+-- hace un solo UPSERT agregado, no 5.000. plpgsql solo planifica la rama que se
+-- ejecuta, así que cada una usa únicamente las tablas de transición de su evento.
+CREATE OR REPLACE FUNCTION apply_developer_stats() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO developer_stats AS s (dimension, bucket, total)
+        SELECT k.dimension, k.bucket, count(*)
+        FROM new_rows n, LATERAL developer_stat_keys(n) k
+        GROUP BY 1, 2
+        ON CONFLICT (dimension, bucket) DO UPDATE SET total = s.total + excluded.total;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO developer_stats AS s (dimension, bucket, total)
+        SELECT k.dimension, k.bucket, -count(*)
+        FROM old_rows o, LATERAL developer_stat_keys(o) k
+        GROUP BY 1, 2
+        ON CONFLICT (dimension, bucket) DO UPDATE SET total = s.total + excluded.total;
+    ELSE
+        INSERT INTO developer_stats AS s (dimension, bucket, total)
+        SELECT dimension, bucket, sum(delta) FROM (
+            SELECT k.dimension, k.bucket, 1 AS delta FROM new_rows n, LATERAL developer_stat_keys(n) k
+            UNION ALL
+            SELECT k.dimension, k.bucket, -1 AS delta FROM old_rows o, LATERAL developer_stat_keys(o) k
+        ) changes
+        GROUP BY 1, 2
+        HAVING sum(delta) <> 0
+        ON CONFLICT (dimension, bucket) DO UPDATE SET total = s.total + excluded.total;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS developers_stats_insert ON developers;
+CREATE TRIGGER developers_stats_insert AFTER INSERT ON developers
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION apply_developer_stats();
+DROP TRIGGER IF EXISTS developers_stats_delete ON developers;
+CREATE TRIGGER developers_stats_delete AFTER DELETE ON developers
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION apply_developer_stats();
+DROP TRIGGER IF EXISTS developers_stats_update ON developers;
+CREATE TRIGGER developers_stats_update AFTER UPDATE ON developers
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION apply_developer_stats();
+
+-- Recalcula todo en una transacción; SHARE bloquea las escrituras mientras tanto
+-- para que ningún alta quede fuera ni se cuente dos veces
+CREATE OR REPLACE FUNCTION rebuild_developer_stats() RETURNS BIGINT
+LANGUAGE plpgsql AS $$
+DECLARE
+    total_rows BIGINT;
+BEGIN
+    LOCK TABLE developers IN SHARE MODE;
+    DELETE FROM developer_stats;
+    INSERT INTO developer_stats (dimension, bucket, total)
+    SELECT k.dimension, k.bucket, count(*)
+    FROM developers d, LATERAL developer_stat_keys(d) k
+    GROUP BY 1, 2;
+    SELECT count(*) INTO total_rows FROM developer_stats;
+    RETURN total_rows;
+END;
+$$;
+
+-- Ventana del resumen (RPC): días y semanas recientes, histograma completo y los N más frecuentes
+CREATE OR REPLACE FUNCTION developer_stats_window(
+    since_day TEXT,
+    since_week TEXT,
+    top_limit INTEGER DEFAULT 10
+) RETURNS TABLE (dimension TEXT, bucket TEXT, total BIGINT)
+LANGUAGE sql STABLE AS $$
+    SELECT s.dimension, s.bucket, s.total FROM developer_stats s WHERE s.dimension IN ('total', 'experience')
+    UNION ALL SELECT s.dimension, s.bucket, s.total FROM developer_stats s
+        WHERE s.dimension = 'day' AND s.bucket >= since_day
+    UNION ALL SELECT s.dimension, s.bucket, s.total FROM developer_stats s
+        WHERE s.dimension = 'week' AND s.bucket >= since_week
+    UNION ALL (SELECT s.dimension, s.bucket, s.total FROM developer_stats s
+        WHERE s.dimension = 'location' ORDER BY s.total DESC LIMIT top_limit)
+    UNION ALL (SELECT s.dimension, s.bucket, s.total FROM developer_stats s
+        WHERE s.dimension = 'skill' ORDER BY s.total DESC LIMIT top_limit)
+$$;
+
+-- Bases existentes: calcular los totales una vez
+SELECT rebuild_developer_stats() WHERE NOT EXISTS (SELECT 1 FROM developer_stats);
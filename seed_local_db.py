@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+🌱 Carga de datos de prueba en la base SQLite local - DevPool ABCLM
+Genera desarrolladores ficticios con una distribución realista (ciudades,
+habilidades, experiencia y fechas de registro) para pruebas de carga.
+
+Uso:
+    python seed_local_db.py [--rows 100000] [--path devpool_local.db] [--admin-password clave]
+
+Y en la app:
+    DATABASE_BACKEND=sqlite SQLITE_DATABASE_PATH=devpool_local.db
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from werkzeug.security import generate_password_hash
+
+from repository import create_repositories
+
+
+LOCATIONS = ['Toledo', 'Albacete', 'Ciudad Real', 'Cuenca', 'Guadalajara', 'Talavera de la Reina',
+             'Puertollano', 'Madrid', 'Valencia', None]
+SKILLS = ['Solidity', 'Rust', 'Python', 'JavaScript', 'TypeScript', 'Go', 'React', 'Node.js',
+          'Hardhat', 'Foundry', 'Web3.js', 'Ethers.js', 'IPFS', 'Substrate', 'Move', 'Cairo']
+
+
+def fake_developers(count, seed=42, start=None):
+    """Genera `count` desarrolladores ficticios, del más antiguo al más reciente"""
+    rng = random.Random(seed)
+    start = start or datetime.now() - timedelta(days=365)
+    step = timedelta(days=365) / max(count, 1)
+    for i in range(count):
+        yield {
+            'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            'name': f"Dev {i:06d}",
+            'email': f"dev{i:06d}@example.com",
+            'skills': ', '.join(rng.sample(SKILLS, rng.randint(1, 5))),
+            'experience_years': min(50, int(rng.expovariate(1 / 4))),
+            'portfolio_url': f"https://github.com/dev{i:06d}" if rng.random() < 0.6 else None,
+            'location': rng.choice(LOCATIONS),
+            'ip': f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            'created_at': (start + step * i).isoformat(),
+        }
+
+
+def seed(developer_repo, rows, batch_size=5000, seed_value=42):
+    batch = []
+    for developer in fake_developers(rows, seed=seed_value):
+        batch.append(developer)
+        if len(batch) >= batch_size:
+            developer_repo.insert_many(batch)
+            batch = []
+    developer_repo.insert_many(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga datos de prueba en la base SQLite local")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--path', default='devpool_local.db')
+    parser.add_argument('--admin-password', help="Crea/actualiza el usuario admin con esta contraseña")
+    args = parser.parse_args()
+
+    developer_repo, admin_repo = create_repositories('sqlite', sqlite_path=args.path)
+
+    started = time.perf_counter()
+    seed(developer_repo, args.rows)
+    elapsed = time.perf_counter() - started
+    print(f"🌱 {args.rows} desarrolladores insertados en {elapsed:.1f}s ({args.rows / elapsed:.0f} filas/s)")
+    print(f"🗄️ Total en {args.path}: {developer_repo.count()}")
+
+    if args.admin_password:
+        result = admin_repo.set_password('admin', generate_password_hash(args.admin_password))
+        print(f"🔐 Usuario admin {'actualizado' if result == 'updated' else 'creado'}")
+
+
+if __name__ == '__main__':
+    main()
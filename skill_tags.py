@@ -0,0 +1,102 @@
+"""
+🏷️ Etiquetas de habilidades - DevPool Blockchain CLM
+Las habilidades llegan como texto libre ("Python, solidity,  Rust/Go").
+normalize_skills() las convierte al registrar o importar en una lista de
+etiquetas canónicas que se guarda junto al texto original
+(developers.skill_tags): se separa por delimitadores, se pasa a minúsculas
+sin acentos y los sinónimos se traducen con la tabla SKILL_ALIASES
+("js" -> "JavaScript", "sol" -> "Solidity"). Las habilidades que no están
+en la tabla se guardan en minúsculas.
+
+Búsqueda, filtros y estadísticas trabajan sobre las etiquetas; el texto
+original solo se muestra.
+"""
+
+import re
+import unicodedata
+
+
+SKILL_DELIMITERS = re.compile(r'[,;/|\n]+')
+MAX_TAGS = 30
+MAX_TAG_LENGTH = 50
+
+# Etiqueta canónica -> sinónimos (se comparan en minúsculas y sin acentos).
+# Mantener ordenado; cada etiqueta nueva debe incluir las grafías habituales.
+SKILL_ALIASES = {
+    'C#': ('csharp', 'c sharp'),
+    'C++': ('cpp', 'cplusplus'),
+    'Cairo': (),
+    'Cosmos SDK': ('cosmos', 'cosmossdk'),
+    'DeFi': ('defi', 'decentralized finance'),
+    'Docker': (),
+    'Ethereum': ('eth',),
+    'Ethers.js': ('ethers', 'ethersjs', 'ethers js'),
+    'Foundry': ('forge',),
+    'Go': ('golang',),
+    'GraphQL': ('graph ql',),
+    'Hardhat': ('hard hat',),
+    'IPFS': (),
+    'Java': (),
+    'JavaScript': ('js', 'ecmascript', 'es6', 'vanilla js'),
+    'Kubernetes': ('k8s',),
+    'Move': (),
+    'NFT': ('nfts',),
+    'Node.js': ('node', 'nodejs', 'node js'),
+    'Polygon': ('matic',),
+    'PostgreSQL': ('postgres', 'psql'),
+    'Python': ('py', 'python3', 'python 3'),
+    'React': ('reactjs', 'react.js', 'react js'),
+    'Rust': ('rs',),
+    'Smart Contracts': ('smart contract', 'smartcontracts', 'contratos inteligentes'),
+    'Solana': (),
+    'Solidity': ('sol',),
+    'Substrate': (),
+    'TypeScript': ('ts',),
+    'Vyper': (),
+    'Web3.js': ('web3', 'web3js', 'web3 js'),
+    'Zero Knowledge': ('zk', 'zkp', 'zero-knowledge', 'zero knowledge proofs'),
+}
+
+
+def fold(text):
+    """Minúsculas y sin acentos ('Málaga' -> 'malaga')"""
+    text = str(text or '').lower()
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _key(text):
+    """Forma de comparación: minúsculas, sin acentos y con espacios simples"""
+    return ' '.join(fold(text).split()).strip(' .-')
+
+
+_CANONICAL = {}
+for _tag, _aliases in SKILL_ALIASES.items():
+    for _alias in (_tag, *_aliases):
+        _CANONICAL[_key(_alias)] = _tag
+
+
+def canonical_skill(text):
+    """Etiqueta canónica de una habilidad ('js' -> 'JavaScript'; desconocida -> minúsculas)"""
+    key = _key(text)[:MAX_TAG_LENGTH]
+    return _CANONICAL.get(key, key)
+
+
+def normalize_skills(skills):
+    """'Python, solidity,  Rust/Go' -> ['Python', 'Solidity', 'Rust', 'Go'] (sin repetir, en orden)"""
+    tags = []
+    for part in SKILL_DELIMITERS.split(skills or ''):
+        tag = canonical_skill(part)
+        if tag and tag not in tags:
+            tags.append(tag)
+            if len(tags) >= MAX_TAGS:
+                break
+    return tags
+
+
+def row_skill_tags(row):
+    """Etiquetas de una fila (las guardadas o, en filas sin migrar, calculadas del texto)"""
+    tags = row.get('skill_tags')
+    return tags if tags is not None else normalize_skills(row.get('skills'))
@@ -0,0 +1,117 @@
+"""
+🩺 Salud SMTP cacheada - DevPool Blockchain CLM
+Estado de salud del proveedor SMTP con TTL, refrescado en segundo
+plano y conectado a un circuit breaker para fallar rápido.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+
+from circuit_breaker import CLOSED, HALF_OPEN
+
+
+class SMTPHealthMonitor:
+    """Cachea el resultado de la sonda SMTP y alimenta al circuit breaker"""
+
+    def __init__(self, probe, breaker, ttl=60):
+        # probe: función sin argumentos que lanza excepción si el SMTP no responde
+        self.probe = probe
+        self.breaker = breaker
+        self.ttl = ttl
+
+        self._healthy = None
+        self._checked_at = None
+        self._latency_ms = None
+        self._error = None
+        self._probes = 0
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    # ────────────────────────────────────────────────
+    # Señales de salud
+    def _update(self, healthy, error=None, latency_ms=None):
+        with self._lock:
+            self._healthy = healthy
+            self._checked_at = time.time()
+            self._error = error
+            if latency_ms is not None:
+                self._latency_ms = latency_ms
+
+    def report_success(self):
+        """Un envío real correcto también cuenta como comprobación de salud"""
+        self._update(True)
+        self.breaker.record_success()
+
+    def report_failure(self, error):
+        self._update(False, error=error)
+        self.breaker.record_failure(error)
+
+    def refresh(self):
+        """Ejecuta la sonda (una a la vez) y actualiza el estado cacheado"""
+        if not self._probe_lock.acquire(blocking=False):
+            return self.is_healthy()
+        try:
+            started = time.time()
+            self._probes += 1
+            try:
+                self.probe()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                print(f"🩺 [SMTP HEALTH] Sonda fallida: {error}")
+                self._update(False, error=error, latency_ms=round((time.time() - started) * 1000, 1))
+                self.breaker.record_failure(type(e).__name__)
+                return False
+            self._update(True, latency_ms=round((time.time() - started) * 1000, 1))
+            self.breaker.record_success()
+            return True
+        finally:
+            self._probe_lock.release()
+
+    def is_stale(self):
+        with self._lock:
+            return self._checked_at is None or time.time() - self._checked_at >= self.ttl
+
+    def is_healthy(self):
+        with self._lock:
+            return bool(self._healthy)
+
+    # ────────────────────────────────────────────────
+    # Refresco en segundo plano
+    def start(self):
+        """Arranca el hilo de refresco (uno por proceso)"""
+        if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._refresh_loop, name='smtp-health', daemon=True)
+            self._thread.start()
+
+    def _refresh_loop(self):
+        while True:
+            # Con el circuito abierto solo se sondea cuando toca la prueba half-open
+            state = self.breaker.state
+            due = state == HALF_OPEN or (state == CLOSED and self.is_stale())
+            if due and self.breaker.allow():
+                self.refresh()
+            time.sleep(max(1.0, min(self.ttl, self.breaker.recovery_timeout) / 2))
+
+    def snapshot(self):
+        with self._lock:
+            checked_at = self._checked_at
+            snapshot = {
+                'healthy': self._healthy,
+                'checked_at': datetime.fromtimestamp(checked_at).isoformat() if checked_at else None,
+                'age_seconds': round(time.time() - checked_at, 1) if checked_at else None,
+                'ttl_seconds': self.ttl,
+                'probe_latency_ms': self._latency_ms,
+                'last_error': self._error,
+                'probes': self._probes,
+            }
+        snapshot['breaker'] = self.breaker.snapshot()
+        return snapshot
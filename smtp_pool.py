@@ -0,0 +1,203 @@
+"""
+📮 Pool de conexiones SMTP - DevPool Blockchain CLM
+Mantiene sesiones SMTP autenticadas y las reutiliza entre envíos,
+limitando el número de sesiones concurrentes al del proveedor.
+"""
+
+import os
+import smtplib
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Errores de transporte tras los que merece la pena reconectar y reintentar
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class PooledConnection:
+    """Sesión SMTP autenticada con sus metadatos de uso"""
+
+    def __init__(self, server):
+        self.server = server
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.messages_sent = 0
+
+
+class SMTPConnectionPool:
+    """Pool de sesiones SMTP compartido por todos los envíos del proceso"""
+
+    def __init__(self, host, port, username=None, password=None, use_tls=True, use_ssl=False,
+                 max_connections=3, max_messages_per_connection=100, idle_timeout=60,
+                 noop_interval=5, timeout=30):
+        self.host = host
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.use_ssl = use_ssl
+        self.max_connections = max(1, int(max_connections))
+        self.max_messages_per_connection = max(1, int(max_messages_per_connection))
+        self.idle_timeout = idle_timeout
+        self.noop_interval = noop_interval
+        self.timeout = timeout
+
+        self._context = ssl.create_default_context()
+        self._reset_state()
+
+    def _reset_state(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._idle = []
+        self._in_use = 0
+        self._counters = {'opened': 0, 'reused': 0, 'closed': 0, 'noop_failures': 0,
+                          'messages_sent': 0, 'send_errors': 0}
+
+    def _check_fork(self):
+        # Tras el fork de gunicorn las sesiones heredadas no son válidas
+        if self._pid != os.getpid():
+            self._reset_state()
+
+    # ────────────────────────────────────────────────
+    # Gestión de sesiones
+    def _open(self):
+        """Abre una sesión nueva: conexión, STARTTLS y login"""
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.host, self.port, context=self._context, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.use_tls:
+                server.starttls(context=self._context)
+        try:
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            self._close_server(server)
+            raise
+
+        with self._lock:
+            self._counters['opened'] += 1
+        print(f"📮 [SMTP POOL] Nueva sesión con {self.host}:{self.port}")
+        return PooledConnection(server)
+
+    def _close_server(self, server):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def _discard(self, conn):
+        self._close_server(conn.server)
+        with self._lock:
+            self._counters['closed'] += 1
+
+    def _is_alive(self, conn):
+        """Comprueba con NOOP una sesión que lleva un tiempo inactiva"""
+        if time.time() - conn.last_used < self.noop_interval:
+            return True
+        try:
+            code, _ = conn.server.noop()
+            return code == 250
+        except Exception:
+            with self._lock:
+                self._counters['noop_failures'] += 1
+            return False
+
+    def _take_idle(self):
+        """Saca una sesión reutilizable del pool, descartando las caducadas"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                conn = self._idle.pop()
+            expired = (time.time() - conn.last_used > self.idle_timeout
+                       or conn.messages_sent >= self.max_messages_per_connection)
+            if not expired and self._is_alive(conn):
+                with self._lock:
+                    self._counters['reused'] += 1
+                return conn
+            self._discard(conn)
+
+    @contextmanager
+    def connection(self):
+        """Presta una sesión autenticada; la devuelve al pool si sigue sana"""
+        self._check_fork()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError("No hay sesiones SMTP libres en el pool")
+
+        conn = None
+        healthy = False
+        try:
+            conn = self._take_idle() or self._open()
+            with self._lock:
+                self._in_use += 1
+            try:
+                yield conn
+                healthy = True
+            finally:
+                with self._lock:
+                    self._in_use -= 1
+        finally:
+            if conn is not None:
+                conn.last_used = time.time()
+                if healthy and conn.messages_sent < self.max_messages_per_connection:
+                    with self._lock:
+                        self._idle.append(conn)
+                else:
+                    self._discard(conn)
+            self._slots.release()
+
+    # ────────────────────────────────────────────────
+    # API pública
+    def _send(self, deliver):
+        """Ejecuta deliver(server) con una sesión del pool; reintenta una vez si se cayó"""
+        for attempt in (1, 2):
+            try:
+                with self.connection() as conn:
+                    deliver(conn.server)
+                    conn.messages_sent += 1
+                with self._lock:
+                    self._counters['messages_sent'] += 1
+                return True
+            except RECONNECT_ERRORS as e:
+                with self._lock:
+                    self._counters['send_errors'] += 1
+                if attempt == 2:
+                    raise
+                print(f"⚠️ [SMTP POOL] Sesión perdida ({type(e).__name__}), reconectando...")
+
+    def send_message(self, message):
+        """Envía un objeto email.message reutilizando una sesión"""
+        return self._send(lambda server: server.send_message(message))
+
+    def sendmail(self, from_addr, to_addrs, raw_message):
+        """Envía un mensaje ya serializado: solo queda el intercambio DATA"""
+        return self._send(lambda server: server.sendmail(from_addr, to_addrs, raw_message))
+
+    def check(self):
+        """Verifica que se puede obtener una sesión autenticada"""
+        with self.connection():
+            return True
+
+    def close_all(self):
+        """Cierra todas las sesiones inactivas"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'server': f"{self.host}:{self.port}",
+                'max_connections': self.max_connections,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                **self._counters,
+            }
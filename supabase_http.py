@@ -0,0 +1,131 @@
+"""
+🌐 Cliente HTTP de Supabase - DevPool Blockchain CLM
+Un único transporte httpx por proceso (worker de gunicorn) para todo el
+tráfico PostgREST:
+  - keep-alive con límites de conexiones configurables
+  - HTTP/2 opcional (requiere el paquete h2)
+  - timeouts distintos para lecturas (GET/HEAD) y escrituras
+  - estadísticas del pool: en uso, ociosas, abiertas, reutilizadas
+Tras un fork el pool se recrea: los sockets no se comparten entre procesos.
+"""
+
+import os
+import threading
+import time
+import weakref
+
+import httpx
+from postgrest import SyncPostgrestClient
+from postgrest.utils import SyncClient
+
+
+READ_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+def http2_available():
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class SupabaseHTTPTransport(httpx.HTTPTransport):
+    """Transporte httpx con timeouts por operación y contadores del pool"""
+
+    def __init__(self, max_connections=10, max_keepalive_connections=5, keepalive_expiry=30,
+                 http2=False, connect_timeout=5, read_timeout=10, write_timeout=15, pool_timeout=5,
+                 retries=1):
+        if http2 and not http2_available():
+            print("⚠️ [SUPABASE HTTP] HTTP/2 solicitado pero el paquete h2 no está instalado, se usa HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections,
+                                   keepalive_expiry=keepalive_expiry)
+        self._transport_kwargs = {'limits': self.limits, 'http2': http2, 'retries': retries}
+        self.timeouts = {
+            'read': {'connect': connect_timeout, 'read': read_timeout,
+                     'write': read_timeout, 'pool': pool_timeout},
+            'write': {'connect': connect_timeout, 'read': write_timeout,
+                      'write': write_timeout, 'pool': pool_timeout},
+        }
+        super().__init__(**self._transport_kwargs)
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._seen = weakref.WeakSet()
+        self._counters = {'requests': 0, 'opened': 0, 'errors': 0, 'timeouts': 0, 'forks': 0}
+        self._latency_ms = {'read': 0.0, 'write': 0.0}
+        self._operations = {'read': 0, 'write': 0}
+
+    def _reset_after_fork(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # El pool heredado del proceso padre no se cierra: sus sockets son del padre
+            super().__init__(**self._transport_kwargs)
+            self._seen = weakref.WeakSet()
+            self._pid = os.getpid()
+            self._counters['forks'] += 1
+
+    def handle_request(self, request):
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+        operation = 'read' if request.method in READ_METHODS else 'write'
+        request.extensions['timeout'] = self.timeouts[operation]
+        started = time.perf_counter()
+        try:
+            response = super().handle_request(request)
+        except httpx.TimeoutException:
+            with self._lock:
+                self._counters['timeouts'] += 1
+                self._counters['errors'] += 1
+            raise
+        except httpx.TransportError:
+            with self._lock:
+                self._counters['errors'] += 1
+            raise
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._counters['requests'] += 1
+            self._operations[operation] += 1
+            self._latency_ms[operation] += elapsed_ms
+            for connection in self._pool.connections:
+                if connection not in self._seen:
+                    self._seen.add(connection)
+                    self._counters['opened'] += 1
+        return response
+
+    def stats(self):
+        with self._lock:
+            connections = list(self._pool.connections)
+            idle = sum(1 for connection in connections if connection.is_idle())
+            return {
+                'http2': self.http2,
+                'max_connections': self.limits.max_connections,
+                'max_keepalive_connections': self.limits.max_keepalive_connections,
+                'keepalive_expiry': self.limits.keepalive_expiry,
+                'connections': len(connections),
+                'in_use': len(connections) - idle,
+                'idle': idle,
+                'reused': max(0, self._counters['requests'] - self._counters['opened']),
+                'avg_read_ms': round(self._latency_ms['read'] / self._operations['read'], 2)
+                if self._operations['read'] else None,
+                'avg_write_ms': round(self._latency_ms['write'] / self._operations['write'], 2)
+                if self._operations['write'] else None,
+                **self._counters,
+            }
+
+
+class TunedPostgrestClient(SyncPostgrestClient):
+    """Cliente PostgREST que usa el transporte compartido en lugar del suyo propio"""
+
+    def __init__(self, base_url, *, transport, **kwargs):
+        self.transport = transport
+        super().__init__(base_url, **kwargs)
+
+    def create_session(self, base_url, headers, timeout, verify=True, proxy=None):
+        return SyncClient(base_url=base_url, headers=headers, timeout=timeout,
+                          transport=self.transport, follow_redirects=True)
@@ -0,0 +1,72 @@
+import pytest
+
+import appy
+from repository import create_repositories
+from seed_local_db import fake_developers
+
+
+@pytest.fixture
+def devs(tmp_path, monkeypatch):
+    developer_repo, admin_repo = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    rows = list(fake_developers(12))
+    developer_repo.insert_many(rows)
+    monkeypatch.setattr(appy, 'developer_repo', developer_repo)
+    appy.developer_cache.clear()
+    appy.developer_counter.invalidate()
+    return developer_repo, rows
+
+
+@pytest.fixture
+def client():
+    appy.app.config['TESTING'] = True
+    with appy.app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+            sess['admin_username'] = 'admin'
+        yield client
+
+
+def test_single_delete_uses_one_round_trip(devs, client, monkeypatch):
+    developer_repo, rows = devs
+    monkeypatch.setattr(developer_repo, 'get', lambda *a, **k: pytest.fail('no debe consultar antes de borrar'))
+
+    response = client.post(f"/admin/delete/{rows[0]['id']}")
+    assert response.status_code == 302
+    assert developer_repo.count() == 11
+
+    assert client.post(f"/admin/delete/{rows[0]['id']}").status_code == 404
+
+
+def test_bulk_delete_in_chunks_with_one_audit_entry_per_chunk(devs, client, monkeypatch, capsys):
+    developer_repo, rows = devs
+    monkeypatch.setattr(appy, 'BULK_DELETE_CHUNK_SIZE', 3)
+    ids = [row['id'] for row in rows[:7]]
+
+    response = client.post('/admin/delete-bulk', json={'ids': ids + ['no-es-un-uuid']})
+    result = response.get_json()
+
+    assert response.status_code == 200
+    assert result['deleted'] == 7
+    assert result['invalid'] == ['no-es-un-uuid']
+    assert developer_repo.count() == 5
+    assert capsys.readouterr().out.count('DEVELOPERS_BULK_DELETED') == 3
+
+
+def test_bulk_delete_reports_missing_ids(devs, client):
+    developer_repo, rows = devs
+    client.post(f"/admin/delete/{rows[0]['id']}")
+
+    result = client.post('/admin/delete-bulk', json={'ids': [rows[0]['id'], rows[1]['id']]}).get_json()
+    assert result['deleted_ids'] == [rows[1]['id']]
+    assert result['not_found'] == [rows[0]['id']]
+
+
+def test_bulk_delete_from_form_redirects_to_dashboard(devs, client):
+    developer_repo, rows = devs
+    response = client.post('/admin/delete-bulk', data={'ids': [rows[0]['id'], rows[1]['id']]})
+    assert response.status_code == 302
+    assert developer_repo.count() == 10
+
+
+def test_bulk_delete_requires_ids(devs, client):
+    assert client.post('/admin/delete-bulk', json={'ids': []}).status_code == 400
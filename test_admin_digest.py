@@ -0,0 +1,53 @@
+import time
+
+from admin_digest import AdminDigest, DIGEST, IMMEDIATE
+
+
+def make_digest(**kwargs):
+    singles, digests = [], []
+    digest = AdminDigest(send_single=singles.append, send_digest=digests.append, **kwargs)
+    return digest, singles, digests
+
+
+def test_immediate_mode_sends_every_registration():
+    digest, singles, digests = make_digest(mode=IMMEDIATE)
+    for i in range(3):
+        digest.add({'name': f'Dev {i}'})
+    assert len(singles) == 3
+    assert digests == []
+
+
+def test_digest_flushes_every_n_registrations():
+    digest, singles, digests = make_digest(mode=DIGEST, max_events=3, window_seconds=60,
+                                           immediate_first_of_day=False)
+    for i in range(7):
+        digest.add({'name': f'Dev {i}'})
+
+    assert singles == []
+    assert [len(batch) for batch in digests] == [3, 3]
+    stats = digest.stats()
+    assert stats['buffered'] == 1
+    assert stats['coalesced'] == 4
+
+    digest.flush()
+    assert [len(batch) for batch in digests] == [3, 3, 1]
+
+
+def test_first_registration_of_the_day_is_sent_immediately():
+    digest, singles, digests = make_digest(mode=DIGEST, max_events=10, window_seconds=60)
+    digest.add({'name': 'Primera'})
+    digest.add({'name': 'Segunda'})
+
+    assert [u['name'] for u in singles] == ['Primera']
+    assert digest.stats()['buffered'] == 1
+    digest.flush()
+
+
+def test_digest_flushes_when_window_expires():
+    digest, _, digests = make_digest(mode=DIGEST, max_events=10, window_seconds=0.05,
+                                     immediate_first_of_day=False)
+    digest.add({'name': 'Dev'})
+    deadline = time.time() + 2
+    while not digests and time.time() < deadline:
+        time.sleep(0.01)
+    assert [len(batch) for batch in digests] == [1]
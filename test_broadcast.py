@@ -0,0 +1,166 @@
+import threading
+import time
+
+from broadcast import (BroadcastMailer, BroadcastStore, TokenBucket,
+                       CANCELLED, COMPLETED, INTERRUPTED, RUNNING, SENDING)
+
+
+DEVELOPERS = [{'id': f'{i:04d}', 'name': f'Dev {i}', 'email': f'dev{i}@example.com'} for i in range(25)]
+
+
+def fetch_page(after_id, limit):
+    rows = [d for d in DEVELOPERS if after_id is None or d['id'] > after_id]
+    return rows[:limit]
+
+
+def wait_for(mailer, broadcast_id, status, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        progress = mailer.progress(broadcast_id)
+        if progress['status'] == status and not mailer._running:
+            return progress
+        time.sleep(0.01)
+    raise AssertionError(f"El envío no llegó a {status}: {mailer.progress(broadcast_id)}")
+
+
+def make_mailer(tmp_path, send, **kwargs):
+    return BroadcastMailer(BroadcastStore(str(tmp_path / 'broadcast.db')), fetch_page, send,
+                           TokenBucket(rate=10000, capacity=10000), workers=3, page_size=10, **kwargs)
+
+
+def test_broadcast_sends_to_every_developer_once(tmp_path):
+    sent = []
+    lock = threading.Lock()
+
+    def send(broadcast, recipient):
+        with lock:
+            sent.append(recipient['email'])
+
+    mailer = make_mailer(tmp_path, send)
+    broadcast_id = mailer.start('Evento', 'Cuerpo', total=len(DEVELOPERS))
+    progress = wait_for(mailer, broadcast_id, COMPLETED)
+
+    assert sorted(sent) == sorted(d['email'] for d in DEVELOPERS)
+    assert progress['sent'] == 25
+    assert progress['remaining'] == 0
+
+
+def test_resume_skips_recipients_already_processed(tmp_path):
+    store = BroadcastStore(str(tmp_path / 'broadcast.db'))
+    broadcast_id = store.create('Evento', 'Cuerpo', total=len(DEVELOPERS))
+    # Simula un worker que murió: 10 enviados, uno a medias y checkpoint en la primera página
+    for dev in DEVELOPERS[:10]:
+        store.mark_recipient(broadcast_id, dev['id'], dev['email'], 'sent')
+    store.mark_recipient(broadcast_id, DEVELOPERS[10]['id'], DEVELOPERS[10]['email'], SENDING)
+    store.heartbeat(broadcast_id, DEVELOPERS[9]['id'])
+    store.set_status(broadcast_id, INTERRUPTED)
+
+    sent = []
+    mailer = BroadcastMailer(store, fetch_page, lambda b, r: sent.append(r['id']),
+                             TokenBucket(rate=10000), workers=1, page_size=10)
+    assert mailer.resume(broadcast_id)
+    progress = wait_for(mailer, broadcast_id, COMPLETED)
+
+    assert sent == [d['id'] for d in DEVELOPERS[11:]]
+    assert progress['sent'] == 24
+
+
+def test_only_one_worker_resumes_a_stale_broadcast(tmp_path):
+    path = str(tmp_path / 'broadcast.db')
+    store = BroadcastStore(path)
+    broadcast_id = store.create('Evento', 'Cuerpo', total=len(DEVELOPERS))
+    store._execute("UPDATE broadcasts SET heartbeat_at = ? WHERE id = ?", (time.time() - 120, broadcast_id))
+
+    sent = []
+    lock = threading.Lock()
+
+    def send(broadcast, recipient):
+        with lock:
+            sent.append(recipient['id'])
+
+    # Dos workers (cada uno con su conexión) ven el mismo envío sin heartbeat
+    mailers = [BroadcastMailer(BroadcastStore(path), fetch_page, send, TokenBucket(rate=10000),
+                               workers=1, page_size=10, stale_after=60) for _ in range(2)]
+    resumed = [mailer.resume(broadcast_id) for mailer in mailers]
+    assert sorted(resumed) == [False, True]
+
+    winner = mailers[resumed.index(True)]
+    wait_for(winner, broadcast_id, COMPLETED)
+    assert sorted(sent) == [d['id'] for d in DEVELOPERS]
+
+
+def test_running_broadcast_with_recent_heartbeat_is_not_resumed(tmp_path):
+    store = BroadcastStore(str(tmp_path / 'broadcast.db'))
+    broadcast_id = store.create('Evento', 'Cuerpo', total=len(DEVELOPERS))
+    mailer = BroadcastMailer(store, fetch_page, lambda b, r: None, TokenBucket(rate=10000), stale_after=60)
+
+    assert not mailer.resume(broadcast_id)
+    assert store.get(broadcast_id)['status'] == RUNNING
+
+
+def test_heartbeat_is_refreshed_while_retrying(tmp_path):
+    class SmtpDown(Exception):
+        pass
+
+    recovered = threading.Event()
+
+    def send(broadcast, recipient):
+        if not recovered.is_set():
+            raise SmtpDown()
+
+    mailer = make_mailer(tmp_path, send, retry_exceptions=(SmtpDown,), retry_delay=0.01)
+    broadcast_id = mailer.start('Evento', 'Cuerpo', total=len(DEVELOPERS))
+    first = mailer.store.get(broadcast_id)['heartbeat_at']
+    deadline = time.time() + 5
+    while mailer.store.get(broadcast_id)['heartbeat_at'] == first and time.time() < deadline:
+        time.sleep(0.01)
+    assert mailer.store.get(broadcast_id)['heartbeat_at'] > first
+    assert mailer.progress(broadcast_id)['sent'] == 0
+
+    recovered.set()
+    progress = wait_for(mailer, broadcast_id, COMPLETED)
+    assert progress['sent'] == 25
+
+
+def test_cancel_from_another_worker_stops_the_run(tmp_path):
+    class SmtpDown(Exception):
+        pass
+
+    attempts = threading.Event()
+
+    def send(broadcast, recipient):
+        attempts.set()
+        raise SmtpDown()
+
+    mailer = make_mailer(tmp_path, send, retry_exceptions=(SmtpDown,), retry_delay=0.01)
+    broadcast_id = mailer.start('Evento', 'Cuerpo', total=len(DEVELOPERS))
+    assert attempts.wait(5)
+
+    # Otro worker no tiene el envío en _running: solo cambia el estado persistido
+    other = BroadcastMailer(BroadcastStore(mailer.store.path), fetch_page, send, TokenBucket(rate=10000))
+    other.cancel(broadcast_id)
+
+    progress = wait_for(mailer, broadcast_id, CANCELLED)
+    assert progress['sent'] == 0
+    assert mailer.store.get(broadcast_id)['status'] == CANCELLED
+
+
+def test_failures_are_recorded(tmp_path):
+    def send(broadcast, recipient):
+        if recipient['id'] == '0003':
+            raise ValueError('buzón inexistente')
+
+    mailer = make_mailer(tmp_path, send)
+    broadcast_id = mailer.start('Evento', 'Cuerpo', total=len(DEVELOPERS))
+    progress = wait_for(mailer, broadcast_id, COMPLETED)
+
+    assert progress['failed'] == 1
+    assert progress['recent_failures'][0]['email'] == 'dev3@example.com'
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=100, capacity=1)
+    started = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.09
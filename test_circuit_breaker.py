@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+from smtp_health import SMTPHealthMonitor
+
+
+def failing():
+    raise ConnectionError('proveedor caído')
+
+
+def test_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker('test', failure_threshold=2, recovery_timeout=60)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(failing)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: 'no debería ejecutarse')
+    assert breaker.snapshot()['rejected_calls'] == 1
+
+
+def test_half_open_trial_closes_circuit():
+    breaker = CircuitBreaker('test', failure_threshold=1, recovery_timeout=0.05)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    time.sleep(0.06)
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()      # solo una llamada de prueba a la vez
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    transitions = [t['to'] for t in breaker.snapshot()['transitions']]
+    assert transitions == [OPEN, HALF_OPEN, CLOSED]
+
+
+def test_failed_trial_reopens_circuit():
+    breaker = CircuitBreaker('test', failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_health_monitor_caches_probe_result():
+    calls = []
+    monitor = SMTPHealthMonitor(probe=lambda: calls.append(1),
+                                breaker=CircuitBreaker('smtp'), ttl=60)
+    assert monitor.is_stale()
+    assert monitor.refresh()
+
+    assert not monitor.is_stale()
+    assert monitor.is_healthy()
+    assert len(calls) == 1
+    assert monitor.snapshot()['breaker']['state'] == CLOSED
+
+
+def test_health_monitor_failures_open_breaker():
+    breaker = CircuitBreaker('smtp', failure_threshold=2, recovery_timeout=60)
+    monitor = SMTPHealthMonitor(probe=failing, breaker=breaker, ttl=60)
+    monitor.refresh()
+    monitor.report_failure('SMTPServerDisconnected')
+
+    assert not monitor.is_healthy()
+    assert breaker.state == OPEN
+    assert monitor.snapshot()['last_error'] == 'SMTPServerDisconnected'
@@ -0,0 +1,137 @@
+import time
+
+import pytest
+
+import appy
+from circuit_breaker import CircuitBreaker, CLOSED, OPEN
+from database_guard import DatabaseConnection, DatabaseUnavailableError
+from repository import DuplicateEmailError, create_repositories
+from seed_local_db import fake_developers
+
+
+class FlakyRepository:
+    def __init__(self):
+        self.down = False
+        self.delay = 0
+
+    def count(self, mode='exact'):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.down:
+            raise ConnectionError('supabase caído')
+        return 7
+
+    def insert(self, developer):
+        raise DuplicateEmailError(developer['email'])
+
+    def upsert_many(self, developers):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.down:
+            raise ConnectionError('supabase caído')
+        return developers
+
+
+def test_connection_is_retried_lazily_after_startup_failure():
+    attempts = []
+
+    def connect():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError('sin red al arrancar')
+        return FlakyRepository(), None
+
+    database = DatabaseConnection(connect, CircuitBreaker('db', failure_threshold=1, recovery_timeout=0.05))
+    with pytest.raises(ConnectionError):
+        database.developers.count()
+    # Circuito abierto: no se reintenta la conexión en cada petición
+    with pytest.raises(DatabaseUnavailableError):
+        database.developers.count()
+
+    time.sleep(0.06)
+    assert database.developers.count() == 7
+    assert len(attempts) == 2 and database.snapshot()['connected']
+
+
+def test_open_circuit_fails_fast_and_business_errors_do_not_count():
+    repo = FlakyRepository()
+    breaker = CircuitBreaker('db', failure_threshold=2, recovery_timeout=60)
+    database = DatabaseConnection(lambda: (repo, None), breaker, ignore=(DuplicateEmailError,))
+
+    for _ in range(3):
+        with pytest.raises(DuplicateEmailError):
+            database.developers.insert({'email': 'ana@example.com'})
+    assert breaker.state == CLOSED
+
+    repo.down = True
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            database.developers.count()
+    assert breaker.state == OPEN and not database.available
+
+    repo.delay = 1
+    started = time.perf_counter()
+    with pytest.raises(DatabaseUnavailableError):
+        database.developers.count()
+    assert time.perf_counter() - started < 0.1
+
+
+def test_slow_calls_open_the_circuit():
+    repo = FlakyRepository()
+    repo.delay = 0.02
+    breaker = CircuitBreaker('db', failure_threshold=2, recovery_timeout=60)
+    database = DatabaseConnection(lambda: (repo, None), breaker, slow_call_seconds=0.01)
+
+    assert database.developers.count() == 7
+    assert database.developers.count() == 7
+    assert breaker.state == OPEN
+    assert 'lenta' in database.snapshot()['last_error']
+
+
+def test_slow_bulk_writes_do_not_open_the_circuit():
+    repo = FlakyRepository()
+    repo.delay = 0.02
+    breaker = CircuitBreaker('db', failure_threshold=2, recovery_timeout=60)
+    database = DatabaseConnection(lambda: (repo, None), breaker, slow_call_seconds=0.01,
+                                  slow_call_exempt=('upsert_many',))
+
+    for _ in range(3):
+        database.developers.upsert_many([{'id': '1'}])
+    assert breaker.state == CLOSED
+
+    # Los errores de una escritura masiva sí cuentan
+    repo.down = True
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            database.developers.upsert_many([{'id': '1'}])
+    assert breaker.state == OPEN
+
+
+def test_dashboard_serves_stale_snapshot_when_database_is_down(tmp_path, monkeypatch):
+    repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    repo.insert_many(fake_developers(5))
+    breaker = CircuitBreaker('db', failure_threshold=1, recovery_timeout=60)
+    database = DatabaseConnection(lambda: (repo, None), breaker)
+    monkeypatch.setattr(appy, 'database', database)
+    monkeypatch.setattr(appy, 'developer_repo', database.developers)
+    appy.developer_cache.clear()
+    appy.dashboard_snapshots.clear()
+    appy.developer_counter.invalidate()
+    appy.app.config['TESTING'] = True
+
+    with appy.app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+        fresh = client.get('/admin/dashboard')
+        assert b'desactualizado' not in fresh.data
+
+        appy.developer_cache.clear()
+        breaker.record_failure('caída simulada')
+        stale = client.get('/admin/dashboard')
+        home = client.get('/')
+
+    assert stale.status_code == 200 and home.status_code == 200
+    assert b'copia guardada' in stale.data
+    assert b'Total registros: 5 (desactualizado)' in stale.data
+    assert b'<strong>5</strong> perfiles registrados (desactualizado)' in home.data
+    appy.developer_counter.invalidate()
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from developer_counter import CachedCounter
+
+
+class FakeCount:
+    def __init__(self, value=10, delay=0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError('supabase caído')
+        return self.value
+
+
+def test_value_is_cached_within_ttl():
+    fetch = FakeCount()
+    counter = CachedCounter(fetch, ttl=60)
+
+    assert counter.get() == 10
+    assert counter.get() == 10
+    assert fetch.calls == 1
+
+
+def test_stale_value_is_served_while_refreshing_in_background():
+    fetch = FakeCount(delay=0.1)
+    counter = CachedCounter(fetch, ttl=0.05, stale_ttl=60)
+    counter.get()
+    fetch.value = 12
+    time.sleep(0.06)
+
+    started = time.monotonic()
+    assert counter.get() == 10
+    assert time.monotonic() - started < 0.05
+
+    deadline = time.monotonic() + 2
+    while counter.get() != 12 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert counter.get() == 12
+    assert fetch.calls == 2
+
+
+def test_concurrent_misses_share_one_query():
+    fetch = FakeCount(delay=0.05)
+    counter = CachedCounter(fetch, ttl=60)
+    threads = [threading.Thread(target=counter.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fetch.calls == 1
+
+
+def test_optimistic_adjustments():
+    counter = CachedCounter(FakeCount(), ttl=60)
+    counter.get()
+    counter.increment()
+    counter.increment()
+    counter.decrement()
+
+    assert counter.get() == 11
+
+
+def test_errors_fall_back_to_last_value():
+    fetch = FakeCount()
+    counter = CachedCounter(fetch, ttl=0, stale_ttl=0)
+    assert counter.get() == 10
+
+    fetch.fail = True
+    assert counter.get() == 10
+    assert counter.stats()['refresh_errors'] == 1
+    assert counter.is_stale()
+
+    fetch.fail = False
+    assert counter.get() == 10 and not counter.is_stale()
+    fetch.fail = True
+    counter.get()
+
+    counter.invalidate()
+    with pytest.raises(ConnectionError):
+        counter.get()
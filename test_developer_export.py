@@ -0,0 +1,111 @@
+import csv
+import gzip
+import io
+import json
+import os
+
+import pytest
+
+import appy
+from developer_export import export_stream, iter_export_pages, parse_columns, stream_json
+from repository import create_repositories
+from seed_local_db import fake_developers
+
+
+@pytest.fixture
+def repo(tmp_path):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    return developer_repo
+
+
+def test_pages_walk_the_table_newest_first(repo):
+    repo.insert_many(fake_developers(250))
+    pages = list(iter_export_pages(repo, page_size=100))
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    rows = [row for page in pages for row in page]
+    assert len({row['id'] for row in rows}) == 250
+    assert [row['created_at'] for row in rows] == sorted((row['created_at'] for row in rows), reverse=True)
+    assert rows[0]['skill_tags'] is not None
+
+
+def test_pages_survive_a_server_row_cap(repo):
+    repo.insert_many(fake_developers(250))
+
+    class CappedRepository:
+        """Como PostgREST con max-rows: nunca devuelve más de 60 filas"""
+
+        def page(self, filters=None, cursor=None, page_size=100, columns='*', max_page_size=100):
+            # La fila de más no llega: page() no puede saber que hay página siguiente
+            rows, _ = repo.page(filters, cursor, min(page_size, 60), columns, max_page_size=60)
+            return rows, None
+
+    rows = [row for page in iter_export_pages(CappedRepository(), page_size=100) for row in page]
+    assert len({row['id'] for row in rows}) == 250
+
+
+def test_stream_json_is_a_valid_array():
+    totals = []
+    assert json.loads(''.join(stream_json(iter([]), on_finish=totals.append))) == []
+    chunks = list(stream_json(iter([[{'id': 1}, {'id': 2}], [{'id': 3, 'name': 'Begoña'}]]),
+                              on_finish=totals.append))
+    assert json.loads(''.join(chunks)) == [{'id': 1}, {'id': 2}, {'id': 3, 'name': 'Begoña'}]
+    assert len(chunks) == 4 and totals == [0, 3]
+
+
+def test_export_endpoint_streams_without_files(repo, tmp_path, monkeypatch):
+    repo.insert_many(fake_developers(120))
+    monkeypatch.setattr(appy, 'developer_repo', repo)
+    monkeypatch.setattr(appy, 'EXPORT_PAGE_SIZE', 50)
+    monkeypatch.setattr(repo, 'list_all', lambda *a: pytest.fail('no debe cargar la tabla entera'))
+    monkeypatch.chdir(tmp_path)
+    appy.app.config['TESTING'] = True
+
+    with appy.app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+        response = client.get('/admin/export')
+        assert response.is_streamed
+        rows = json.loads(response.get_data(as_text=True))
+
+    assert len(rows) == 120
+    assert response.headers['Content-Disposition'].startswith('attachment; filename=developers_export_')
+    assert not any(name.endswith('.json') for name in os.listdir(tmp_path))
+
+
+def test_formats_and_gzip_round_trip(repo):
+    repo.insert_many(fake_developers(30))
+    columns = parse_columns('email, skill_tags,name')
+    expected = [[row['email'], row['skill_tags'], row['name']]
+                for row in repo.page(None, None, 100, 'id, created_at, email, skill_tags, name')[0]]
+
+    ndjson = b''.join(export_stream(iter_export_pages(repo, 7, columns), 'ndjson', columns, 'gzip'))
+    rows = [json.loads(line) for line in gzip.decompress(ndjson).decode('utf-8').splitlines()]
+    assert [list(row) for row in rows] == [list(columns)] * 30
+    assert [[row[column] for column in columns] for row in rows] == expected
+
+    text = b''.join(export_stream(iter_export_pages(repo, 7, columns), 'csv', columns)).decode('utf-8')
+    table = list(csv.reader(io.StringIO(text)))
+    assert table[0] == ['email', 'skill_tags', 'name'] and len(table) == 31
+    assert table[1] == [expected[0][0], ', '.join(expected[0][1]), expected[0][2]]
+
+    with pytest.raises(ValueError):
+        parse_columns('name,password')
+
+
+def test_export_endpoint_parameters(repo, monkeypatch):
+    repo.insert_many(fake_developers(12))
+    monkeypatch.setattr(appy, 'developer_repo', repo)
+    appy.app.config['TESTING'] = True
+
+    with appy.app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+        response = client.get('/admin/export?format=csv&compression=gzip&columns=name,email')
+        assert client.get('/admin/export?format=xml').status_code == 400
+        assert client.get('/admin/export?columns=hashed_password').status_code == 400
+
+    assert response.mimetype == 'application/gzip'
+    assert response.headers['Content-Disposition'].endswith('.csv.gz')
+    lines = gzip.decompress(response.get_data()).decode('utf-8').splitlines()
+    assert lines[0] == 'name,email' and len(lines) == 13
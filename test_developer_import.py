@@ -0,0 +1,158 @@
+import io
+import json
+import time
+
+import pytest
+
+import appy
+from developer_import import (
+    MERGE, SKIP, DeveloperImporter, ImportFormatError, iter_json_array, iter_records, validate_developer,
+)
+from repository import DEVELOPER_FIELDS, create_repositories
+from seed_local_db import fake_developers
+
+
+@pytest.fixture
+def repo(tmp_path):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    return developer_repo
+
+
+def records(text, file_format=None, filename=None):
+    return list(iter_records(io.BytesIO(text.encode('utf-8')), file_format, filename))
+
+
+def test_json_array_is_read_in_small_chunks():
+    rows = list(fake_developers(20))
+    text = json.dumps(rows, ensure_ascii=False, indent=2)
+    assert list(iter_json_array(io.StringIO(text), chunk_size=7)) == rows
+
+
+def test_json_array_errors():
+    with pytest.raises(ImportFormatError):
+        list(iter_json_array(io.StringIO('{"a": 1}')))
+    with pytest.raises(ImportFormatError):
+        list(iter_json_array(io.StringIO('[{"a": 1}, {"b":'), chunk_size=4))
+
+
+def test_formats_are_detected():
+    assert records('﻿name,email\nAna,ana@x.com\n') == [{'name': 'Ana', 'email': 'ana@x.com'}]
+    assert records('{"name": "Ana"}\nno json\n', filename='devs.jsonl')[1]['__error__'].startswith('Línea 2')
+    assert records('  [{"name": "Ana"}]') == [{'name': 'Ana'}]
+
+
+def test_validation_uses_submit_rules():
+    row, error = validate_developer({'name': 'Ana', 'email': ' Ana@X.com ', 'skills': 'Solidity',
+                                     'experience_years': '3'})
+    assert error is None
+    assert row['email'] == 'ana@x.com' and row['experience_years'] == 3
+
+    assert 'faltantes' in validate_developer({'name': 'Ana'})[1]
+    assert 'entre 0 y 50' in validate_developer({'name': 'A', 'email': 'a@b.co', 'skills': 'x',
+                                                 'experience_years': 80})[1]
+
+
+def test_import_skips_duplicates_and_reports_errors(repo):
+    existing = list(fake_developers(3))
+    repo.insert_many(existing)
+    incoming = [
+        {**existing[0], 'email': existing[0]['email'].upper(), 'id': None, 'skills': 'Rust'},
+        {'name': 'Nueva', 'email': 'nueva@example.com', 'skills': 'Go', 'experience_years': 2},
+        {'name': 'Repetida', 'email': 'NUEVA@example.com', 'skills': 'Go', 'experience_years': 2},
+        {'name': 'Mala', 'email': 'no-es-email', 'skills': 'Go', 'experience_years': 2},
+    ]
+    progress = []
+
+    report = DeveloperImporter(repo, mode=SKIP, chunk_size=2, progress=lambda r: progress.append(r['processed'])) \
+        .run(incoming)
+
+    assert report['status'] == 'completed'
+    assert (report['inserted'], report['skipped_duplicates'], report['errors']) == (1, 2, 1)
+    assert report['error_rows'][0]['row'] == 4
+    assert progress[0] == 2
+    assert repo.count() == 4
+    assert repo.find_by_emails([existing[0]['email']])[0]['skills'] == existing[0]['skills']
+
+
+def test_import_merges_duplicates(repo):
+    existing = list(fake_developers(1))[0]
+    repo.insert_many([existing])
+
+    report = DeveloperImporter(repo, mode=MERGE).run([
+        {'name': existing['name'], 'email': existing['email'], 'skills': 'Rust, Move', 'experience_years': 9},
+    ])
+
+    merged = repo.get(existing['id'])
+    assert report['merged'] == 1
+    assert merged['skills'] == 'Rust, Move' and merged['experience_years'] == 9
+    assert merged['created_at'] == existing['created_at']
+
+
+def test_merge_only_writes_developer_columns(repo, monkeypatch):
+    existing = list(fake_developers(1))[0]
+    repo.insert_many([existing])
+    find_by_emails, upserted = repo.find_by_emails, []
+
+    def find_with_generated_column(emails, columns='*'):
+        # Como Supabase con '*': la fila trae la columna generada search_vector
+        return [{**row, 'search_vector': "'rust':1"} for row in find_by_emails(emails, columns)]
+
+    monkeypatch.setattr(repo, 'find_by_emails', find_with_generated_column)
+    monkeypatch.setattr(repo, 'upsert_many', lambda rows: upserted.extend(rows) or rows)
+    report = DeveloperImporter(repo, mode=MERGE).run([
+        {'name': existing['name'], 'email': existing['email'], 'skills': 'Rust', 'experience_years': 9},
+    ])
+
+    assert report['merged'] == 1
+    assert 'search_vector' not in upserted[0]
+    assert set(upserted[0]) <= set(DEVELOPER_FIELDS)
+
+
+def test_failed_chunk_falls_back_to_row_by_row(repo, monkeypatch):
+    rows = list(fake_developers(4))
+    insert_many = repo.insert_many
+
+    def flaky_insert(batch):
+        if any(row['email'] == rows[2]['email'] for row in batch):
+            raise RuntimeError('fila rechazada')
+        return insert_many(batch)
+
+    monkeypatch.setattr(repo, 'insert_many', flaky_insert)
+    report = DeveloperImporter(repo, chunk_size=10).run(rows)
+
+    assert report['inserted'] == 3
+    assert report['error_rows'] == [{'row': 3, 'email': rows[2]['email'], 'error': 'RuntimeError: fila rechazada'}]
+
+
+def test_dry_run_does_not_write(repo):
+    report = DeveloperImporter(repo, dry_run=True).run(fake_developers(5))
+    assert report['inserted'] == 5
+    assert repo.count() == 0
+
+
+def test_admin_import_endpoint(repo, tmp_path, monkeypatch):
+    monkeypatch.setattr(appy, 'developer_repo', repo)
+    monkeypatch.setattr(appy, 'IMPORT_DIR', str(tmp_path / 'imports'))
+    appy.app.config['TESTING'] = True
+    payload = '\n'.join(json.dumps(row) for row in fake_developers(6)) + '\n{"name": "sin email"}\n'
+
+    with appy.app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+            sess['admin_username'] = 'admin'
+        response = client.post('/admin/import', data={
+            'file': (io.BytesIO(payload.encode()), 'devs.ndjson'), 'chunk_size': '4',
+        }, content_type='multipart/form-data')
+        assert response.status_code == 202
+
+        status_url = response.get_json()['status_url']
+        for _ in range(100):
+            report = client.get(status_url).get_json()
+            if report['status'] != 'running':
+                break
+            time.sleep(0.02)
+
+        assert report['status'] == 'completed'
+        assert report['inserted'] == 6 and report['errors'] == 1
+        assert repo.count() == 6
+        assert client.get('/admin/import/no-existe').status_code == 404
@@ -0,0 +1,144 @@
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from developer_pages import (InvalidCursorError, decode_cursor, encode_cursor, fetch_page,
+                             parse_filters)
+
+
+KEYSET = re.compile(r'^\(created_at\.lt\."(.+)",and\(created_at\.eq\."(.+)",id\.lt\."(.+)"\)\)$')
+
+
+class FakeQuery:
+    """Imita el query builder de postgrest sobre una lista en memoria"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def select(self, columns):
+        self.calls.append(('select', columns))
+        return self
+
+    def ilike(self, column, pattern):
+        self.calls.append(('ilike', column, pattern))
+        return self
+
+    def contains(self, column, values):
+        self.calls.append(('contains', column, values))
+        return self
+
+    def gte(self, column, value):
+        self.calls.append(('gte', column, value))
+        return self
+
+    def lte(self, column, value):
+        self.calls.append(('lte', column, value))
+        return self
+
+    def or_(self, filters):
+        self.calls.append(('or', f"({filters})"))
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def limit(self, size):
+        self.calls.append(('limit', size))
+        return self
+
+    def execute(self):
+        rows = list(self.rows)
+        for call in self.calls:
+            if call[0] == 'ilike':
+                needle = call[2].strip('%').replace('\\', '').lower()
+                rows = [r for r in rows if needle in (r[call[1]] or '').lower()]
+            elif call[0] == 'contains':
+                rows = [r for r in rows if set(call[2]) <= set(r[call[1]])]
+            elif call[0] == 'gte':
+                rows = [r for r in rows if r[call[1]] >= call[2]]
+            elif call[0] == 'lte':
+                rows = [r for r in rows if r[call[1]] <= call[2]]
+            elif call[0] == 'or':
+                created_at, _, dev_id = KEYSET.match(call[1]).groups()
+                rows = [r for r in rows if (r['created_at'], r['id']) < (created_at, dev_id)]
+        rows.sort(key=lambda r: (r['created_at'], r['id']), reverse=True)
+        limit = [c[1] for c in self.calls if c[0] == 'limit'][-1]
+        return SimpleNamespace(data=rows[:limit])
+
+
+class FakeTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.last_query = None
+
+    def select(self, columns):
+        self.last_query = FakeQuery(self.rows).select(columns)
+        return self.last_query
+
+
+def make_rows(n):
+    # Varias filas comparten created_at para probar el desempate por id
+    return [{
+        'id': f'{i:05d}',
+        'name': f'Dev {i}',
+        'created_at': f'2025-01-{1 + i // 3:02d}T10:00:00',
+        'experience_years': i % 10,
+        'location': 'Toledo' if i % 2 else 'Albacete',
+        'skills': 'Solidity, Rust' if i % 5 == 0 else 'Python',
+        'skill_tags': ['Solidity', 'Rust'] if i % 5 == 0 else ['Python'],
+    } for i in range(n)]
+
+
+def walk(table, filters=None, page_size=7):
+    seen, cursor, pages = [], None, 0
+    while True:
+        rows, cursor = fetch_page(table, filters, cursor, page_size)
+        seen.extend(r['id'] for r in rows)
+        pages += 1
+        assert len(rows) <= page_size
+        if not cursor:
+            return seen, pages
+
+
+def test_walks_every_developer_once_in_order():
+    rows = make_rows(50)
+    seen, pages = walk(FakeTable(rows))
+
+    expected = [r['id'] for r in sorted(rows, key=lambda r: (r['created_at'], r['id']), reverse=True)]
+    assert seen == expected
+    assert pages == 8
+
+
+def test_filters_are_applied_on_the_server():
+    table = FakeTable(make_rows(50))
+    filters = parse_filters({'location': 'tol', 'skill': 'rust', 'min_experience': '3', 'max_experience': ''})
+    seen, _ = walk(table, filters)
+
+    assert seen == [f'{i:05d}' for i in sorted(range(50), reverse=True)
+                    if i % 2 and i % 5 == 0 and i % 10 >= 3]
+    calls = table.last_query.calls
+    assert ('ilike', 'location', '%tol%') in calls
+    assert ('contains', 'skill_tags', ['Rust']) in calls
+    assert ('gte', 'experience_years', 3) in calls
+    assert not any(c[0] == 'lte' for c in calls)
+
+
+def test_only_card_columns_are_requested():
+    table = FakeTable(make_rows(3))
+    fetch_page(table)
+    assert '*' not in table.last_query.calls[0][1]
+
+
+def test_like_wildcards_are_escaped():
+    table = FakeTable([])
+    fetch_page(table, {'location': '100%_real'})
+    assert ('ilike', 'location', '%100\\%\\_real%') in table.last_query.calls
+
+
+def test_cursor_round_trip_and_tampering():
+    token = encode_cursor({'created_at': '2025-01-01T10:00:00+00:00', 'id': 'abc'})
+    assert decode_cursor(token) == ('2025-01-01T10:00:00+00:00', 'abc')
+    with pytest.raises(InvalidCursorError):
+        decode_cursor('no-es-un-cursor')
@@ -0,0 +1,116 @@
+import pytest
+
+import appy
+from developer_search import SearchIndex, build_tsquery, tokenize
+from repository import SupabaseDeveloperRepository, create_repositories
+from seed_local_db import fake_developers
+
+
+def dev(dev_id, name, skills, location='Toledo', experience_years=3, created_at='2025-01-01T00:00:00'):
+    return {'id': dev_id, 'name': name, 'email': f"{dev_id}@example.com", 'skills': skills,
+            'experience_years': experience_years, 'location': location, 'created_at': created_at}
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.build([
+        dev('a', 'Ana Solís', 'Solidity, Rust', 'Madrid', 6),
+        dev('b', 'Bruno', 'Python, Django', 'Solana Beach', 1),
+        dev('c', 'Carla', 'Solidity, Go', 'Toledo', 12),
+    ])
+    return index
+
+
+def test_tokenize_folds_accents_and_builds_prefix_query():
+    assert tokenize('Ciudad Real, Node.js  y Málaga') == ['ciudad', 'real', 'node', 'js', 'y', 'malaga']
+    assert build_tsquery('Solidity  solidity  MADRID') == 'solidity:* & madrid:*'
+    assert build_tsquery('!!!') == ''
+
+
+def test_ranked_prefix_search(index):
+    result = index.search('sol')
+    ids = [row['id'] for row in result['results']]
+    # skills pesa más que name, y name más que location
+    assert ids[-1] == 'b'
+    assert set(ids) == {'a', 'b', 'c'}
+
+    assert [row['id'] for row in index.search('solidity madrid')['results']] == ['a']
+
+
+def test_filters_and_facets(index):
+    result = index.search('solidity', {'min_experience': 5})
+    assert result['total'] == 2
+    assert result['facets']['skills'][0] == {'value': 'Solidity', 'count': 2}
+    assert result['facets']['experience'] == [{'value': '5-9', 'count': 1}, {'value': '10+', 'count': 1}]
+
+    everything = index.search('')
+    assert everything['total'] == 3
+    assert {item['value'] for item in everything['facets']['locations']} == {'Madrid', 'Solana Beach', 'Toledo'}
+    # El filtro de habilidad usa la etiqueta canónica: 'sol' es Solidity, no Solana Beach
+    assert index.search('', {'skill': 'sol'})['total'] == 2
+
+
+def test_incremental_updates(index):
+    index.add(dev('d', 'Dani', 'Move, Solidity'))
+    assert index.search('move')['total'] == 1
+
+    index.add(dev('d', 'Dani', 'Cairo'))
+    assert index.search('move')['total'] == 0
+    index.remove('a')
+    assert [row['id'] for row in index.search('solidity')['results']] == ['c']
+
+
+def test_sqlite_repository_keeps_index_up_to_date(tmp_path):
+    path = str(tmp_path / 'devpool.db')
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=path)
+    rows = list(fake_developers(50))
+    developer_repo.insert_many(rows)
+    assert developer_repo.search('')['total'] == 50
+
+    developer_repo.insert(dev('00000000-0000-4000-8000-000000000001', 'Zoe', 'Zkvm, StarkNet'))
+    assert developer_repo.search('starknet')['total'] == 1
+    developer_repo.delete(rows[0]['id'])
+    assert developer_repo.search('')['total'] == 50
+
+    # Escritura desde otro proceso (otra conexión): se detecta y se reconstruye
+    other_worker, _ = create_repositories('sqlite', sqlite_path=path)
+    other_worker.insert(dev('00000000-0000-4000-8000-000000000002', 'Iker', 'Zkvm'))
+    assert developer_repo.search('zkvm')['total'] == 2
+
+
+def test_supabase_repository_uses_rpc():
+    calls = []
+
+    class FakeRPC:
+        def __init__(self, name, params):
+            calls.append((name, params))
+
+        def execute(self):
+            return type('Response', (), {'data': {'total': 0, 'results': [], 'facets': {}}})()
+
+    repo = SupabaseDeveloperRepository(table=None, rpc=FakeRPC)
+    result = repo.search('Solidity Madr', {'location': 'Toledo'}, limit=500)
+
+    name, params = calls[0]
+    assert name == 'search_developers'
+    assert params['search_query'] == 'solidity:* & madr:*'
+    assert params['location_filter'] == 'Toledo' and params['result_limit'] == 100
+    assert 'took_ms' in result
+
+
+def test_admin_search_endpoint(tmp_path, monkeypatch):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    developer_repo.insert_many([dev('00000000-0000-4000-8000-00000000000a', 'Ana', 'Solidity', 'Madrid')])
+    monkeypatch.setattr(appy, 'developer_repo', developer_repo)
+    appy.app.config['TESTING'] = True
+
+    with appy.app.test_client() as client:
+        assert client.get('/admin/search?q=sol').status_code == 302
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+        result = client.get('/admin/search?q=sol&location=madrid').get_json()
+
+    assert result['total'] == 1
+    assert result['results'][0]['name'] == 'Ana'
+    assert result['query'] == 'sol'
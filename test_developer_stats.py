@@ -0,0 +1,107 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+import appy
+from developer_stats import MAX_DAYS, clamp_window, summarize
+from repository import SupabaseDeveloperRepository, create_repositories
+from seed_local_db import fake_developers
+
+
+@pytest.fixture
+def repo(tmp_path):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    return developer_repo
+
+
+def without_timestamp(stats):
+    stats.pop('generated_at')
+    return stats
+
+
+def test_rollups_follow_inserts_updates_and_deletes(repo):
+    devs = list(fake_developers(300))
+    for i, dev in enumerate(devs):
+        dev['created_at'] = (datetime.now(timezone.utc) - timedelta(hours=4 * i)).isoformat()
+    repo.insert_many(devs[:200])
+    repo.insert(devs[200])
+    repo.upsert_many(devs[150:300])
+    repo.update_by_email(devs[0]['email'], {'location': 'Zamora', 'skill_tags': ['Vyper'], 'experience_years': 40})
+    repo.delete_many([dev['id'] for dev in devs[10:60]])
+
+    incremental = without_timestamp(repo.stats(90, 12, 50))
+    repo.rebuild_stats()
+    assert incremental == without_timestamp(repo.stats(90, 12, 50))
+
+    assert incremental['total'] == 250
+    assert sum(day['count'] for day in incremental['per_day']) == 250
+    assert {'value': 'Zamora', 'count': 1} in incremental['locations']
+    assert {'years': 40, 'count': 1} in incremental['experience']
+
+
+def test_existing_database_gets_stats_on_first_connection(repo, tmp_path):
+    repo.insert_many(fake_developers(20))
+    repo.db.execute("DELETE FROM developer_stats")
+
+    other_worker, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    assert other_worker.stats()['total'] == 20
+
+
+def test_summarize_fills_gaps_and_ranks():
+    today = date(2025, 3, 5)  # miércoles
+    rows = [
+        {'dimension': 'total', 'bucket': '', 'total': 6},
+        {'dimension': 'day', 'bucket': '2025-03-05', 'total': 4},
+        {'dimension': 'day', 'bucket': '2025-03-03', 'total': 2},
+        {'dimension': 'week', 'bucket': '2025-03-03', 'total': 6},
+        {'dimension': 'location', 'bucket': '', 'total': 2},
+        {'dimension': 'location', 'bucket': 'Toledo', 'total': 4},
+        {'dimension': 'skill', 'bucket': 'Rust', 'total': 0},
+        {'dimension': 'experience', 'bucket': '10', 'total': 1},
+        {'dimension': 'experience', 'bucket': '2', 'total': 5},
+    ]
+    stats = summarize(rows, days=3, weeks=2, today=today)
+
+    assert stats['per_day'] == [{'bucket': '2025-03-03', 'count': 2}, {'bucket': '2025-03-04', 'count': 0},
+                                {'bucket': '2025-03-05', 'count': 4}]
+    assert stats['per_week'] == [{'bucket': '2025-02-24', 'count': 0}, {'bucket': '2025-03-03', 'count': 6}]
+    assert stats['locations'] == [{'value': 'Toledo', 'count': 4}, {'value': None, 'count': 2}]
+    assert stats['experience'] == [{'years': 2, 'count': 5}, {'years': 10, 'count': 1}]
+    assert stats['skills'] == []
+    assert clamp_window(10_000, 0, 500)[0] == MAX_DAYS
+
+
+def test_supabase_repository_reads_window_through_rpc():
+    calls = []
+
+    class FakeRPC:
+        def __init__(self, name, params):
+            calls.append((name, params))
+
+        def execute(self):
+            return type('Response', (), {'data': [{'dimension': 'total', 'bucket': '', 'total': 7}]})()
+
+    repo = SupabaseDeveloperRepository(table=None, rpc=FakeRPC)
+    stats = repo.stats(days=7, weeks=2, top=500)
+
+    name, params = calls[0]
+    today = datetime.now(timezone.utc).date()
+    assert name == 'developer_stats_window'
+    assert params['since_day'] == (today - timedelta(days=6)).isoformat()
+    assert params['top_limit'] == 50
+    assert stats['total'] == 7 and len(stats['per_day']) == 7
+
+
+def test_admin_stats_endpoint(repo, monkeypatch):
+    repo.insert_many({**dev, 'created_at': datetime.now(timezone.utc).isoformat()} for dev in fake_developers(5))
+    monkeypatch.setattr(appy, 'developer_repo', repo)
+    appy.app.config['TESTING'] = True
+
+    with appy.app.test_client() as client:
+        assert client.get('/admin/stats').status_code == 302
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+        stats = client.get('/admin/stats?days=7').get_json()
+
+    assert stats['total'] == 5
+    assert len(stats['per_day']) == 7 and len(stats['per_week']) == 12
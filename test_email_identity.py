@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+import appy
+from backfill_email_normalized import backfill
+from email_identity import EmailIndex, normalize_email
+from repository import DuplicateEmailError, create_repositories
+from seed_local_db import fake_developers
+
+
+FORM = {'name': 'Ana Pérez', 'email': 'Ana.Perez+web@GoogleMail.com', 'skills': 'Solidity',
+        'experience_years': '4', 'location': 'Toledo'}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    return developer_repo
+
+
+@pytest.fixture
+def app_repo(repo, monkeypatch):
+    monkeypatch.setattr(appy, 'developer_repo', repo)
+    monkeypatch.setattr(appy, 'email_index', EmailIndex(loader=repo.iter_email_keys, name='test'))
+    appy.developer_cache.clear()
+    appy.developer_counter.invalidate()
+    appy.app.config['TESTING'] = True
+    return repo
+
+
+def test_normalize_email():
+    assert normalize_email(' Ana.Perez+web@GoogleMail.com ') == 'anaperez@gmail.com'
+    assert normalize_email('ana.perez+x@empresa.es') == 'ana.perez@empresa.es'
+    assert normalize_email('+raro@empresa.es') == '+raro@empresa.es'
+    assert normalize_email('sin-arroba') == 'sin-arroba'
+
+
+def test_index_keeps_writes_made_during_load():
+    started, release = threading.Event(), threading.Event()
+
+    def loader():
+        yield 'a@x.com'
+        started.set()
+        release.wait(2)
+        yield 'b@x.com'
+
+    index = EmailIndex(loader=loader)
+    assert not index.contains('a@x.com')
+
+    thread = threading.Thread(target=index.load)
+    thread.start()
+    started.wait(2)
+    index.add('c@x.com')
+    index.discard('b@x.com')
+    release.set()
+    thread.join()
+
+    assert index.ready
+    assert index.contains('a@x.com') and index.contains('c@x.com')
+    assert not index.contains('b@x.com')
+
+
+def test_unique_index_rejects_variants(repo):
+    repo.insert({**next(fake_developers(1)), 'email': 'ana.perez@gmail.com'})
+    with pytest.raises(DuplicateEmailError):
+        repo.insert({**next(fake_developers(1, seed=7)), 'email': 'AnaPerez+2@gmail.com'})
+
+
+def test_submit_rejects_known_duplicate_without_querying(app_repo, monkeypatch):
+    with appy.app.test_client() as client:
+        assert client.post('/submit', data=FORM).status_code == 200
+        assert appy.email_index.stats()['size'] == 1
+
+        monkeypatch.setattr(app_repo, 'insert', lambda *a: pytest.fail('no debe consultar la BD'))
+        response = client.post('/submit', data={**FORM, 'email': 'anaperez@gmail.com'})
+
+    assert response.status_code == 409
+    assert response.get_json()['duplicate'] is True
+    assert app_repo.count() == 1
+
+
+def test_submit_detects_duplicate_from_other_worker(app_repo):
+    app_repo.insert({**next(fake_developers(1)), 'email': 'anaperez@gmail.com'})
+
+    with appy.app.test_client() as client:
+        response = client.post('/submit', data=FORM)
+
+    assert response.status_code == 409
+    assert appy.email_index.contains('anaperez@gmail.com')
+
+
+def test_submit_updates_in_place(app_repo, monkeypatch):
+    monkeypatch.setattr(appy, 'DUPLICATE_REGISTRATION_MODE', 'update')
+    appy.email_index.load()
+
+    with appy.app.test_client() as client:
+        client.post('/submit', data=FORM)
+        response = client.post('/submit', data={**FORM, 'email': 'anaperez@gmail.com', 'skills': 'Rust'})
+
+    assert response.get_json()['updated'] is True
+    rows = app_repo.list_all()
+    assert len(rows) == 1 and rows[0]['skills'] == 'Rust'
+
+
+def test_delete_frees_the_email(app_repo):
+    appy.email_index.load()
+    with appy.app.test_client() as client:
+        client.post('/submit', data=FORM)
+        with client.session_transaction() as sess:
+            sess['admin_logged'] = True
+        client.post(f"/admin/delete/{app_repo.list_all()[0]['id']}")
+
+        assert client.post('/submit', data=FORM).status_code == 200
+
+
+def test_backfill_keeps_oldest_registration(repo):
+    rows = list(fake_developers(3))
+    rows[2]['email'] = 'DEV000000+otro@example.com'
+    # Simula una base anterior al índice: sin email_normalized
+    repo.db.execute("DROP INDEX developers_email_normalized_key")
+    repo.insert_many(rows)
+    repo.db.execute("UPDATE developers SET email_normalized = NULL")
+
+    result = backfill(repo, delete_duplicates=True, batch_size=2)
+
+    assert result['deleted'] == 1 and result['updated'] == 2
+    assert list(result['duplicates']) == ['dev000000@example.com']
+    assert {row['id'] for row in repo.list_all()} == {rows[0]['id'], rows[1]['id']}
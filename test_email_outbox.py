@@ -0,0 +1,152 @@
+import os
+import threading
+
+import pytest
+
+from email_outbox import EmailOutbox, OutboxFullError
+from email_spool import EmailSpool
+
+
+def make_outbox(handler, **kwargs):
+    outbox = EmailOutbox(**kwargs)
+    outbox.register('welcome', handler)
+    return outbox
+
+
+def test_enqueue_runs_job_in_background():
+    outbox = make_outbox(lambda **payload: True, workers=2, max_queue=10)
+    job_id = outbox.enqueue('welcome', user_email='dev@example.com')
+    assert outbox.wait_idle(timeout=5)
+
+    job = outbox.get_job(job_id)
+    assert job['status'] == 'sent'
+    assert job['latency_ms'] is not None
+    assert outbox.stats()['counters']['sent'] == 1
+
+
+def test_failed_job_records_error():
+    def boom(**payload):
+        raise RuntimeError('smtp caído')
+
+    outbox = make_outbox(boom, workers=1, max_queue=10)
+    job_id = outbox.enqueue('welcome')
+    assert outbox.wait_idle(timeout=5)
+
+    job = outbox.get_job(job_id)
+    assert job['status'] == 'failed'
+    assert 'smtp caído' in job['error']
+
+
+def test_full_queue_rejects_without_blocking():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_send(**payload):
+        started.set()
+        return release.wait(5)
+
+    outbox = make_outbox(slow_send, workers=1, max_queue=1)
+    outbox.enqueue('welcome')      # ocupa al worker
+    assert started.wait(5)
+    outbox.enqueue('welcome')      # llena la cola
+
+    with pytest.raises(OutboxFullError):
+        outbox.enqueue('welcome')
+    assert outbox.stats()['counters']['rejected'] == 1
+
+    release.set()
+    assert outbox.wait_idle(timeout=5)
+
+
+def test_spool_records_message_before_send(tmp_path):
+    spool = EmailSpool(str(tmp_path / 'spool.db'))
+    seen = []
+
+    def send(**payload):
+        # El mensaje ya está persistido cuando se intenta el envío
+        seen.append(spool.stats()['pending'])
+        return True
+
+    outbox = make_outbox(send, spool=spool)
+    job_id = outbox.enqueue('welcome', user_email='dev@example.com')
+    assert outbox.wait_idle(timeout=5)
+
+    assert seen == [1]
+    assert spool.get(job_id)['status'] == 'sent'
+
+
+def test_failed_send_is_retried_with_backoff(tmp_path):
+    spool = EmailSpool(str(tmp_path / 'spool.db'), max_attempts=3, base_delay=30)
+    outbox = make_outbox(lambda **payload: False, spool=spool)
+
+    job_id = outbox.enqueue('welcome', user_email='dev@example.com')
+    assert outbox.wait_idle(timeout=5)
+
+    record = spool.get(job_id)
+    assert record['status'] == 'pending'
+    assert record['attempts'] == 1
+    assert record['next_attempt_at'] > record['updated_at'] + 10
+    assert outbox.get_job(job_id)['status'] == 'retrying'
+    assert spool.claim_due() == []
+
+
+def test_dead_letters_can_be_replayed_and_purged(tmp_path):
+    spool = EmailSpool(str(tmp_path / 'spool.db'), max_attempts=1)
+    job_id = spool.add('welcome', {'user_email': 'dev@example.com'})
+    assert spool.mark_failed(job_id, 'SMTPAuthenticationError') == 'dead'
+
+    assert spool.replay_dead() == 1
+    claimed = spool.claim_due()
+    assert [r['id'] for r in claimed] == [job_id]
+    assert claimed[0]['payload'] == {'user_email': 'dev@example.com'}
+
+    spool.mark_failed(job_id, 'SMTPAuthenticationError')
+    assert spool.purge_dead([job_id]) == 1
+    assert spool.get(job_id) is None
+
+
+def test_spool_survives_restart(tmp_path):
+    path = str(tmp_path / 'spool.db')
+    job_id = EmailSpool(path).add('welcome', {'user_email': 'dev@example.com'})
+
+    restarted = EmailSpool(path, lease_seconds=0)
+    spool_record = restarted.get(job_id)
+    assert spool_record['status'] == 'pending'
+
+
+def test_start_sends_pending_mail_without_new_enqueues(tmp_path):
+    path = str(tmp_path / 'spool.db')
+    # Pendiente de un proceso anterior (su arriendo ya caducó)
+    job_id = EmailSpool(path, lease_seconds=0).add('welcome', {'user_email': 'dev@example.com'})
+
+    sent = threading.Event()
+    outbox = EmailOutbox(spool=EmailSpool(path, lease_seconds=0), poll_interval=0.05)
+    outbox.register('welcome', lambda **payload: sent.set() or True)
+    outbox.start()
+
+    assert sent.wait(5)
+    assert outbox.wait_idle(timeout=5)
+    assert outbox.spool.get(job_id)['status'] == 'sent'
+
+
+def test_app_starts_the_outbox_on_import():
+    from appy import email_outbox
+
+    assert email_outbox._started_pid == os.getpid()
+
+
+def test_email_status_endpoint(tmp_path, monkeypatch):
+    from appy import app, email_outbox
+
+    monkeypatch.setattr(email_outbox, 'spool', EmailSpool(str(tmp_path / 'spool.db')))
+    email_outbox.register('test', lambda **payload: True)
+    job_id = email_outbox.enqueue('test')
+    email_outbox.wait_idle(timeout=5)
+
+    with app.test_client() as client:
+        response = client.get(f'/email-status/{job_id}')
+        assert response.status_code == 200
+        assert response.get_json()['status'] == 'sent'
+
+        assert client.get('/email-status/no-existe').status_code == 404
+        assert 'queue_depth' in client.get('/email-outbox/stats').get_json()
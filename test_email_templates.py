@@ -0,0 +1,60 @@
+import email
+from email.header import decode_header, make_header
+
+from email_templates import CachedEmailTemplate, html_to_text
+
+
+def make_template(calls):
+    def render(**context):
+        calls.append(context)
+        return ('<html><head><title>Hola</title></head><body>'
+                f'<h2>¡Hola {context["user_name"]}!</h2>'
+                f'<p>Habilidades: {context["user_skills"]}</p></body></html>')
+
+    return CachedEmailTemplate('welcome', render, fields=('user_name', 'user_skills'),
+                               subject='Bienvenido, {user_name}')
+
+
+def parse(raw):
+    message = email.message_from_bytes(raw)
+    parts = {part.get_content_type(): part.get_payload(decode=True).decode('utf-8')
+             for part in message.walk() if not part.is_multipart()}
+    return message, parts
+
+
+def test_template_is_rendered_once():
+    calls = []
+    template = make_template(calls)
+    for i in range(3):
+        template.build('devpool@example.com', f'dev{i}@example.com', user_name=f'Dev {i}', user_skills='Rust')
+    assert len(calls) == 1
+
+
+def test_fields_are_escaped_in_html_but_not_in_text():
+    template = make_template([])
+    raw = template.build('devpool@example.com', 'dev@example.com',
+                         user_name='Ana <script>', user_skills='C & Go')
+    message, parts = parse(raw)
+
+    assert message.get_content_type() == 'multipart/alternative'
+    assert 'Ana &lt;script&gt;' in parts['text/html']
+    assert 'C &amp; Go' in parts['text/html']
+    assert '¡Hola Ana <script>!' in parts['text/plain']
+    assert parts['text/plain'].startswith('¡Hola')   # el <title> no aparece en el texto
+
+
+def test_headers_are_encoded_and_sanitized():
+    template = make_template([])
+    raw = template.build('devpool@example.com', 'dev@example.com',
+                         user_name='Núñez\r\nBcc: spam@example.com', user_skills='Rust')
+    message, _ = parse(raw)
+
+    assert message['Bcc'] is None
+    assert str(make_header(decode_header(message['Subject']))).startswith('Bienvenido, Núñez')
+    assert message['To'] == 'dev@example.com'
+    assert message['Message-ID']
+
+
+def test_html_to_text_drops_head_and_keeps_blocks():
+    text = html_to_text('<html><head><style>p {}</style></head><body><p>Uno</p><p>Dos</p></body></html>')
+    assert text == 'Uno\n\nDos\n'
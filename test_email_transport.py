@@ -0,0 +1,65 @@
+import mailbox
+import socket
+
+from email_transport import FileTransport, MemoryTransport, SMTPTransport, create_transport
+from local_smtp_server import LocalSMTPServer
+from smtp_pool import SMTPConnectionPool
+
+
+RAW = b"From: a@example.com\r\nTo: b@example.com\r\nSubject: Hola\r\n\r\nCuerpo\r\n"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_memory_transport_keeps_messages():
+    transport = MemoryTransport()
+    transport.send('a@example.com', ['b@example.com'], RAW)
+
+    assert transport.messages[0]['recipients'] == ['b@example.com']
+    assert transport.stats()['messages_sent'] == 1
+
+
+def test_file_transport_writes_mbox(tmp_path):
+    path = str(tmp_path / 'outbox.mbox')
+    transport = FileTransport(path)
+    transport.send('a@example.com', ['b@example.com'], RAW)
+    transport.send('a@example.com', ['c@example.com'], RAW)
+
+    messages = list(mailbox.mbox(path))
+    assert len(messages) == 2
+    assert messages[0]['Subject'] == 'Hola'
+
+
+def test_smtp_transport_against_local_server():
+    port = free_port()
+    server = LocalSMTPServer('127.0.0.1', port)
+    server.start_in_background()
+    try:
+        pool = SMTPConnectionPool('127.0.0.1', port, None, None, use_tls=False, max_connections=1)
+        transport = SMTPTransport(pool, require_auth=False)
+        assert transport.ready()
+        assert transport.check()
+
+        for _ in range(3):
+            transport.send('a@example.com', ['b@example.com'], RAW)
+
+        assert server.messages == 3
+        assert pool.stats()['opened'] == 1
+        pool.close_all()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_create_transport_rejects_unknown_kind():
+    assert isinstance(create_transport('memory'), MemoryTransport)
+    try:
+        create_transport('carrier-pigeon')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Se esperaba ValueError")
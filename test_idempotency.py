@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+import appy
+from email_identity import EmailIndex
+from idempotency import IN_PROGRESS, MISMATCH, NEW, REPLAY, IdempotencyStore
+from repository import create_repositories
+
+
+FORM = {'name': 'Ana Pérez', 'email': 'ana@example.com', 'skills': 'Solidity', 'experience_years': '4'}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return IdempotencyStore(str(tmp_path / 'idempotency.db'), wait_timeout=2, poll_interval=0.01)
+
+
+@pytest.fixture
+def app_repo(tmp_path, monkeypatch):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    monkeypatch.setattr(appy, 'developer_repo', developer_repo)
+    monkeypatch.setattr(appy, 'email_index', EmailIndex(name='test'))
+    monkeypatch.setattr(appy, 'idempotency_store', IdempotencyStore(str(tmp_path / 'idempotency.db')))
+    # Como REGISTRATION_WRITE_BEHIND=false: inserción directa, los errores de la BD llegan a la respuesta
+    monkeypatch.setattr(appy, 'registration_batcher', None)
+    enqueued = []
+    monkeypatch.setattr(appy.email_outbox, 'enqueue', lambda kind, **kwargs: enqueued.append(kind) or 'job')
+    monkeypatch.setattr(appy.admin_digest, 'add', lambda developer: None)
+    appy.app.config['TESTING'] = True
+    return developer_repo, enqueued
+
+
+def test_store_replays_completed_response(store):
+    assert store.begin('k', 'f') == (NEW, None)
+    store.complete('k', 200, '{"ok": true}')
+
+    assert store.begin('k', 'f') == (REPLAY, (200, '{"ok": true}', 'application/json'))
+    assert store.begin('k', 'otra') == (MISMATCH, None)
+
+
+def test_released_key_can_be_retried(store):
+    store.begin('k', 'f')
+    store.release('k')
+    assert store.begin('k', 'f')[0] == NEW
+
+
+def test_abandoned_lease_is_taken_over(tmp_path):
+    store = IdempotencyStore(str(tmp_path / 'idempotency.db'), lease_seconds=0, wait_timeout=0)
+    store.begin('k', 'f')
+    time.sleep(0.01)
+    assert store.begin('k', 'f')[0] == NEW
+
+
+def test_duplicate_waits_for_other_worker(store, tmp_path):
+    other_worker = IdempotencyStore(store.path, wait_timeout=2, poll_interval=0.01)
+    store.begin('k', 'f')
+    threading.Timer(0.1, store.complete, args=('k', 201, 'hecho')).start()
+
+    assert other_worker.begin('k', 'f') == (REPLAY, (201, 'hecho', 'application/json'))
+
+
+def test_duplicate_gives_up_after_wait_timeout(tmp_path):
+    store = IdempotencyStore(str(tmp_path / 'idempotency.db'), wait_timeout=0.05)
+    store.begin('k', 'f')
+    assert store.begin('k', 'f') == (IN_PROGRESS, None)
+
+
+def test_purge_keeps_store_bounded(tmp_path):
+    store = IdempotencyStore(str(tmp_path / 'idempotency.db'), max_entries=3, purge_every=1000)
+    for i in range(5):
+        store.begin(f"k{i}", 'f')
+        store.complete(f"k{i}", 200, 'ok')
+
+    assert store.purge() == 2
+    assert store.stats()['entries'] == 3
+    assert store.begin('k4', 'f')[0] == REPLAY
+
+
+def test_submit_replays_without_touching_database_or_email(app_repo, monkeypatch):
+    developer_repo, enqueued = app_repo
+    headers = {'Idempotency-Key': 'registro-1'}
+
+    with appy.app.test_client() as client:
+        first = client.post('/submit', data=FORM, headers=headers)
+        monkeypatch.setattr(developer_repo, 'insert', lambda *a: pytest.fail('no debe insertar otra vez'))
+        second = client.post('/submit', data=FORM, headers=headers)
+        mismatch = client.post('/submit', data={**FORM, 'name': 'Otra'}, headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert second.headers['Idempotent-Replayed'] == 'true'
+    assert mismatch.status_code == 422
+    assert enqueued == ['welcome']
+
+
+def test_concurrent_submits_are_coalesced(app_repo, monkeypatch):
+    developer_repo, enqueued = app_repo
+    insert = developer_repo.insert
+
+    def slow_insert(developer):
+        time.sleep(0.2)
+        return insert(developer)
+
+    monkeypatch.setattr(developer_repo, 'insert', slow_insert)
+    results = []
+
+    def post():
+        with appy.app.test_client() as client:
+            results.append(client.post('/submit', data={**FORM, 'idempotency_key': 'doble-clic'}).status_code)
+
+    threads = [threading.Thread(target=post) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [200] * 4
+    assert developer_repo.count() == 1
+    assert enqueued == ['welcome']
+
+
+def test_server_errors_are_not_stored(app_repo, monkeypatch):
+    developer_repo, _ = app_repo
+    insert = developer_repo.insert
+    monkeypatch.setattr(developer_repo, 'insert', lambda developer: (_ for _ in ()).throw(RuntimeError('caída')))
+
+    with appy.app.test_client() as client:
+        assert client.post('/submit', data=FORM, headers={'Idempotency-Key': 'k'}).status_code == 500
+        monkeypatch.setattr(developer_repo, 'insert', insert)
+        assert client.post('/submit', data=FORM, headers={'Idempotency-Key': 'k'}).status_code == 200
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from developer_pages import row_matches
+from query_cache import QueryCache
+
+
+def test_read_through_hits_after_first_load():
+    cache = QueryCache()
+    calls = []
+    load = lambda: calls.append(1) or [{'id': 'a'}]
+
+    assert cache.get_or_load(('page', (), None, 30), load) == [{'id': 'a'}]
+    assert cache.get_or_load(('page', (), None, 30), load) == [{'id': 'a'}]
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_tag_invalidation_only_drops_tagged_entries():
+    cache = QueryCache()
+    cache.set('p1', ['a', 'b'], tags=['dev:a', 'dev:b'])
+    cache.set('p2', ['c'], tags=['dev:c'])
+
+    assert cache.invalidate_tag('dev:b') == 1
+    assert cache.get('p1') == (False, None)
+    assert cache.get('p2') == (True, ['c'])
+
+
+def test_insert_invalidates_matching_first_pages_only():
+    cache = QueryCache()
+    cache.set(('page', (('location', 'Toledo'),), None, 30), [])
+    cache.set(('page', (('location', 'Cuenca'),), None, 30), [])
+    cache.set(('page', (('location', 'Toledo'),), 'cursor', 30), [])
+
+    new_dev = {'id': 'x', 'location': 'Toledo', 'skills': 'Python', 'experience_years': 3}
+    removed = cache.invalidate_where(
+        lambda key: key[0] == 'page' and key[2] is None and row_matches(dict(key[1]), new_dev)
+    )
+
+    assert removed == 1
+    assert cache.stats()['entries'] == 2
+
+
+def test_writer_bypasses_entries_older_than_its_write():
+    cache = QueryCache()
+    cache.set('p1', ['viejo'])
+    written_at = time.time() + 0.001
+
+    assert cache.get('p1', min_time=written_at) == (False, None)
+    assert cache.get_or_load('p1', lambda: ['nuevo'], min_time=written_at) == ['nuevo']
+    assert cache.get('p1') == (True, ['nuevo'])
+
+
+def test_result_read_during_a_write_is_not_cached():
+    cache = QueryCache()
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_load():
+        loading.set()
+        release.wait(1)
+        return ['antes de borrar']
+
+    thread = threading.Thread(target=cache.get_or_load, args=('p1', slow_load))
+    thread.start()
+    loading.wait(1)
+    cache.invalidate_tag('dev:a')
+    release.set()
+    thread.join()
+
+    assert cache.get('p1') == (False, None)
+    assert cache.stats()['discarded'] == 1
+
+
+def test_memory_bound_evicts_least_recently_used():
+    cache = QueryCache(max_entries=100, max_bytes=400)
+    for i in range(10):
+        cache.set(i, 'x' * 50)
+        cache.get(0)
+
+    stats = cache.stats()
+    assert stats['bytes'] <= 400
+    assert stats['evictions'] > 0
+    assert cache.get(0)[0]
+    assert not cache.get(1)[0]
+
+
+def test_expired_entries_are_reloaded():
+    cache = QueryCache(ttl=0)
+    cache.set('p1', [1], stored_at=time.time() - 1)
+    assert cache.get('p1') == (False, None)
+    assert cache.stats()['expired'] == 1
@@ -0,0 +1,182 @@
+import threading
+import time
+
+import pytest
+
+import appy
+from email_identity import EmailIndex
+from registration_batcher import INSERTED, QUEUED, RegistrationBatcher, RegistrationJournal
+from repository import create_repositories
+from seed_local_db import fake_developers
+
+
+@pytest.fixture
+def repo(tmp_path):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    return developer_repo
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return RegistrationJournal(str(tmp_path / 'journal.db'), stale_after=60)
+
+
+def test_concurrent_submits_are_coalesced_into_batches(repo, journal):
+    calls = []
+
+    def upsert_many(rows):
+        calls.append(len(rows))
+        return repo.upsert_many(rows)
+
+    batcher = RegistrationBatcher(journal, upsert_many, on_inserted=lambda dev: dev['email'],
+                                  batch_size=20, flush_interval=0.5, max_ack_delay=5)
+    devs = list(fake_developers(40))
+    results = [None] * len(devs)
+
+    def submit(i):
+        results[i] = batcher.submit(devs[i])
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(len(devs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [(INSERTED, dev['email']) for dev in devs]
+    assert sum(calls) == 40 and len(calls) <= 4
+    assert repo.count() == 40
+    assert journal.stats()['pending'] == 0
+
+
+def test_duplicate_email_falls_back_to_row_by_row(repo, journal):
+    devs = list(fake_developers(3))
+    repo.insert(devs[1])
+    clash = {**devs[2], 'id': 'otro-id'}
+    repo.insert(clash)
+
+    batcher = RegistrationBatcher(journal, repo.upsert_many, batch_size=10)
+    for dev in devs:
+        batcher._buffer.append(dev)
+    batcher._write(batcher._take_batch())
+
+    assert repo.count() == 3
+    assert journal.stats()['pending'] == 0
+    assert batcher.stats()['duplicates'] == 1
+
+
+def test_failed_batch_stays_in_journal_until_adopted(repo, tmp_path):
+    journal = RegistrationJournal(str(tmp_path / 'journal.db'), stale_after=0)
+    failing = {'on': True}
+
+    def upsert_many(rows):
+        if failing['on']:
+            raise ConnectionError('supabase caído')
+        return repo.upsert_many(rows)
+
+    batcher = RegistrationBatcher(journal, upsert_many, batch_size=5, flush_interval=0.01,
+                                  max_ack_delay=2, retry_delay=0.05)
+    dev = next(fake_developers(1))
+    assert batcher.submit(dev) == (QUEUED, None)
+    assert journal.stats()['pending'] == 1
+
+    # Al volver la base de datos, el hilo recoge el registro del diario
+    failing['on'] = False
+    deadline = time.monotonic() + 5
+    while journal.stats()['pending'] and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert repo.count() == 1
+    assert journal.stats()['pending'] == 0
+
+
+def test_full_buffer_and_async_acks_only_touch_the_journal(repo, journal):
+    batcher = RegistrationBatcher(journal, repo.upsert_many, max_ack_delay=0, max_pending=1)
+    batcher._ensure_started = lambda: None   # sin hilo: el test escribe los lotes
+    first, overflow = fake_developers(2)
+
+    assert batcher.submit(first) == (QUEUED, None)
+    assert batcher.submit(overflow) == (QUEUED, None)
+    assert journal.stats()['pending'] == 2 and batcher.stats()['overflow'] == 1
+
+    batcher.flush()
+    # La que no cupo en el búfer está disponible para la siguiente revisión del diario
+    assert batcher.replay() == 1
+    assert repo.count() == 2 and journal.stats()['pending'] == 0
+
+
+def test_replay_skips_rows_already_in_the_database_but_runs_their_effects(repo, journal):
+    devs = list(fake_developers(3))
+    inserted, upserted = [], []
+    # Caída (o respuesta perdida) entre el INSERT y el borrado del diario: la fila ya está en la BD
+    repo.insert(devs[0])
+    for dev in devs:
+        journal.append(dev, claimed=False)
+
+    def upsert_many(rows):
+        upserted.extend(row['id'] for row in rows)
+        return repo.upsert_many(rows)
+
+    batcher = RegistrationBatcher(journal, upsert_many, existing_ids=repo.existing_ids,
+                                  on_inserted=lambda dev: inserted.append(dev['id']))
+    assert batcher.replay() == 3
+    assert upserted == [devs[1]['id'], devs[2]['id']]
+    # Sus emails y el contador no se llegaron a ejecutar: el replay los completa
+    assert inserted == [dev['id'] for dev in devs]
+    assert batcher.stats()['deduplicated'] == 1 and batcher.stats()['inserted'] == 2
+    assert repo.count() == 3 and journal.stats()['pending'] == 0
+
+
+def test_buffered_rows_are_not_adopted_while_draining_slowly(repo, journal):
+    inserted = []
+    batcher = RegistrationBatcher(journal, repo.upsert_many, existing_ids=repo.existing_ids,
+                                  on_inserted=lambda dev: inserted.append(dev['id']), max_ack_delay=0)
+    batcher._ensure_started = lambda: None   # sin hilo: el test escribe los lotes
+    devs = list(fake_developers(3))
+    for dev in devs:
+        batcher.submit(dev)
+
+    # El búfer lleva más de stale_after sin vaciarse (ráfaga o BD lenta)
+    journal._connection().execute("UPDATE registration_journal SET claimed_at = claimed_at - 120")
+    batcher._refresh_claims()
+    assert batcher.replay() == 0
+
+    batcher.flush()
+    assert sorted(inserted) == sorted(dev['id'] for dev in devs)
+    assert repo.count() == 3 and journal.stats()['pending'] == 0
+
+
+def test_failed_batches_back_off_exponentially(journal):
+    def down(rows):
+        raise ConnectionError('supabase caído')
+
+    batcher = RegistrationBatcher(journal, down, retry_delay=5, max_retry_delay=12)
+    dev = next(fake_developers(1))
+    journal.append(dev, claimed=False)
+
+    waits = []
+    for _ in range(3):
+        assert batcher.replay(include_claimed=True) == 1
+        waits.append(journal.entries()[0]['retry_in_seconds'])
+    assert [round(wait) for wait in waits] == [5, 10, 12]
+    assert journal.entries()[0]['attempts'] == 3
+
+
+def test_submit_endpoint_in_write_behind_mode(repo, journal, monkeypatch):
+    enqueued = []
+    monkeypatch.setattr(appy, 'developer_repo', repo)
+    monkeypatch.setattr(appy, 'email_index', EmailIndex(name='test'))
+    monkeypatch.setattr(appy.email_outbox, 'enqueue', lambda kind, **kwargs: enqueued.append(kwargs) or 'job-1')
+    monkeypatch.setattr(appy.admin_digest, 'add', lambda developer: None)
+    batcher = RegistrationBatcher(journal, lambda rows: appy.developer_repo.upsert_many(rows),
+                                  on_inserted=appy.developer_registered, flush_interval=0.01)
+    monkeypatch.setattr(appy, 'registration_batcher', batcher)
+    appy.app.config['TESTING'] = True
+
+    form = {'name': 'Ana', 'email': 'ana@example.com', 'skills': 'Solidity', 'experience_years': '3'}
+    with appy.app.test_client() as client:
+        first = client.post('/submit', data=form)
+        second = client.post('/submit', data={**form, 'email': 'ANA@example.com'})
+
+    assert first.status_code == 200
+    assert second.status_code == 409
+    assert repo.count() == 1
+    assert len(enqueued) == 1
@@ -0,0 +1,89 @@
+import pytest
+
+from repository import SupabaseDeveloperRepository, create_repositories, with_derived_fields
+from seed_local_db import fake_developers
+from test_developer_pages import FakeTable
+
+
+@pytest.fixture
+def repos(tmp_path):
+    return create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+
+
+def walk(repo, filters):
+    seen, cursor = [], None
+    while True:
+        rows, cursor = repo.page(filters, cursor, 7)
+        seen.extend(row['id'] for row in rows)
+        if not cursor:
+            return seen
+
+
+def test_insert_get_count_and_delete(repos):
+    developer_repo, _ = repos
+    dev = next(fake_developers(1))
+    assert developer_repo.insert(dev)['email'] == dev['email']
+    assert developer_repo.count() == 1
+    assert developer_repo.get(dev['id'], 'name, email') == {'name': dev['name'], 'email': dev['email']}
+
+    assert developer_repo.delete(dev['id'])['id'] == dev['id']
+    assert developer_repo.delete(dev['id']) is None
+    assert developer_repo.count() == 0
+
+
+def test_bulk_operations(repos):
+    developer_repo, _ = repos
+    devs = list(fake_developers(50))
+    developer_repo.insert_many(devs)
+
+    deleted = developer_repo.delete_many([d['id'] for d in devs[:10]] + ['no-existe'])
+    assert len(deleted) == 10
+    assert developer_repo.count() == 40
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'location': 'toledo'},
+    {'skill': 'rust', 'min_experience': 2},
+    {'skill': 'js'},
+    {'max_experience': 1, 'location': 'a'},
+])
+def test_sqlite_pages_match_supabase_semantics(repos, filters):
+    developer_repo, _ = repos
+    devs = list(fake_developers(120))
+    # Fechas repetidas: el desempate por id debe coincidir en ambos backends
+    for i, dev in enumerate(devs):
+        dev['created_at'] = devs[i - i % 4]['created_at']
+    developer_repo.insert_many(devs)
+
+    supabase_repo = SupabaseDeveloperRepository(FakeTable([with_derived_fields(dev) for dev in devs]))
+    assert walk(developer_repo, filters) == walk(supabase_repo, filters)
+
+
+def test_page_by_id_walks_in_id_order(repos):
+    developer_repo, _ = repos
+    devs = list(fake_developers(25))
+    developer_repo.insert_many(devs)
+
+    seen, after_id = [], None
+    while True:
+        page = developer_repo.page_by_id(after_id, 10)
+        if not page:
+            break
+        seen.extend(row['id'] for row in page)
+        after_id = page[-1]['id']
+    assert seen == sorted(d['id'] for d in devs)
+
+
+def test_unknown_columns_are_rejected(repos):
+    developer_repo, _ = repos
+    with pytest.raises(ValueError):
+        developer_repo.get('x', 'id; DROP TABLE developers')
+
+
+def test_admin_set_password(repos):
+    _, admin_repo = repos
+    assert admin_repo.get_by_username('admin') is None
+    assert admin_repo.set_password('admin', 'hash-1') == 'created'
+    assert admin_repo.set_password('admin', 'hash-2') == 'updated'
+    assert admin_repo.get_by_username('admin', 'hashed_password') == {'hashed_password': 'hash-2'}
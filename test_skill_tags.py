@@ -0,0 +1,65 @@
+import pytest
+
+import appy
+from backfill_skill_tags import backfill
+from developer_import import validate_developer
+from email_identity import EmailIndex
+from repository import create_repositories
+from seed_local_db import fake_developers
+from skill_tags import canonical_skill, normalize_skills
+
+
+@pytest.fixture
+def repo(tmp_path):
+    developer_repo, _ = create_repositories('sqlite', sqlite_path=str(tmp_path / 'devpool.db'))
+    return developer_repo
+
+
+def test_normalize_skills():
+    assert normalize_skills('Python, solidity,  Rust/Go') == ['Python', 'Solidity', 'Rust', 'Go']
+    assert normalize_skills('js; JavaScript | sol\nnodejs') == ['JavaScript', 'Solidity', 'Node.js']
+    assert normalize_skills('  Zero-Knowledge , ZK Rollups,, ') == ['Zero Knowledge', 'zk rollups']
+    assert normalize_skills('') == [] and normalize_skills(None) == []
+    assert canonical_skill(' Golang ') == 'Go'
+
+
+def test_tags_are_stored_as_lists(repo):
+    dev = {**next(fake_developers(1)), 'skills': 'py, ReactJS'}
+    repo.insert(dev)
+
+    assert repo.get(dev['id'], 'skills, skill_tags') == {'skills': 'py, ReactJS', 'skill_tags': ['Python', 'React']}
+    repo.update_by_email(dev['email'], {'skill_tags': ['Rust']})
+    assert repo.get(dev['id'], 'skill_tags') == {'skill_tags': ['Rust']}
+
+
+def test_submit_and_import_store_tags(repo, monkeypatch):
+    monkeypatch.setattr(appy, 'developer_repo', repo)
+    monkeypatch.setattr(appy, 'email_index', EmailIndex(name='test'))
+    monkeypatch.setattr(appy.email_outbox, 'enqueue', lambda kind, **kwargs: 'job')
+    monkeypatch.setattr(appy.admin_digest, 'add', lambda developer: None)
+    appy.app.config['TESTING'] = True
+
+    with appy.app.test_client() as client:
+        response = client.post('/submit', data={'name': 'Ana', 'email': 'ana@example.com',
+                                                'skills': 'Solidity / TS', 'experience_years': '3'})
+    assert response.status_code == 200
+    assert repo.find_by_emails(['ana@example.com'])[0]['skill_tags'] == ['Solidity', 'TypeScript']
+
+    row, _ = validate_developer({'name': 'Bea', 'email': 'bea@example.com', 'skills': 'golang, k8s',
+                                 'experience_years': 2})
+    assert row['skill_tags'] == ['Go', 'Kubernetes']
+
+
+def test_backfill_fills_rows_without_tags(repo):
+    devs = list(fake_developers(25))
+    repo.insert_many(devs)
+    # Filas de antes de la columna (o con la tabla de sinónimos anterior)
+    repo.db.execute("UPDATE developers SET skill_tags = NULL WHERE rowid % 2 = 0")
+
+    assert backfill(repo, dry_run=True, batch_size=10)['updated'] == 12
+    result = backfill(repo, batch_size=10)
+    assert result['scanned'] == 25 and result['updated'] == 12
+    assert backfill(repo, batch_size=10)['updated'] == 0
+
+    assert repo.page({'skill': 'node'})[0]
+    assert all(row['skill_tags'] == normalize_skills(row['skills']) for row in repo.list_all('skills, skill_tags'))
@@ -0,0 +1,105 @@
+import smtplib
+import threading
+import time
+
+import pytest
+
+import smtp_pool
+from smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """Servidor SMTP simulado que cuenta conexiones y mensajes"""
+    instances = []
+    lock = threading.Lock()
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.logged_in = False
+        self.closed = False
+        self.fail_next_send = False
+        with FakeSMTP.lock:
+            FakeSMTP.instances.append(self)
+
+    def starttls(self, context=None):
+        pass
+
+    def login(self, user, password):
+        self.logged_in = True
+
+    def noop(self):
+        if self.closed:
+            raise smtplib.SMTPServerDisconnected('conexión cerrada')
+        return 250, b'OK'
+
+    def send_message(self, message):
+        if self.fail_next_send:
+            self.fail_next_send = False
+            self.closed = True
+            raise smtplib.SMTPServerDisconnected('conexión cerrada')
+        self.sent.append(message)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtp_pool.smtplib, 'SMTP', FakeSMTP)
+    return SMTPConnectionPool('smtp.test', 2525, 'user', 'secret', max_connections=2)
+
+
+def test_sessions_are_reused(pool):
+    for _ in range(5):
+        pool.send_message('mensaje')
+
+    assert len(FakeSMTP.instances) == 1
+    assert len(FakeSMTP.instances[0].sent) == 5
+    stats = pool.stats()
+    assert stats['opened'] == 1
+    assert stats['reused'] == 4
+
+
+def test_reconnects_after_disconnect(pool):
+    pool.send_message('primero')
+    FakeSMTP.instances[0].fail_next_send = True
+
+    pool.send_message('segundo')
+
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[1].sent == ['segundo']
+
+
+def test_stale_session_checked_with_noop(pool):
+    pool.noop_interval = 0
+    pool.send_message('primero')
+    FakeSMTP.instances[0].closed = True
+
+    pool.send_message('segundo')
+
+    assert pool.stats()['noop_failures'] == 1
+    assert len(FakeSMTP.instances) == 2
+
+
+def test_concurrent_sessions_are_capped(pool):
+    barrier = threading.Barrier(4)
+    peak = []
+
+    def worker():
+        barrier.wait()
+        with pool.connection():
+            peak.append(pool.stats()['in_use'])
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(peak) <= 2
+    assert len(FakeSMTP.instances) <= 2
@@ -0,0 +1,82 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from supabase_http import SupabaseHTTPTransport, TunedPostgrestClient
+
+
+class FakePostgREST(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if 'slow' in self.path:
+            time.sleep(0.5)
+        self._reply([{'id': '1', 'name': 'Dev'}])
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        row = json.loads(self.rfile.read(length) or b'{}')
+        self._reply(row if isinstance(row, list) else [row])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakePostgREST)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/rest/v1"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_client(base_url, **kwargs):
+    transport = SupabaseHTTPTransport(**kwargs)
+    client = TunedPostgrestClient(base_url, headers={'apikey': 'test'}, timeout=5, transport=transport)
+    return client, transport
+
+
+def test_connections_are_kept_alive_and_reused(server):
+    client, transport = make_client(server)
+    for _ in range(5):
+        assert client.from_('developers').select('id, name').execute().data[0]['name'] == 'Dev'
+    client.from_('developers').insert({'id': '2', 'name': 'Nuevo'}).execute()
+
+    stats = transport.stats()
+    assert stats['requests'] == 6
+    assert stats['opened'] == 1
+    assert stats['reused'] == 5
+    assert stats['idle'] == 1
+    assert stats['in_use'] == 0
+
+
+def test_reads_use_the_read_timeout(server):
+    client, transport = make_client(server, read_timeout=0.1, write_timeout=5)
+    with pytest.raises(httpx.ReadTimeout):
+        client.from_('slow').select('*').execute()
+    assert transport.stats()['timeouts'] == 1
+
+
+def test_pool_is_recreated_after_fork(server):
+    client, transport = make_client(server)
+    client.from_('developers').select('*').execute()
+    transport._pid = -1  # simula el proceso hijo de un fork
+
+    client.from_('developers').select('*').execute()
+    stats = transport.stats()
+    assert stats['forks'] == 1
+    assert stats['opened'] == 2